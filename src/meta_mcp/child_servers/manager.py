@@ -3,6 +3,7 @@
 import asyncio
 import os
 import shutil
+import time
 from typing import Any
 
 from ..config.models import ChildServerConfig, MetaMCPConfig, Tool
@@ -96,7 +97,7 @@ class ChildServerManager:
                 "config": server_config,
                 "process": process,
                 "status": "running",
-                "start_time": asyncio.get_event_loop().time(),
+                "start_time": time.monotonic(),
             }
             self.clients[server_config.name] = client
 
@@ -237,7 +238,7 @@ class ChildServerManager:
                 "pid": process.pid if process else None,
                 "tools_count": len(client.tools) if client else 0,
                 "uptime": (
-                    asyncio.get_event_loop().time() - server_info.get("start_time", 0)
+                    time.monotonic() - server_info.get("start_time", 0)
                     if server_info["status"] == "running"
                     else 0
                 ),
@@ -1,5 +1,6 @@
 """Configuration loader for Meta MCP Server."""
 
+import functools
 import json
 import logging
 import os
@@ -12,6 +13,9 @@ from .models import ChildServerConfig, MetaMCPConfig
 
 logger = logging.getLogger(__name__)
 
+# libyaml's loader when PyYAML was built with it, the pure-Python one otherwise
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def expand_env_vars(obj: Any) -> Any:
     """Recursively expand environment variables in configuration values."""
@@ -25,6 +29,25 @@ def expand_env_vars(obj: Any) -> Any:
         return obj
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, reusing the result until the file changes.
+
+    The modification time and size are only part of the cache key, so that
+    an edited file is parsed again. Callers must not mutate the result.
+
+    Args:
+        path: Resolved path of the YAML file.
+        mtime_ns: Modification time of the file in nanoseconds.
+        size: Size of the file in bytes.
+
+    Returns:
+        Parsed YAML document.
+    """
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+
 def load_mcp_servers_from_json(json_path: str) -> list[ChildServerConfig]:
     """Load MCP servers from Claude Desktop JSON configuration.
 
@@ -122,8 +145,11 @@ def load_config(
     logger.info(f"Loading configuration from: {config_path}")
 
     try:
-        with open(config_path, encoding="utf-8") as f:
-            raw_config = yaml.safe_load(f)
+        config_file = Path(config_path)
+        stat = config_file.stat()
+        raw_config = _parse_yaml_file(
+            str(config_file.resolve()), stat.st_mtime_ns, stat.st_size
+        )
 
         if raw_config is None:
             raw_config = {}
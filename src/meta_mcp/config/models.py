@@ -1,6 +1,6 @@
 """Configuration models using Pydantic."""
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -32,6 +32,9 @@ class EmbeddingConfig(BaseModel):
         "all-MiniLM-L6-v2", description="Local fallback embedding model"
     )
     batch_size: int = Field(32, description="Batch size for embedding generation")
+    batch_wait_ms: float = Field(
+        5.0, description="Time to wait for concurrent query embeddings to batch"
+    )
     cache_dir: str = Field(
         "./embedding-models", description="Directory to cache models"
     )
@@ -45,6 +48,14 @@ class VectorStoreConfig(BaseModel):
     port: int = Field(6333, description="Vector store port")
     collection_prefix: str = Field("meta_mcp", description="Collection name prefix")
     url: str | None = Field(None, description="Full URL (overrides host:port)")
+    grpc_port: int = Field(6334, description="Vector store gRPC port")
+    prefer_grpc: bool = Field(
+        False, description="Use gRPC instead of REST (needs the gRPC port published)"
+    )
+    timeout: int = Field(30, description="Request timeout in seconds")
+    max_connections: int = Field(
+        64, description="Maximum pooled REST connections to the vector store"
+    )
 
 
 class LLMConfig(BaseModel):
@@ -76,6 +87,23 @@ class StrategyConfig(BaseModel):
     fallback: str = Field("vector", description="Fallback routing strategy")
     vector_threshold: float = Field(0.4, description="Vector similarity threshold")
     max_tools: int = Field(10, description="Maximum tools to return")
+    query_cache_size: int = Field(
+        2048, description="Maximum cached query embeddings (0 disables)"
+    )
+    local_knn_max_tools: int = Field(
+        10000,
+        description="Search catalogs up to this size in memory instead of Qdrant",
+    )
+    local_matrix_dtype: Literal["float32", "float16"] = Field(
+        "float32",
+        description="Storage dtype of the in-memory tool embeddings (float32, float16)",
+    )
+    # Hedging trades result quality for latency: a slow LLM or RAG primary
+    # loses to a faster vector fallback, so it is off unless configured
+    hedge_ms: float = Field(
+        0.0,
+        description="Start the fallback strategy if the primary is slower (0 disables)",
+    )
 
 
 class WebUIConfig(BaseModel):
@@ -87,6 +115,16 @@ class WebUIConfig(BaseModel):
     auth_enabled: bool = Field(False, description="Enable authentication")
     username: str | None = Field(None, description="Auth username")
     password: str | None = Field(None, description="Auth password")
+    cache_ttl: float = Field(
+        2.0,
+        description="Seconds polled API responses are reused for (0 disables)",
+    )
+    max_ws_connections: int = Field(
+        100, description="Maximum concurrent log WebSocket connections"
+    )
+    ws_send_timeout: float = Field(
+        5.0, description="Seconds a WebSocket send may take before it is dropped"
+    )
 
 
 class LoggingConfig(BaseModel):
@@ -105,6 +143,12 @@ class ServerConfig(BaseModel):
     name: str = Field("meta-mcp-server", description="Server name")
     port: int = Field(3456, description="Server port")
     host: str = Field("localhost", description="Server host")
+    max_p95_latency_ms: float = Field(
+        0.0, description="Reject requests above this P95 latency (0 disables)"
+    )
+    max_queue_drain_ms: float = Field(
+        0.0, description="Reject requests above this queue drain time (0 disables)"
+    )
 
 
 class MetaMCPConfig(BaseModel):
@@ -173,6 +217,9 @@ class MetricsData(BaseModel):
     active_connections: int = Field(0, description="Active client connections")
     total_requests: int = Field(0, description="Total requests handled")
     avg_response_time: float = Field(0.0, description="Average response time (ms)")
+    p95_response_time: float = Field(
+        0.0, description="95th percentile response time (ms)"
+    )
     tool_usage: dict[str, int] = Field(
         default_factory=dict, description="Tool usage statistics"
     )
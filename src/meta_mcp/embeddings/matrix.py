@@ -0,0 +1,92 @@
+"""Contiguous in-memory storage for tool embeddings."""
+
+from typing import Literal
+
+import numpy as np
+
+from ..config.models import Tool
+
+# Rows upcast at a time when scoring a reduced-precision matrix, small enough
+# for the float32 copy to stay in cache
+SCORE_CHUNK_ROWS = 4096
+
+
+class EmbeddingMatrix:
+    """Tool embeddings stored as one float32 matrix with parallel tool IDs.
+
+    Row ``i`` of ``matrix`` is the embedding of ``ids[i]``, so scoring a query
+    against every tool is a single matrix-vector product.
+    The matrix may be stored as float16 to halve its memory footprint; it is
+    then upcast in cache-sized chunks while scoring, since NumPy has no
+    float16 BLAS kernels.
+    """
+
+    def __init__(self, ids: list[str] | None = None, matrix: np.ndarray | None = None):
+        self.ids = ids or []
+        self.matrix = (
+            matrix if matrix is not None else np.empty((0, 0), dtype=np.float32)
+        )
+
+    @classmethod
+    def from_tools(
+        cls, tools: list[Tool], dtype: Literal["float32", "float16"] = "float32"
+    ) -> "EmbeddingMatrix":
+        """Stack the embeddings of all embedded tools.
+
+        Args:
+            tools: Tools to include; tools without embeddings are skipped.
+            dtype: Storage dtype, ``float32`` or ``float16``.
+
+        Returns:
+            Embedding matrix for the embedded tools.
+        """
+        embedded = [tool for tool in tools if tool.embedding]
+        if not embedded:
+            return cls()
+
+        matrix = np.asarray(
+            [tool.embedding for tool in embedded], dtype=np.dtype(dtype)
+        )
+        return cls([tool.id for tool in embedded], matrix)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def scores(self, query_vector: list[float]) -> np.ndarray:
+        """Score a query against every row.
+
+        Args:
+            query_vector: Query embedding (unit length for cosine scores).
+
+        Returns:
+            Dot-product scores in row order.
+        """
+        query = np.asarray(query_vector, dtype=np.float32)
+        matrix = self.matrix
+        if matrix.dtype == np.float32:
+            return matrix @ query
+
+        scores = np.empty(len(matrix), dtype=np.float32)
+        for start in range(0, len(matrix), SCORE_CHUNK_ROWS):
+            chunk = matrix[start : start + SCORE_CHUNK_ROWS]
+            scores[start : start + len(chunk)] = chunk.astype(np.float32) @ query
+        return scores
+
+    def top_k(self, query_vector: list[float], k: int) -> list[tuple[str, float]]:
+        """Find the highest scoring tools for a query.
+
+        Args:
+            query_vector: Query embedding.
+            k: Maximum number of results.
+
+        Returns:
+            List of (tool_id, score) tuples, highest score first.
+        """
+        if not self.ids or k <= 0:
+            return []
+
+        scores = self.scores(query_vector)
+        k = min(k, len(scores))
+        top_rows = np.argpartition(-scores, k - 1)[:k]
+        top_rows = top_rows[np.argsort(-scores[top_rows])]
+        return [(self.ids[row], float(scores[row])) for row in top_rows]
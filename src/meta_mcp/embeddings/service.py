@@ -3,15 +3,36 @@
 import asyncio
 import hashlib
 import pickle
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import httpx
+import numpy as np
 
 from ..config.models import MetaMCPConfig
 from ..utils.logging import get_logger
 
 
+def normalize_embedding(embedding: list[float]) -> list[float]:
+    """Scale an embedding to unit length.
+
+    Dot product on unit vectors equals cosine similarity, so normalized
+    vectors can be searched with the cheaper dot-product distance.
+
+    Args:
+        embedding: Embedding vector.
+
+    Returns:
+        Unit-length embedding vector (zero vectors are returned unchanged).
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector.tolist()
+
+
 class EmbeddingService:
     """Unified embedding service with multiple backends."""
 
@@ -24,6 +45,13 @@ class EmbeddingService:
         self._cache_dir = Path(self.config.cache_dir)
         self._cache_file = self._cache_dir / "embeddings_cache.pkl"
 
+        # Model loading and encoding run on a private thread rather than the
+        # loop's shared default executor. One worker is enough: the model
+        # already parallelizes each batch internally.
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="embedding"
+        )
+
     async def initialize(self) -> None:
         """Initialize the embedding service with fallback strategy."""
         self.logger.info("Initializing embedding service")
@@ -88,7 +116,9 @@ class EmbeddingService:
                 return SentenceTransformer(self.config.fallback_model)
 
             self.sentence_transformer_model = (
-                await asyncio.get_event_loop().run_in_executor(None, load_model)
+                await asyncio.get_running_loop().run_in_executor(
+                    self._executor, load_model
+                )
             )
 
             self.logger.info(
@@ -163,26 +193,31 @@ class EmbeddingService:
 
         # Generate embeddings for uncached texts
         if uncached_texts:
+            new_embeddings: list[list[float]] | None = None
+
             if self.lm_studio_client and len(uncached_texts) <= self.config.batch_size:
                 try:
                     new_embeddings = await self._embed_batch_lm_studio(uncached_texts)
-                    for text, embedding in zip(
-                        uncached_texts, new_embeddings, strict=False
-                    ):
-                        cache_key = self._get_cache_key(text)
-                        self._cache[cache_key] = embedding
-                        cached_embeddings[text] = embedding
                 except Exception as e:
                     self.logger.warning(
                         "LM Studio batch embedding failed",
                         error=str(e),
                     )
-                    # Fall back to individual embeddings
-                    for text in uncached_texts:
-                        embedding = await self.embed(text)
-                        cached_embeddings[text] = embedding
+            elif not self.lm_studio_client and self.sentence_transformer_model:
+                # Single forward pass over the whole batch
+                new_embeddings = await self._embed_batch_sentence_transformers(
+                    uncached_texts
+                )
+
+            if new_embeddings is not None:
+                for text, embedding in zip(
+                    uncached_texts, new_embeddings, strict=False
+                ):
+                    cache_key = self._get_cache_key(text)
+                    self._cache[cache_key] = embedding
+                    cached_embeddings[text] = embedding
             else:
-                # Use sentence transformers or individual embeddings
+                # Fall back to individual embeddings
                 for text in uncached_texts:
                     embedding = await self.embed(text)
                     cached_embeddings[text] = embedding
@@ -253,9 +288,32 @@ class EmbeddingService:
         def encode_text():
             return self.sentence_transformer_model.encode([text])[0].tolist()
 
-        embedding = await asyncio.get_event_loop().run_in_executor(None, encode_text)
+        embedding = await asyncio.get_running_loop().run_in_executor(
+            self._executor, encode_text
+        )
         return embedding
 
+    async def _embed_batch_sentence_transformers(
+        self, texts: list[str]
+    ) -> list[list[float]]:
+        """Generate embeddings for multiple texts using sentence transformers.
+
+        Args:
+            texts: List of texts to embed.
+
+        Returns:
+            List of embedding vectors.
+        """
+
+        def encode_texts():
+            return self.sentence_transformer_model.encode(
+                texts, batch_size=self.config.batch_size
+            ).tolist()
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, encode_texts
+        )
+
     def _get_cache_key(self, text: str) -> str:
         """Generate cache key for text.
 
@@ -308,6 +366,8 @@ class EmbeddingService:
         if self.lm_studio_client:
             await self.lm_studio_client.aclose()
 
+        self._executor.shutdown(wait=False)
+
         self.logger.info("Embedding service cleanup complete")
 
     def get_metrics(self) -> dict[str, Any]:
@@ -323,3 +383,113 @@ class EmbeddingService:
             "cache_hit_rate": getattr(self, "_cache_hits", 0)
             / max(getattr(self, "_total_requests", 1), 1),
         }
+
+
+class EmbeddingBatcher:
+    """Coalesces concurrent single-text embedding requests into batches.
+
+    Requests submitted within ``max_wait_ms`` of each other (up to
+    ``max_batch`` of them) are embedded with one ``embed_batch`` call.
+    """
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        max_batch: int = 32,
+        max_wait_ms: float = 5.0,
+    ):
+        self.embedding_service = embedding_service
+        self.max_batch = max(max_batch, 1)
+        self.max_wait = max(max_wait_ms, 0.0) / 1000
+        self.logger = get_logger(__name__)
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future[list[float]]]] = (
+            asyncio.Queue()
+        )
+        self._worker: asyncio.Task[None] | None = None
+
+    async def submit(self, text: str) -> list[float]:
+        """Queue text for the next batch and wait for its embedding.
+
+        Args:
+            text: Text to embed.
+
+        Returns:
+            Embedding vector.
+        """
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+        future: asyncio.Future[list[float]] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collect queued requests into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        batch: list[tuple[str, asyncio.Future[list[float]]]] = []
+
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.max_wait
+
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except TimeoutError:
+                        break
+
+                await self._dispatch(batch)
+        finally:
+            # Requests already taken off the queue are not reached by close()
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    async def _dispatch(
+        self, batch: list[tuple[str, asyncio.Future[list[float]]]]
+    ) -> None:
+        """Embed a batch and resolve the waiting futures.
+
+        Args:
+            batch: Queued (text, future) pairs.
+        """
+        texts = [text for text, _ in batch]
+
+        try:
+            embeddings = await self.embedding_service.embed_batch(texts)
+            if len(embeddings) != len(batch):
+                raise ValueError(
+                    f"Expected {len(batch)} embeddings, got {len(embeddings)}"
+                )
+        except Exception as e:
+            self.logger.warning(
+                "Batched embedding failed", batch_size=len(batch), error=str(e)
+            )
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), embedding in zip(batch, embeddings, strict=True):
+            if not future.done():
+                future.set_result(embedding)
+
+        self.logger.debug("Dispatched embedding batch", batch_size=len(batch))
+
+    async def close(self) -> None:
+        """Stop the batching worker and cancel any queued requests."""
+        if self._worker and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
@@ -81,16 +81,20 @@ class HealthChecker:
         if not config:
             return self._generate_output(output_format)
 
-        # Run all health checks
-        await self._check_file_system(config, fix_issues)
-        await self._check_docker_services(setup_docker, verbose)
-        await self._check_dependencies(config, download_models, verbose)
-        await self._check_network_connectivity(config, verbose)
-        await self._check_models_and_services(config, download_models, verbose)
-
-        # Apply fixes if requested
-        if fix_issues:
-            await self._apply_fixes(config, verbose)
+        try:
+            # Run all health checks
+            await self._check_file_system(config, fix_issues)
+            await self._check_docker_services(setup_docker, verbose)
+            await self._check_dependencies(config, download_models, verbose)
+            await self._check_network_connectivity(config, verbose)
+            await self._check_models_and_services(config, download_models, verbose)
+
+            # Apply fixes if requested
+            if fix_issues:
+                await self._apply_fixes(config, verbose)
+        finally:
+            # The checks' HTTP client is bound to this event loop
+            await self.dependency_checker.close()
 
         return self._generate_output(output_format)
 
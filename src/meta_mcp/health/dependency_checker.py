@@ -16,6 +16,21 @@ class DependencyChecker:
 
     def __init__(self):
         self.logger = get_logger(__name__)
+        # Shared by all checks, so checks against the same service reuse
+        # its connection
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client shared by the connectivity checks."""
+        if self._client is None:
+            self._client = httpx.AsyncClient()
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def check_python_packages(self) -> list[str]:
         """Check for required Python packages.
@@ -68,11 +83,11 @@ class DependencyChecker:
             True if LM Studio is responding.
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                # Check if the base endpoint is responding
-                base_url = endpoint.rstrip("/v1").rstrip("/")
-                response = await client.get(f"{base_url}/v1/models")
-                return response.status_code == 200
+            client = self._get_client()
+            # Check if the base endpoint is responding
+            base_url = endpoint.rstrip("/v1").rstrip("/")
+            response = await client.get(f"{base_url}/v1/models", timeout=10.0)
+            return response.status_code == 200
         except Exception as e:
             self.logger.debug(f"LM Studio connectivity check failed: {e}")
             return False
@@ -88,10 +103,12 @@ class DependencyChecker:
             True if Qdrant is responding.
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                # Qdrant doesn't have /health endpoint, use /collections instead
-                response = await client.get(f"http://{host}:{port}/collections")
-                return response.status_code == 200
+            client = self._get_client()
+            # Qdrant doesn't have /health endpoint, use /collections instead
+            response = await client.get(
+                f"http://{host}:{port}/collections", timeout=10.0
+            )
+            return response.status_code == 200
         except Exception as e:
             self.logger.debug(f"Qdrant connectivity check failed: {e}")
             return False
@@ -106,14 +123,14 @@ class DependencyChecker:
             List of available model names.
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                base_url = endpoint.rstrip("/v1").rstrip("/")
-                response = await client.get(f"{base_url}/v1/models")
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return [model.get("id", "") for model in data.get("data", [])]
-                return []
+            client = self._get_client()
+            base_url = endpoint.rstrip("/v1").rstrip("/")
+            response = await client.get(f"{base_url}/v1/models", timeout=10.0)
+
+            if response.status_code == 200:
+                data = response.json()
+                return [model.get("id", "") for model in data.get("data", [])]
+            return []
         except Exception as e:
             self.logger.debug(f"Failed to get available models: {e}")
             return []
@@ -159,19 +176,20 @@ class DependencyChecker:
             True if embedding generation works.
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{endpoint.rstrip('/')}/embeddings",
-                    json={
-                        "input": "test embedding",
-                        "model": model,
-                    },
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return "data" in data and len(data["data"]) > 0
-                return False
+            client = self._get_client()
+            response = await client.post(
+                f"{endpoint.rstrip('/')}/embeddings",
+                json={
+                    "input": "test embedding",
+                    "model": model,
+                },
+                timeout=30.0,
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                return "data" in data and len(data["data"]) > 0
+            return False
         except Exception as e:
             self.logger.debug(f"Embedding generation test failed: {e}")
             return False
@@ -187,21 +205,22 @@ class DependencyChecker:
             True if completion generation works.
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{endpoint.rstrip('/')}/completions",
-                    json={
-                        "prompt": "Hello",
-                        "model": model,
-                        "max_tokens": 10,
-                        "temperature": 0.1,
-                    },
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return "choices" in data and len(data["choices"]) > 0
-                return False
+            client = self._get_client()
+            response = await client.post(
+                f"{endpoint.rstrip('/')}/completions",
+                json={
+                    "prompt": "Hello",
+                    "model": model,
+                    "max_tokens": 10,
+                    "temperature": 0.1,
+                },
+                timeout=30.0,
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                return "choices" in data and len(data["choices"]) > 0
+            return False
         except Exception as e:
             self.logger.debug(f"Completion generation test failed: {e}")
             return False
@@ -222,21 +241,23 @@ class DependencyChecker:
         results = {}
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"http://{host}:{port}/collections")
-
-                if response.status_code == 200:
-                    data = response.json()
-                    existing_collections = {
-                        collection["name"]
-                        for collection in data.get("result", {}).get("collections", [])
-                    }
+            client = self._get_client()
+            response = await client.get(
+                f"http://{host}:{port}/collections", timeout=10.0
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                existing_collections = {
+                    collection["name"]
+                    for collection in data.get("result", {}).get("collections", [])
+                }
 
-                    for collection in collections:
-                        results[collection] = collection in existing_collections
-                else:
-                    # If we can't get collections, assume none exist
-                    results = dict.fromkeys(collections, False)
+                for collection in collections:
+                    results[collection] = collection in existing_collections
+            else:
+                # If we can't get collections, assume none exist
+                results = dict.fromkeys(collections, False)
 
         except Exception as e:
             self.logger.debug(f"Failed to check Qdrant collections: {e}")
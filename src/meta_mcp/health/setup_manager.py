@@ -359,7 +359,7 @@ class SetupManager:
 
                     # Check if collection already exists
                     existing_collections = (
-                        await asyncio.get_event_loop().run_in_executor(
+                        await asyncio.get_running_loop().run_in_executor(
                             None, client.get_collections
                         )
                     )
@@ -382,7 +382,7 @@ class SetupManager:
                                 ),
                             )
 
-                        await asyncio.get_event_loop().run_in_executor(
+                        await asyncio.get_running_loop().run_in_executor(
                             None,
                             create_collection_with_config,
                         )
@@ -101,7 +101,7 @@ def run_server(
             run_with_reload(server)
         else:
             # Production mode
-            asyncio.run(server.run())
+            run_server_loop(server)
     except KeyboardInterrupt:
         logger.info("Received interrupt signal, shutting down...")
     except Exception as e:
@@ -109,6 +109,24 @@ def run_server(
         sys.exit(1)
 
 
+def run_server_loop(server: MetaMCPServer) -> None:
+    """Run the server to completion, on uvloop if it is installed.
+
+    uvloop is provided by the ``fast`` extra and speeds up the event loop
+    the server's stdio, HTTP and WebSocket traffic runs on.
+
+    Args:
+        server: Server to run.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(server.run())
+        return
+
+    uvloop.run(server.run())
+
+
 def run_with_reload(server: MetaMCPServer) -> None:
     """Run server with auto-reload for development."""
     try:
@@ -118,13 +136,13 @@ def run_with_reload(server: MetaMCPServer) -> None:
         console.print(
             "[yellow]Watchdog not installed, running without auto-reload[/yellow]"
         )
-        asyncio.run(server.run())
+        run_server_loop(server)
         return
 
     # TODO: Implement file watching and auto-reload
     # For now, just run normally
     console.print("[yellow]Auto-reload not yet implemented, running normally[/yellow]")
-    asyncio.run(server.run())
+    run_server_loop(server)
 
 
 @app.command()
@@ -533,7 +551,7 @@ def _start_server(
     server = MetaMCPServer(server_config, config)
 
     try:
-        asyncio.run(server.run())
+        run_server_loop(server)
     except KeyboardInterrupt:
         logger.info("Received interrupt signal, shutting down...")
     except Exception as e:
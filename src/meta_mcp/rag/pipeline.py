@@ -233,8 +233,31 @@ class RAGPipeline:
 
         return chunks
 
+    async def embed_query(self, query: str) -> list[float] | None:
+        """Generate the query embedding used for context retrieval.
+
+        Callers that need the embedding for several lookups can compute it
+        once here and pass it to ``augment_query_with_context`` or
+        ``retrieve_relevant_context``.
+
+        Args:
+            query: Query to embed.
+
+        Returns:
+            Embedding vector, or None if embedding failed.
+        """
+        try:
+            return await self.embedding_service.embed(query)
+        except Exception as e:
+            self.logger.error("Failed to embed query", error=str(e))
+            return None
+
     async def retrieve_relevant_context(
-        self, query: str, sources: list[str] | None = None, limit: int | None = None
+        self,
+        query: str,
+        sources: list[str] | None = None,
+        limit: int | None = None,
+        query_embedding: list[float] | None = None,
     ) -> list[dict[str, Any]]:
         """Retrieve relevant documentation context for a query.
 
@@ -242,28 +265,27 @@ class RAGPipeline:
             query: Query to search for.
             sources: Optional list of source IDs to filter by.
             limit: Maximum number of chunks to retrieve.
+            query_embedding: Precomputed embedding for the query, if available.
 
         Returns:
             List of relevant document chunks.
         """
         try:
-            # Generate query embedding
-            query_embedding = await self.embedding_service.embed(query)
+            # Generate query embedding unless the caller already has one
+            if query_embedding is None:
+                query_embedding = await self.embedding_service.embed(query)
 
             # Search for relevant documents
             limit = limit or self.config.top_k
-            relevant_docs = []
 
             if sources:
-                # Search each source separately
-                for source in sources:
-                    docs = await self.vector_store.search_documents(
-                        query_vector=query_embedding,
-                        limit=limit // len(sources) + 1,
-                        score_threshold=self.config.score_threshold,
-                        source_filter=source,
-                    )
-                    relevant_docs.extend(docs)
+                # Search each source separately, in a single batched request
+                relevant_docs = await self.vector_store.search_documents_by_source(
+                    query_vector=query_embedding,
+                    sources=sources,
+                    limit=limit // len(sources) + 1,
+                    score_threshold=self.config.score_threshold,
+                )
             else:
                 # Search all documents
                 relevant_docs = await self.vector_store.search_documents(
@@ -281,13 +303,17 @@ class RAGPipeline:
             return []
 
     async def augment_query_with_context(
-        self, query: str, tools: list[Tool]
+        self,
+        query: str,
+        tools: list[Tool],
+        query_embedding: list[float] | None = None,
     ) -> tuple[str, list[dict[str, Any]]]:
         """Augment query with relevant documentation context.
 
         Args:
             query: Original query.
             tools: Available tools.
+            query_embedding: Precomputed embedding for the query, if available.
 
         Returns:
             Tuple of (augmented_query, context_documents).
@@ -303,7 +329,7 @@ class RAGPipeline:
 
             # Retrieve relevant context
             context_docs = await self.retrieve_relevant_context(
-                query, sources=tool_sources
+                query, sources=tool_sources, query_embedding=query_embedding
             )
 
             if not context_docs:
@@ -26,14 +26,22 @@ class SelectionContext:
         self.user_preferences = user_preferences or {}
         self.timestamp = time.time()
 
+        # Shared between routers so a fallback strategy reuses the work;
+        # the embedding is normalized to unit length
+        self.cached_text: str | None = None
+        self.cached_embedding: list[float] | None = None
+
     def get_context_text(self) -> str:
         """Get concatenated context text for embedding/analysis."""
-        context_parts = [self.query]
+        if self.cached_text is None:
+            context_parts = [self.query]
+
+            if self.recent_messages:
+                context_parts.extend(self.recent_messages[-3:])  # Last 3 messages
 
-        if self.recent_messages:
-            context_parts.extend(self.recent_messages[-3:])  # Last 3 messages
+            self.cached_text = " ".join(context_parts)
 
-        return " ".join(context_parts)
+        return self.cached_text
 
 
 class SelectionResult:
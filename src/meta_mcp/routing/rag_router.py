@@ -3,6 +3,7 @@
 from typing import Any
 
 from ..config.models import MetaMCPConfig, Tool
+from ..embeddings.service import normalize_embedding
 from ..llm.lm_studio_client import LMStudioClient
 from ..rag.pipeline import RAGPipeline
 from .base import BaseRouter, SelectionContext, SelectionResult
@@ -57,12 +58,24 @@ class RAGRouter(BaseRouter):
             Selection result with RAG-selected tools.
         """
         try:
+            context_text = context.get_context_text()
+
+            # Embed the context once and reuse it for every retrieval step
+            query_embedding = context.cached_embedding
+            if query_embedding is None:
+                query_embedding = await self.rag_pipeline.embed_query(context_text)
+                if query_embedding is not None:
+                    # Unit length, as the vector router reuses it for its
+                    # dot-product search
+                    query_embedding = normalize_embedding(query_embedding)
+                    context.cached_embedding = query_embedding
+
             # Build enhanced query with retrieved context
             (
                 enhanced_query,
                 context_docs,
             ) = await self.rag_pipeline.augment_query_with_context(
-                context.get_context_text(), available_tools
+                context_text, available_tools, query_embedding=query_embedding
             )
 
             # Prepare tool data for LLM selection
@@ -122,7 +135,7 @@ class RAGRouter(BaseRouter):
                     "llm_confidence": llm_confidence,
                     "context_quality": context_quality,
                     "enhanced_query_length": len(enhanced_query),
-                    "original_query_length": len(context.get_context_text()),
+                    "original_query_length": len(context_text),
                     "total_tools_considered": len(available_tools),
                     "rag_selections": len(selected_tool_ids),
                     "valid_selections": len(selected_tools),
@@ -1,12 +1,27 @@
 """Vector search routing strategy using semantic similarity."""
 
+import asyncio
+import hashlib
+from collections import OrderedDict
 from typing import Any
 
+import numpy as np
+
 from ..config.models import MetaMCPConfig, Tool
-from ..embeddings.service import EmbeddingService
+from ..embeddings.matrix import EmbeddingMatrix
+from ..embeddings.service import (
+    EmbeddingBatcher,
+    EmbeddingService,
+    normalize_embedding,
+)
 from ..vector_store.qdrant_client import QdrantVectorStore
 from .base import BaseRouter, SelectionContext, SelectionResult
 
+# Seconds to collect tool usage updates before writing them in one batch
+USAGE_FLUSH_INTERVAL = 0.2
+# Pending tool usage updates that trigger an immediate write
+USAGE_FLUSH_MAX_PENDING = 100
+
 
 class VectorSearchRouter(BaseRouter):
     """Router that uses vector similarity search for tool selection."""
@@ -21,6 +36,39 @@ class VectorSearchRouter(BaseRouter):
         self.embedding_service = embedding_service
         self.vector_store = vector_store
 
+        # LRU cache of query embeddings plus in-flight requests, so repeated
+        # or concurrent identical queries share a single embedding call
+        self._query_cache: OrderedDict[bytes, list[float]] = OrderedDict()
+        self._pending_embeddings: dict[bytes, asyncio.Future[list[float]]] = {}
+        self._query_cache_hits = 0
+
+        # Embeddings of registered tools keyed by tool ID, with the fingerprint
+        # of the text they were computed from
+        self._tool_embedding_cache: dict[str, tuple[str, list[float]]] = {}
+
+        # IDs of tools whose current embedding is stored in the vector store
+        self._stored_tool_ids: set[str] = set()
+
+        # Lookup for the registered tool list, so selections against it don't
+        # rebuild the mapping on every request
+        self._indexed_tools: list[Tool] = []
+        self._indexed_count = 0
+        self._tool_index: dict[str, Tool] = {}
+
+        # Contiguous float32 copy of the registered tool embeddings
+        self._embedding_matrix = EmbeddingMatrix()
+
+        # Usage updates waiting to be written to the vector store
+        self._usage_flush_buffer: dict[str, tuple[int, str | None]] = {}
+        self._usage_flush_task: asyncio.Task[None] | None = None
+
+        # Cache misses from concurrent requests are embedded in shared batches
+        self._embedding_batcher = EmbeddingBatcher(
+            embedding_service,
+            max_batch=config.embeddings.batch_size,
+            max_wait_ms=config.embeddings.batch_wait_ms,
+        )
+
     async def initialize(self) -> None:
         """Initialize the vector search router."""
         self.logger.info("Initializing vector search router")
@@ -49,15 +97,18 @@ class VectorSearchRouter(BaseRouter):
             # Get context text for embedding
             context_text = context.get_context_text()
 
-            # Generate embedding for the context
-            query_embedding = await self.embedding_service.embed(context_text)
+            # Generate embedding for the context unless another router did
+            query_embedding = context.cached_embedding
+            if query_embedding is None:
+                query_embedding = await self._embed_query(context_text)
+                context.cached_embedding = query_embedding
             self.logger.debug(
                 f"Generated query embedding with {len(query_embedding)} dimensions"
             )
 
-            # Search for similar tools in vector store
-            similar_tools_data = await self.vector_store.search_similar_tools(
-                query_vector=query_embedding,
+            # Search for similar tools locally or in the vector store
+            similar_tools_data = await self._search_tools(
+                query_embedding,
                 limit=self.config.strategy.max_tools * 2,  # Get more for filtering
                 score_threshold=self.config.strategy.vector_threshold,
             )
@@ -73,10 +124,8 @@ class VectorSearchRouter(BaseRouter):
                 )
 
                 # Get top results without threshold to see what's available
-                adaptive_results = await self.vector_store.search_similar_tools(
-                    query_vector=query_embedding,
-                    limit=min(5, self.config.strategy.max_tools),
-                    score_threshold=0.0,  # No threshold
+                adaptive_results = await self._adaptive_search(
+                    query_embedding, limit=min(5, self.config.strategy.max_tools)
                 )
 
                 if adaptive_results:
@@ -91,18 +140,12 @@ class VectorSearchRouter(BaseRouter):
 
             # Convert search results back to Tool objects
             selected_tools = []
-            tool_lookup = {tool.id: tool for tool in available_tools}
+            tool_lookup = self._get_tool_lookup(available_tools)
 
             for tool_data in similar_tools_data:
                 tool_id = tool_data["tool_id"]
                 if tool_id in tool_lookup:
-                    tool = tool_lookup[tool_id]
-                    # Update usage info if available
-                    if "usage_count" in tool_data:
-                        tool.usage_count = tool_data["usage_count"]
-                    if "last_used" in tool_data:
-                        tool.last_used = tool_data["last_used"]
-                    selected_tools.append(tool)
+                    selected_tools.append(tool_lookup[tool_id])
 
             # Apply max tools limit
             limited_tools = self._limit_tools(
@@ -110,7 +153,8 @@ class VectorSearchRouter(BaseRouter):
             )
 
             # Calculate confidence based on scores
-            confidence = self._calculate_confidence(similar_tools_data)
+            scores = self._extract_scores(similar_tools_data)
+            confidence = self._calculate_confidence(scores)
 
             return SelectionResult(
                 tools=limited_tools,
@@ -122,10 +166,7 @@ class VectorSearchRouter(BaseRouter):
                     "threshold_used": self.config.strategy.vector_threshold,
                     "max_tools": self.config.strategy.max_tools,
                     "context_length": len(context_text),
-                    "top_scores": [
-                        round(tool_data["score"], 3)
-                        for tool_data in similar_tools_data[:5]
-                    ],
+                    "top_scores": scores[:5].round(3).tolist(),
                 },
             )
 
@@ -142,23 +183,220 @@ class VectorSearchRouter(BaseRouter):
                 },
             )
 
-    def _calculate_confidence(self, search_results: list[dict[str, Any]]) -> float:
-        """Calculate confidence score based on search results.
+    @staticmethod
+    def _get_query_cache_key(text: str) -> bytes:
+        """Generate a query cache key from normalized context text.
+
+        Args:
+            text: Context text to generate key for.
+
+        Returns:
+            Cache key bytes.
+        """
+        return hashlib.blake2b(text.strip().lower().encode(), digest_size=16).digest()
+
+    async def _embed_query(self, text: str) -> list[float]:
+        """Embed query text through the LRU cache.
+
+        Concurrent requests for the same text await one shared embedding call.
+
+        Args:
+            text: Context text to embed.
+
+        Returns:
+            Embedding vector.
+        """
+        key = self._get_query_cache_key(text)
+
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            self._query_cache_hits += 1
+            return cached
+
+        pending = self._pending_embeddings.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._embed_normalized(text))
+            self._pending_embeddings[key] = pending
+            pending.add_done_callback(
+                lambda future: self._store_query_embedding(key, future)
+            )
+
+        # Shield so one cancelled caller does not cancel the shared call
+        return await asyncio.shield(pending)
+
+    async def _embed_normalized(self, text: str) -> list[float]:
+        """Embed text and scale it to unit length for dot-product search.
+
+        Args:
+            text: Text to embed.
+
+        Returns:
+            Unit-length embedding vector.
+        """
+        return normalize_embedding(await self._embedding_batcher.submit(text))
+
+    def _store_query_embedding(
+        self, key: bytes, future: asyncio.Future[list[float]]
+    ) -> None:
+        """Move a finished embedding call into the LRU cache.
+
+        Args:
+            key: Query cache key.
+            future: Completed embedding call.
+        """
+        self._pending_embeddings.pop(key, None)
+
+        cache_size = self.config.strategy.query_cache_size
+        if future.cancelled() or future.exception() or cache_size <= 0:
+            return
+
+        self._query_cache[key] = future.result()
+        self._query_cache.move_to_end(key)
+        while len(self._query_cache) > cache_size:
+            self._query_cache.popitem(last=False)
+
+    def _get_local_matrix(
+        self, query_embedding: list[float], max_tools: int | None = None
+    ) -> EmbeddingMatrix | None:
+        """Get the local embedding matrix if it can serve a query.
+
+        Args:
+            query_embedding: Query embedding.
+            max_tools: Optional limit on the number of tools in the matrix.
+
+        Returns:
+            The embedding matrix, or None if it is empty, too large or was
+            built with a different embedding dimension.
+        """
+        matrix = self._embedding_matrix
+        if not len(matrix) or matrix.matrix.shape[1] != len(query_embedding):
+            return None
+        if max_tools is not None and len(matrix) > max_tools:
+            return None
+        return matrix
+
+    async def _search_tools(
+        self, query_embedding: list[float], limit: int, score_threshold: float
+    ) -> list[dict[str, Any]]:
+        """Search for the tools most similar to a query.
+
+        Catalogs of up to ``strategy.local_knn_max_tools`` tools are scored
+        exhaustively against the local embedding matrix, which is faster than
+        a round trip to Qdrant at that size.
+
+        Args:
+            query_embedding: Unit-length query embedding.
+            limit: Maximum number of results.
+            score_threshold: Minimum similarity score.
+
+        Returns:
+            Search results with tool IDs and scores, highest score first.
+        """
+        matrix = self._get_local_matrix(
+            query_embedding, self.config.strategy.local_knn_max_tools
+        )
+        if matrix is not None:
+            return [
+                {"tool_id": tool_id, "score": score}
+                for tool_id, score in matrix.top_k(query_embedding, limit)
+                if score >= score_threshold
+            ]
+
+        return await self.vector_store.search_similar_tools(
+            query_vector=query_embedding,
+            limit=limit,
+            score_threshold=score_threshold,
+        )
+
+    async def _adaptive_search(
+        self, query_embedding: list[float], limit: int
+    ) -> list[dict[str, Any]]:
+        """Get the top tools for a query without a score threshold.
+
+        Scores the local embedding matrix in-process; Qdrant is only queried
+        when no matching local matrix is available.
+
+        Args:
+            query_embedding: Unit-length query embedding.
+            limit: Maximum number of results.
+
+        Returns:
+            Search results with tool IDs and scores, highest score first.
+        """
+        matrix = self._get_local_matrix(query_embedding)
+        if matrix is not None:
+            return [
+                {"tool_id": tool_id, "score": score}
+                for tool_id, score in matrix.top_k(query_embedding, limit)
+            ]
+
+        return await self.vector_store.search_similar_tools(
+            query_vector=query_embedding,
+            limit=limit,
+            score_threshold=0.0,  # No threshold
+        )
+
+    def set_tool_index(self, tools: list[Tool]) -> None:
+        """Index the registered tool list by tool ID.
+
+        Args:
+            tools: Registered tools that selections normally run against.
+        """
+        self._indexed_tools = tools
+        self._indexed_count = len(tools)
+        self._tool_index = {tool.id: tool for tool in tools}
+
+    def _get_tool_lookup(self, available_tools: list[Tool]) -> dict[str, Tool]:
+        """Get a tool ID lookup for the tools being selected from.
+
+        Args:
+            available_tools: Tools passed to the current selection.
+
+        Returns:
+            The persistent index when the registered list is passed unchanged,
+            otherwise a lookup built for the given tools.
+        """
+        if (
+            available_tools is self._indexed_tools
+            and len(available_tools) == self._indexed_count
+        ):
+            return self._tool_index
+        return {tool.id: tool for tool in available_tools}
+
+    @staticmethod
+    def _extract_scores(search_results: list[dict[str, Any]]) -> np.ndarray:
+        """Collect search result scores into an array.
 
         Args:
             search_results: List of search results with scores.
 
+        Returns:
+            Scores in result order.
+        """
+        return np.fromiter(
+            (result["score"] for result in search_results),
+            dtype=np.float64,
+            count=len(search_results),
+        )
+
+    def _calculate_confidence(self, scores: np.ndarray) -> float:
+        """Calculate confidence score based on search result scores.
+
+        Args:
+            scores: Search result scores.
+
         Returns:
             Confidence score between 0 and 1.
         """
-        if not search_results:
+        if not scores.size:
             return 0.0
 
         # Use the highest score as base confidence
-        max_score = max(result["score"] for result in search_results)
+        max_score = float(scores.max())
 
         # Adjust based on number of results and score distribution
-        num_results = len(search_results)
+        num_results = scores.size
         if num_results >= self.config.strategy.max_tools:
             # Good number of relevant results
             confidence = min(max_score * 1.1, 1.0)
@@ -170,56 +408,127 @@ class VectorSearchRouter(BaseRouter):
 
         return round(confidence, 3)
 
+    @staticmethod
+    def _get_text_fingerprint(text: str) -> str:
+        """Fingerprint a tool's embedding text.
+
+        Args:
+            text: Text the tool embedding is generated from.
+
+        Returns:
+            Hex digest of the text.
+        """
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _build_embedding_text(tool: Tool) -> str:
+        """Build the text embedded for a tool.
+
+        Args:
+            tool: Tool to build text for.
+
+        Returns:
+            Description, parameter descriptions and examples joined together.
+        """
+        # Combine description and parameter info for better embeddings
+        text_parts = [tool.description]
+
+        # Add parameter names and descriptions
+        parameters = tool.parameters
+        if parameters and isinstance(parameters, dict):
+            properties = parameters.get("properties")
+            if properties:
+                text_parts.extend(
+                    f"{name}: {info.get('description', '')}"
+                    for name, info in properties.items()
+                    if isinstance(info, dict)
+                )
+
+        # Add examples if available
+        if tool.examples:
+            text_parts.extend(tool.examples)
+
+        return " ".join(text_parts)
+
     async def update_tool_embeddings(self, tools: list[Tool]) -> None:
         """Update tool embeddings in the vector store.
 
+        Only new or changed tools are written to the vector store, and tools
+        missing from ``tools`` since the last update are removed from it.
+
         Args:
-            tools: List of tools to update embeddings for.
+            tools: Full list of registered tools.
         """
+        self.set_tool_index(tools)
+
         try:
-            # Generate embeddings for tools that don't have them
-            tools_to_embed = [tool for tool in tools if not tool.embedding]
+            # Assemble texts off the event loop; large catalogs take a while
+            pending = [tool for tool in tools if not tool.embedding]
+            pending_texts = await asyncio.to_thread(
+                lambda: [self._build_embedding_text(tool) for tool in pending]
+            )
+
+            # Generate embeddings for tools that don't have them, reusing the
+            # previous embedding when the tool's embedding text is unchanged
+            tools_to_embed = []
+            texts = []
+            fingerprints = []
+            for tool, text in zip(pending, pending_texts, strict=True):
+                fingerprint = self._get_text_fingerprint(text)
+                cached = self._tool_embedding_cache.get(tool.id)
+                if cached and cached[0] == fingerprint:
+                    tool.embedding = cached[1]
+                else:
+                    tools_to_embed.append(tool)
+                    texts.append(text)
+                    fingerprints.append(fingerprint)
 
             if tools_to_embed:
                 self.logger.info(
                     f"Generating embeddings for {len(tools_to_embed)} tools"
                 )
 
-                # Prepare texts for embedding
-                texts = []
-                for tool in tools_to_embed:
-                    # Combine description and parameter info for better embeddings
-                    text_parts = [tool.description]
-
-                    # Add parameter names and descriptions
-                    if tool.parameters and isinstance(tool.parameters, dict):
-                        if "properties" in tool.parameters:
-                            for param_name, param_info in tool.parameters[
-                                "properties"
-                            ].items():
-                                if isinstance(param_info, dict):
-                                    param_desc = param_info.get("description", "")
-                                    text_parts.append(f"{param_name}: {param_desc}")
-
-                    # Add examples if available
-                    if tool.examples:
-                        text_parts.extend(tool.examples)
-
-                    texts.append(" ".join(text_parts))
-
                 # Generate embeddings in batch
                 embeddings = await self.embedding_service.embed_batch(texts)
 
-                # Update tool objects
-                for tool, embedding in zip(tools_to_embed, embeddings, strict=False):
-                    tool.embedding = embedding
-
-            # Store all tool embeddings in vector store
-            await self.vector_store.store_tool_embeddings(tools)
+                # Update tool objects with unit-length vectors for dot search
+                for tool, fingerprint, embedding in zip(
+                    tools_to_embed, fingerprints, embeddings, strict=False
+                ):
+                    tool.embedding = normalize_embedding(embedding)
+                    self._tool_embedding_cache[tool.id] = (fingerprint, tool.embedding)
+
+            # Store new and re-embedded tools, and drop unregistered ones
+            embedded_ids = {tool.id for tool in tools_to_embed}
+            changed_tools = [
+                tool
+                for tool in tools
+                if tool.embedding
+                and (tool.id in embedded_ids or tool.id not in self._stored_tool_ids)
+            ]
+            removed_ids = self._stored_tool_ids - {tool.id for tool in tools}
+
+            initial_load = not self._stored_tool_ids
+            await self.vector_store.store_tool_embeddings(changed_tools)
+            if initial_load and changed_tools:
+                # Build the search index once the startup catalog is written
+                await self.vector_store.finalize_bulk_load()
+            if removed_ids:
+                await self.vector_store.delete_tool_embeddings(sorted(removed_ids))
+                for tool_id in removed_ids:
+                    self._tool_embedding_cache.pop(tool_id, None)
+
+            self._stored_tool_ids = {tool.id for tool in tools if tool.embedding}
+
+            self._embedding_matrix = EmbeddingMatrix.from_tools(
+                tools, dtype=self.config.strategy.local_matrix_dtype
+            )
 
             self.logger.info(
                 f"Updated embeddings for {len(tools)} tools",
                 new_embeddings=len(tools_to_embed),
+                stored=len(changed_tools),
+                removed=len(removed_ids),
             )
 
         except Exception as e:
@@ -228,18 +537,43 @@ class VectorSearchRouter(BaseRouter):
     async def update_tool_usage(
         self, tool_id: str, usage_count: int, last_used: str
     ) -> None:
-        """Update tool usage statistics in vector store.
+        """Queue a tool usage update for the vector store.
+
+        Updates are buffered and written in one batch after
+        ``USAGE_FLUSH_INTERVAL`` seconds, so tool calls don't wait on Qdrant.
+        Bursts are written as soon as ``USAGE_FLUSH_MAX_PENDING`` tools have
+        pending updates, which keeps each batch request bounded.
 
         Args:
             tool_id: Tool identifier.
             usage_count: New usage count.
             last_used: Last used timestamp.
         """
+        self._usage_flush_buffer[tool_id] = (usage_count, last_used)
+        if len(self._usage_flush_buffer) >= USAGE_FLUSH_MAX_PENDING:
+            await self.flush_tool_usage()
+            return
+
+        if self._usage_flush_task is None or self._usage_flush_task.done():
+            self._usage_flush_task = asyncio.create_task(self._flush_usage_later())
+
+    async def _flush_usage_later(self) -> None:
+        """Flush buffered usage updates until the buffer stays empty."""
+        while self._usage_flush_buffer:
+            await asyncio.sleep(USAGE_FLUSH_INTERVAL)
+            await self.flush_tool_usage()
+
+    async def flush_tool_usage(self) -> None:
+        """Write all buffered tool usage updates to the vector store."""
+        if not self._usage_flush_buffer:
+            return
+
+        updates, self._usage_flush_buffer = self._usage_flush_buffer, {}
         try:
-            await self.vector_store.update_tool_usage(tool_id, usage_count, last_used)
+            await self.vector_store.update_tool_usage_batch(updates)
         except Exception as e:
             self.logger.warning(
-                "Failed to update tool usage", tool_id=tool_id, error=str(e)
+                "Failed to update tool usage", tools=len(updates), error=str(e)
             )
 
     async def get_similar_tools(
@@ -270,7 +604,7 @@ class VectorSearchRouter(BaseRouter):
 
             # Convert to Tool objects and exclude the reference tool
             similar_tools = []
-            tool_lookup = {tool.id: tool for tool in available_tools}
+            tool_lookup = self._get_tool_lookup(available_tools)
 
             for tool_data in similar_tools_data:
                 tool_id = tool_data["tool_id"]
@@ -283,7 +617,29 @@ class VectorSearchRouter(BaseRouter):
             self.logger.error("Failed to find similar tools", error=str(e))
             return []
 
+    def get_metrics(self) -> dict[str, Any]:
+        """Get performance metrics including query cache statistics.
+
+        Returns:
+            Dictionary containing performance metrics.
+        """
+        metrics = super().get_metrics()
+        metrics["query_cache_size"] = len(self._query_cache)
+        metrics["query_cache_hits"] = self._query_cache_hits
+        return metrics
+
     async def cleanup(self) -> None:
         """Clean up vector search router resources."""
         await super().cleanup()
+
+        if self._usage_flush_task and not self._usage_flush_task.done():
+            self._usage_flush_task.cancel()
+            try:
+                await self._usage_flush_task
+            except asyncio.CancelledError:
+                pass
+        await self.flush_tool_usage()
+
+        await self._embedding_batcher.close()
+        self._query_cache.clear()
         # Vector store cleanup is handled by the main server
@@ -0,0 +1,128 @@
+"""Latency-based admission control for the Meta MCP Server."""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from ..utils.metrics import LatencyTracker
+
+
+class OverloadError(Exception):
+    """Exception raised when a request is rejected to shed load."""
+
+    pass
+
+
+class AdmissionController:
+    """Sheds requests when queue drain time or P95 latency get too high.
+
+    Two signals are combined: the expected time to drain the requests already
+    in flight (from an EMA of the service rate) and the recent P95 latency.
+    A request is always admitted when nothing is in flight, so the latency
+    window keeps refreshing and the controller recovers after an overload.
+    """
+
+    def __init__(
+        self,
+        max_p95_ms: float = 0.0,
+        max_drain_ms: float = 0.0,
+        alpha: float = 0.1,
+    ):
+        self.max_p95_ms = max_p95_ms
+        self.max_drain_ms = max_drain_ms
+        self.alpha = alpha
+        self.queued_requests = 0
+        self.service_rate = 0.0  # Completions per second
+        self.rejected_requests = 0
+        self.latency = LatencyTracker(alpha=alpha)
+        self._last_completion: float | None = None
+
+    def expected_drain_ms(self) -> float:
+        """Estimate how long the requests in flight will take to complete.
+
+        Returns:
+            Expected drain time in milliseconds, 0.0 without a service rate.
+        """
+        if self.service_rate <= 0:
+            return 0.0
+        return self.queued_requests / self.service_rate * 1000
+
+    def overload_reason(self) -> str | None:
+        """Check whether a new request should be rejected.
+
+        Returns:
+            Reason for rejection, or None if the request can be admitted.
+        """
+        if not self.queued_requests:
+            return None
+
+        if self.max_drain_ms > 0:
+            drain_ms = self.expected_drain_ms()
+            if drain_ms > self.max_drain_ms:
+                return f"queue drain time {drain_ms:.0f}ms exceeds limit"
+
+        if self.max_p95_ms > 0:
+            p95_ms = self.latency.percentile(95)
+            if p95_ms > self.max_p95_ms:
+                return f"P95 latency {p95_ms:.0f}ms exceeds limit"
+
+        return None
+
+    def acquire(self) -> None:
+        """Admit a request.
+
+        Raises:
+            OverloadError: If the server is overloaded.
+        """
+        reason = self.overload_reason()
+        if reason:
+            self.rejected_requests += 1
+            raise OverloadError(f"Server overloaded: {reason}")
+        self.queued_requests += 1
+
+    def release(self, latency_ms: float) -> None:
+        """Mark an admitted request as completed.
+
+        Args:
+            latency_ms: Time the request took in milliseconds.
+        """
+        self.queued_requests -= 1
+        self.latency.record(latency_ms)
+
+        now = time.perf_counter()
+        if self._last_completion is not None and now > self._last_completion:
+            rate = 1.0 / (now - self._last_completion)
+            if self.service_rate:
+                self.service_rate += self.alpha * (rate - self.service_rate)
+            else:
+                self.service_rate = rate
+        self._last_completion = now
+
+    @contextmanager
+    def admit(self) -> Iterator[None]:
+        """Admit a request for the duration of the context.
+
+        Raises:
+            OverloadError: If the server is overloaded.
+        """
+        self.acquire()
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.release((time.perf_counter() - start_time) * 1000)
+
+    def get_status(self) -> dict[str, Any]:
+        """Get admission state for health checks and load balancers.
+
+        Returns:
+            Admission status dictionary.
+        """
+        return {
+            "state": "overloaded" if self.overload_reason() else "accepting",
+            "p95_ms": round(self.latency.percentile(95), 2),
+            "service_rate": round(self.service_rate, 2),
+            "queued": self.queued_requests,
+            "rejected": self.rejected_requests,
+        }
@@ -15,11 +15,31 @@ from ..routing.llm_router import LLMRouter
 from ..routing.rag_router import RAGRouter
 from ..routing.vector_router import VectorSearchRouter
 from ..utils.logging import get_logger
+from ..utils.metrics import LatencyTracker
 from ..vector_store.qdrant_client import QdrantVectorStore
 from ..web_ui.gradio_app import GradioWebInterface
+from .admission import AdmissionController, OverloadError
 
 logger = get_logger(__name__)
 
+_timestamp_cache: tuple[int, str] = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """Get the current UTC time as an ISO 8601 string.
+
+    The formatted string is cached per second so hot paths don't pay for
+    ``strftime`` on every call.
+
+    Returns:
+        Timestamp like ``2024-01-01T12:00:00Z``.
+    """
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)))
+    return _timestamp_cache[1]
+
 
 class RoutingEngine:
     """Manages multiple routing strategies."""
@@ -62,35 +82,68 @@ class RoutingEngine:
     async def select_tools(
         self, context: SelectionContext, available_tools: list[Tool]
     ) -> Any:
-        """Select tools using the configured strategy with fallback."""
-        # Try primary strategy
-        try:
-            router = self.routers[self.primary_strategy]
-            result = await router.select_tools_with_metrics(context, available_tools)
-            if result.tools or result.confidence_score > 0.3:
-                return result
-        except Exception as e:
-            self.logger.warning(
-                "Primary strategy failed",
-                strategy=self.primary_strategy,
-                error=str(e),
-            )
+        """Select tools using the configured strategy with fallback.
 
-        # Try fallback strategy if different
-        if self.fallback_strategy != self.primary_strategy:
-            try:
-                router = self.routers[self.fallback_strategy]
-                result = await router.select_tools_with_metrics(
-                    context, available_tools
+        If the primary strategy hasn't finished within ``strategy.hedge_ms``,
+        the fallback strategy is started alongside it and whichever produces
+        a usable result first wins. The primary result is preferred when both
+        are done.
+        """
+        primary_task = asyncio.create_task(
+            self._try_strategy(self.primary_strategy, context, available_tools)
+        )
+        fallback_task = None
+
+        try:
+            if self.fallback_strategy != self.primary_strategy:
+                hedge_delay = self.config.strategy.hedge_ms / 1000
+                done, _ = await asyncio.wait(
+                    {primary_task}, timeout=hedge_delay or None
                 )
-                result.metadata["used_fallback"] = True
+                if not done:
+                    self.logger.debug(
+                        "Primary strategy slow, starting fallback",
+                        strategy=self.primary_strategy,
+                    )
+                    fallback_task = asyncio.create_task(
+                        self._try_strategy(
+                            self.fallback_strategy, context, available_tools
+                        )
+                    )
+                    await asyncio.wait(
+                        {primary_task, fallback_task},
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+
+            # Fallback finished first with a result
+            if fallback_task and not primary_task.done():
+                result = fallback_task.result()
+                if result is not None:
+                    result.metadata["used_fallback"] = True
+                    return result
+
+            result = await primary_task
+            if result is not None and (result.tools or result.confidence_score > 0.3):
                 return result
-            except Exception as e:
-                self.logger.error(
-                    "Fallback strategy failed",
-                    strategy=self.fallback_strategy,
-                    error=str(e),
-                )
+
+            # Try fallback strategy if different
+            if self.fallback_strategy != self.primary_strategy:
+                if fallback_task is None:
+                    fallback_task = asyncio.create_task(
+                        self._try_strategy(
+                            self.fallback_strategy, context, available_tools
+                        )
+                    )
+                result = await fallback_task
+                if result is not None:
+                    result.metadata["used_fallback"] = True
+                    return result
+
+        finally:
+            # Cancel whichever strategy lost the race
+            for task in (primary_task, fallback_task):
+                if task is not None and not task.done():
+                    task.cancel()
 
         # Final fallback - return all tools limited by max_tools
         from ..routing.base import FallbackRouter
@@ -99,6 +152,31 @@ class RoutingEngine:
         await fallback_router.initialize()
         return await fallback_router.select_tools_with_metrics(context, available_tools)
 
+    async def _try_strategy(
+        self, strategy: str, context: SelectionContext, available_tools: list[Tool]
+    ) -> Any | None:
+        """Run a routing strategy, logging failures.
+
+        Args:
+            strategy: Name of the routing strategy.
+            context: Selection context.
+            available_tools: Tools to select from.
+
+        Returns:
+            Selection result, or None if the strategy failed.
+        """
+        try:
+            router = self.routers[strategy]
+            return await router.select_tools_with_metrics(context, available_tools)
+        except Exception as e:
+            self.logger.warning(
+                "Routing strategy failed",
+                strategy=strategy,
+                fallback=strategy != self.primary_strategy,
+                error=str(e),
+            )
+            return None
+
     async def cleanup(self) -> None:
         """Clean up all routers."""
         for router in self.routers.values():
@@ -113,10 +191,16 @@ class MetaMCPServer:
         self.config_path = config_path
         self.logger = get_logger(__name__)
         self._running = False
+        self._tools_ready = False
         self._shutdown_event = asyncio.Event()
         self._start_time = time.time()
         self._total_requests = 0
-        self._total_response_time = 0.0
+        self._error_count = 0
+        self._latency = LatencyTracker()
+        self.admission = AdmissionController(
+            max_p95_ms=config.server.max_p95_latency_ms,
+            max_drain_ms=config.server.max_queue_drain_ms,
+        )
 
         # Core components
         self.child_manager: ChildServerManager | None = None
@@ -130,6 +214,16 @@ class MetaMCPServer:
         # State
         self.available_tools: list[Tool] = []
 
+    @property
+    def _avg_response_time(self) -> float:
+        """Moving average of tool call latency in milliseconds."""
+        return self._latency.ema_ms
+
+    @property
+    def p95_response_time(self) -> float:
+        """95th percentile of recent tool call latency in milliseconds."""
+        return self._latency.percentile(95)
+
     async def initialize(self) -> None:
         """Initialize all server components."""
         self.logger.info("Initializing Meta MCP Server")
@@ -166,15 +260,18 @@ class MetaMCPServer:
             self.child_manager = ChildServerManager(self.config)
             await self.child_manager.initialize()
 
-            # Update available tools and their embeddings
-            await self._update_available_tools()
+            # Update available tools and their embeddings while the web
+            # interface starts up
+            startup_tasks = [self._update_available_tools()]
 
             # Initialize web interface
             if self.config.web_ui.enabled:
                 self.web_interface = GradioWebInterface(self.config, self)
                 if self.config_path:
                     self.web_interface.set_config_path(self.config_path)
-                await self.web_interface.start()
+                startup_tasks.append(self.web_interface.start())
+
+            await asyncio.gather(*startup_tasks)
 
             self.logger.info("Meta MCP Server initialized successfully")
 
@@ -196,6 +293,7 @@ class MetaMCPServer:
                 vector_router = self.routing_engine.routers["vector"]
                 await vector_router.update_tool_embeddings(self.available_tools)
 
+            self._tools_ready = True
             self.logger.info(f"Updated {len(self.available_tools)} available tools")
 
         except Exception as e:
@@ -303,7 +401,8 @@ class MetaMCPServer:
             if self.embedding_service:
                 await self.embedding_service.cleanup()
 
-            # Vector store doesn't need explicit cleanup for Qdrant client
+            if self.vector_store:
+                await self.vector_store.cleanup()
 
         except Exception as e:
             self.logger.error("Error during shutdown", error=str(e))
@@ -329,6 +428,9 @@ class MetaMCPServer:
 
         Returns:
             List of selected tools.
+
+        Raises:
+            OverloadError: If the server is shedding load.
         """
         if not self.routing_engine:
             return self.available_tools[: self.config.strategy.max_tools]
@@ -342,9 +444,10 @@ class MetaMCPServer:
         )
 
         # Select tools using routing engine
-        result = await self.routing_engine.select_tools(
-            selection_context, self.available_tools
-        )
+        with self.admission.admit():
+            result = await self.routing_engine.select_tools(
+                selection_context, self.available_tools
+            )
 
         # Log selection result
         self.logger.info(
@@ -366,8 +469,17 @@ class MetaMCPServer:
 
         Returns:
             Tool execution result.
+
+        Raises:
+            OverloadError: If the server is shedding load.
         """
-        start_time = time.time()
+        try:
+            self.admission.acquire()
+        except OverloadError:
+            self.logger.warning("Tool call rejected", tool=tool_name)
+            raise
+
+        start_time = time.perf_counter()
         self._total_requests += 1
 
         try:
@@ -380,9 +492,7 @@ class MetaMCPServer:
             result = await self.child_manager.call_tool(tool_name, arguments)
 
             # Update metrics
-            response_time = (time.time() - start_time) * 1000
-            self._total_response_time += response_time
-            self._avg_response_time = self._total_response_time / self._total_requests
+            self._latency.record((time.perf_counter() - start_time) * 1000)
 
             # Update tool usage statistics
             if self.routing_engine and "vector" in self.routing_engine.routers:
@@ -391,7 +501,7 @@ class MetaMCPServer:
                 for tool in self.available_tools:
                     if tool.id == tool_name:
                         tool.usage_count += 1
-                        tool.last_used = time.strftime("%Y-%m-%dT%H:%M:%SZ")
+                        tool.last_used = _utc_timestamp()
                         await vector_router.update_tool_usage(
                             tool.id, tool.usage_count, tool.last_used
                         )
@@ -400,9 +510,13 @@ class MetaMCPServer:
             return result
 
         except Exception as e:
+            self._error_count += 1
             self.logger.error("Tool call failed", tool=tool_name, error=str(e))
             raise
 
+        finally:
+            self.admission.release((time.perf_counter() - start_time) * 1000)
+
     def get_status(self) -> dict:
         """Get server status information.
 
@@ -411,6 +525,7 @@ class MetaMCPServer:
         """
         return {
             "running": self._running,
+            "ready": self._tools_ready,
             "config": {
                 "strategy": self.config.strategy.primary,
                 "fallback_strategy": self.config.strategy.fallback,
@@ -431,11 +546,12 @@ class MetaMCPServer:
             },
             "performance": {
                 "total_requests": self._total_requests,
-                "avg_response_time_ms": round(
-                    getattr(self, "_avg_response_time", 0.0), 2
-                ),
+                "avg_response_time_ms": round(self._avg_response_time, 2),
+                "p95_response_time_ms": round(self.p95_response_time, 2),
+                "error_count": self._error_count,
                 "uptime_seconds": int(time.time() - self._start_time),
             },
+            "admission": self.admission.get_status(),
         }
 
     async def get_metrics(self) -> dict:
@@ -446,7 +562,9 @@ class MetaMCPServer:
         """
         base_metrics = {
             "total_requests": self._total_requests,
-            "avg_response_time_ms": round(getattr(self, "_avg_response_time", 0.0), 2),
+            "avg_response_time_ms": round(self._avg_response_time, 2),
+            "p95_response_time_ms": round(self.p95_response_time, 2),
+            "error_count": self._error_count,
             "uptime_seconds": int(time.time() - self._start_time),
             "active_connections": 0,  # Not applicable for Gradio
         }
@@ -5,21 +5,33 @@ Ensures Qdrant is running and healthy before starting the server
 """
 
 import atexit
+import importlib
+import json
 import logging
 import os
 import signal
+import socket
 import subprocess
 import sys
+import threading
 import time
+from collections.abc import Callable
 from pathlib import Path
+from typing import TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter
 
 # Disable tokenizer parallelism warning
 os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
 
 logger = logging.getLogger(__name__)
 
+RUNTIME_CACHE_FILE = Path.home() / ".cache" / "meta-mcp" / "runtime.json"
+RUNTIME_SCRIPTS = ("detect-container-runtime.sh", "get-qdrant-ip.sh")
+
+T = TypeVar("T")
+
 
 class MetaMCPWrapper:
     """Wrapper that ensures all dependencies are running"""
@@ -31,34 +43,143 @@ class MetaMCPWrapper:
         self.qdrant_host = "localhost"
         self.qdrant_port = 6333
         self.runtime = None
+        # Health probes reuse one keep-alive connection and fail without retries
+        self._probe_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=0)
+        self._probe_session.mount("http://", adapter)
+        self.runtime_cache_file = RUNTIME_CACHE_FILE
+
+    def _script_mtimes(self) -> dict[str, float | None]:
+        """Get modification times of the runtime helper scripts"""
+        mtimes = {}
+        for name in RUNTIME_SCRIPTS:
+            try:
+                mtimes[name] = (self.scripts_dir / name).stat().st_mtime
+            except OSError:
+                mtimes[name] = None
+        return mtimes
+
+    def _load_runtime_cache(self) -> tuple[str | None, str | None]:
+        """Load the cached runtime and Qdrant host if the scripts are unchanged"""
+        try:
+            cache = json.loads(self.runtime_cache_file.read_text())
+        except (OSError, ValueError):
+            return None, None
+
+        if cache.get("script_mtimes") != self._script_mtimes():
+            return None, None
+        return cache.get("runtime"), cache.get("host")
+
+    def _save_runtime_cache(self, runtime: str, host: str | None = None) -> None:
+        """Persist the detected runtime and Qdrant host"""
+        cache = {
+            "runtime": runtime,
+            "host": host,
+            "script_mtimes": self._script_mtimes(),
+        }
+        try:
+            self.runtime_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self.runtime_cache_file.write_text(json.dumps(cache))
+        except OSError as e:
+            logger.debug(f"Failed to write runtime cache: {e}")
 
-    def detect_runtime(self) -> str:
-        """Detect available container runtime"""
+    def _clear_runtime_cache(self) -> None:
+        """Forget the cached runtime and Qdrant host"""
+        try:
+            self.runtime_cache_file.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"Failed to remove runtime cache: {e}")
+
+    def _run_script(self, name: str, timeout: float = 5.0) -> str | None:
+        """Run a helper script and return its output, or None if it failed"""
         try:
             result = subprocess.run(
-                [str(self.scripts_dir / "detect-container-runtime.sh")],
+                [str(self.scripts_dir / name)],
                 capture_output=True,
                 text=True,
+                timeout=timeout,
             )
-            runtime = result.stdout.strip()
-            if runtime in ["docker", "apple"]:
-                return runtime
-        except Exception as e:
-            logger.error(f"Failed to detect runtime: {e}")
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug(f"Failed to run {name}: {e}")
+            return None
+
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip() or None
+
+    def detect_runtime(self) -> str:
+        """Detect available container runtime"""
+        cached_runtime, _ = self._load_runtime_cache()
+        if cached_runtime in ["docker", "apple"]:
+            return cached_runtime
+
+        runtime = self._run_script("detect-container-runtime.sh")
+        if runtime in ["docker", "apple"]:
+            self._save_runtime_cache(runtime)
+            return runtime
+
+        logger.error("Failed to detect container runtime")
         return "none"
 
-    def check_qdrant_health(self, host: str | None = None) -> bool:
-        """Check if Qdrant is healthy"""
-        if host is None:
-            host = self.qdrant_host
+    def _tcp_probe(self, host: str, timeout: float = 0.2) -> bool:
+        """Check if the Qdrant port accepts connections"""
         try:
-            response = requests.get(
-                f"http://{host}:{self.qdrant_port}/collections", timeout=2
+            with socket.create_connection((host, self.qdrant_port), timeout=timeout):
+                return True
+        except OSError:
+            return False
+
+    def _http_probe(self, host: str) -> bool:
+        """Check if Qdrant answers API requests"""
+        try:
+            response = self._probe_session.get(
+                f"http://{host}:{self.qdrant_port}/collections", timeout=(0.5, 1.0)
             )
             return response.status_code == 200
         except Exception:
             return False
 
+    def check_qdrant_health(self, host: str | None = None) -> bool:
+        """Check if Qdrant is healthy"""
+        if host is None:
+            host = self.qdrant_host
+        # The TCP probe fails fast when nothing is listening yet
+        return self._tcp_probe(host) and self._http_probe(host)
+
+    def _poll(self, probe: Callable[[], T | None], timeout: float) -> T | None:
+        """Call a probe until it returns a result, backing off between calls"""
+        delay = 0.05
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            result = probe()
+            if result:
+                return result
+            time.sleep(delay)
+            delay = min(delay * 1.7, 1.0)
+        return None
+
+    def wait_for_qdrant(self, host: str, timeout: float = 20.0) -> bool:
+        """Wait for Qdrant to become healthy"""
+        return bool(self._poll(lambda: self.check_qdrant_health(host), timeout))
+
+    def wait_for_apple_qdrant(self, timeout: float = 20.0) -> str | None:
+        """Wait for the Apple container to get an IP and Qdrant to become healthy
+
+        The container IP is only assigned once it is running, so the IP lookup
+        is retried inside the same polling loop as the health check.
+        """
+        host = None
+
+        def probe() -> str | None:
+            nonlocal host
+            if host is None:
+                host = self._run_script("get-qdrant-ip.sh")
+            if host and self.check_qdrant_health(host):
+                return host
+            return None
+
+        return self._poll(probe, timeout)
+
     def start_qdrant_docker(self) -> tuple[bool, str]:
         """Start Qdrant using Docker"""
         logger.info("Starting Qdrant with Docker...")
@@ -77,13 +198,11 @@ class MetaMCPWrapper:
             )
 
             # Wait for startup
-            for _ in range(30):
-                if self.check_qdrant_health("localhost"):
-                    logger.info("Qdrant started successfully")
-                    return True, "localhost"
-                time.sleep(1)
+            if self.wait_for_qdrant("localhost"):
+                logger.info("Qdrant started successfully")
+                return True, "localhost"
 
-        except subprocess.CalledProcessError as e:
+        except (OSError, subprocess.CalledProcessError) as e:
             logger.error(f"Failed to start Qdrant with Docker: {e}")
 
         return False, ""
@@ -92,20 +211,18 @@ class MetaMCPWrapper:
         """Start Qdrant using Apple Container"""
         logger.info("Starting Qdrant with Apple Container...")
 
+        # Try the host from the last run before shelling out
+        _, cached_host = self._load_runtime_cache()
+        if cached_host and self.check_qdrant_health(cached_host):
+            logger.info(f"Qdrant already running on {cached_host}")
+            return True, cached_host
+
         # Get container IP if running
-        try:
-            result = subprocess.run(
-                [str(self.scripts_dir / "get-qdrant-ip.sh")],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                host = result.stdout.strip()
-                if self.check_qdrant_health(host):
-                    logger.info(f"Qdrant already running on {host}")
-                    return True, host
-        except Exception:
-            pass
+        host = self._run_script("get-qdrant-ip.sh")
+        if host and self.check_qdrant_health(host):
+            logger.info(f"Qdrant already running on {host}")
+            self._save_runtime_cache("apple", host)
+            return True, host
 
         # Start container
         try:
@@ -114,25 +231,26 @@ class MetaMCPWrapper:
                 check=True,
             )
 
-            # Get IP after starting
-            result = subprocess.run(
-                [str(self.scripts_dir / "get-qdrant-ip.sh")],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                host = result.stdout.strip()
-                if self.check_qdrant_health(host):
-                    logger.info(f"Qdrant started successfully on {host}")
-                    return True, host
+            host = self.wait_for_apple_qdrant()
+            if host:
+                logger.info(f"Qdrant started successfully on {host}")
+                self._save_runtime_cache("apple", host)
+                return True, host
 
-        except subprocess.CalledProcessError as e:
+        except (OSError, subprocess.CalledProcessError) as e:
             logger.error(f"Failed to start Qdrant with Apple Container: {e}")
 
         return False, ""
 
+    def start_qdrant(self, runtime: str) -> tuple[bool, str]:
+        """Start Qdrant with the given runtime"""
+        if runtime == "docker":
+            return self.start_qdrant_docker()
+        return self.start_qdrant_apple()
+
     def ensure_qdrant(self) -> bool:
         """Ensure Qdrant is running and healthy"""
+        cached_runtime, _ = self._load_runtime_cache()
         self.runtime = self.detect_runtime()
 
         if self.runtime == "none":
@@ -141,12 +259,18 @@ class MetaMCPWrapper:
             return False
 
         logger.info(f"Using {self.runtime} runtime")
-
-        # Start Qdrant based on runtime
-        if self.runtime == "docker":
-            success, host = self.start_qdrant_docker()
-        else:
-            success, host = self.start_qdrant_apple()
+        success, host = self.start_qdrant(self.runtime)
+
+        # A cached runtime may have been uninstalled or replaced since it was
+        # detected, so detect again before giving up
+        if not success and self.runtime == cached_runtime:
+            logger.warning(f"Cached {self.runtime} runtime failed, re-detecting")
+            self._clear_runtime_cache()
+            runtime = self.detect_runtime()
+            if runtime not in ("none", self.runtime):
+                logger.info(f"Using {runtime} runtime")
+                self.runtime = runtime
+                success, host = self.start_qdrant(runtime)
 
         if success:
             self.qdrant_host = host
@@ -156,6 +280,23 @@ class MetaMCPWrapper:
 
         return False
 
+    def warm_server_imports(self) -> threading.Thread:
+        """Import the server modules in the background while Qdrant starts
+
+        The exec'd server imports everything again, but by then the bytecode
+        caches are written and the files are in the OS page cache.
+        """
+
+        def warm():
+            try:
+                importlib.import_module("meta_mcp.main")
+            except Exception as e:
+                logger.debug(f"Failed to pre-import server modules: {e}")
+
+        thread = threading.Thread(target=warm, name="import-warmup", daemon=True)
+        thread.start()
+        return thread
+
     def cleanup(self):
         """Cleanup function called on exit"""
         # We don't stop Qdrant on exit - it should persist
@@ -174,6 +315,10 @@ class MetaMCPWrapper:
         signal.signal(signal.SIGTERM, lambda s, f: sys.exit(0))
         signal.signal(signal.SIGINT, lambda s, f: sys.exit(0))
 
+        # Overlap the server's import time with the Qdrant startup wait. The
+        # thread isn't joined: exec replaces it, and a partial warm-up helps.
+        self.warm_server_imports()
+
         # Ensure Qdrant is running
         if not self.ensure_qdrant():
             logger.error("Failed to ensure Qdrant is running")
@@ -181,17 +326,18 @@ class MetaMCPWrapper:
 
         logger.info(f"Qdrant is healthy at {self.qdrant_host}:{self.qdrant_port}")
 
-        # Import and run the actual server
+        # Replace this process with the server so the wrapper's interpreter
+        # doesn't stay resident. exec skips atexit handlers, so run cleanup
+        # and flush output explicitly first.
+        self.cleanup()
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        argv = [sys.executable, "-m", "meta_mcp.main", *sys.argv[1:]]
         try:
-            from meta_mcp.cli import app
-
-            # The CLI will handle all arguments
-            app()
-        except KeyboardInterrupt:
-            logger.info("Received interrupt signal")
-            sys.exit(0)
-        except Exception as e:
-            logger.error(f"Server error: {e}", exc_info=True)
+            os.execv(sys.executable, argv)
+        except OSError as e:
+            logger.error(f"Failed to start server: {e}")
             sys.exit(1)
 
 
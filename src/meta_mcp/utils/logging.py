@@ -1,13 +1,43 @@
 """Logging configuration and utilities."""
 
+import atexit
 import logging
 import logging.handlers
+import queue
 from pathlib import Path
 
 from rich.logging import RichHandler
 
 from ..config.models import LoggingConfig
 
+# Background listener that writes queued records to the real handlers
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
+class StructuredDataFilter(logging.Filter):
+    """Appends a record's structured data to its message.
+
+    Runs on the handlers behind the queue listener, so the key=value text is
+    only built for records that are actually emitted, off the caller's thread.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Render structured data into the record message.
+
+        Args:
+            record: Log record to format.
+
+        Returns:
+            Always True, records are never dropped.
+        """
+        # Popped so the record is only rendered once across handlers
+        structured = record.__dict__.pop("structured", None)
+        if structured:
+            extra_data = " | ".join(f"{k}={v}" for k, v in structured.items())
+            record.msg = f"{record.getMessage()} | {extra_data}"
+            record.args = None
+        return True
+
 
 def setup_logging(config: LoggingConfig) -> None:
     """Configure logging based on the provided configuration.
@@ -15,12 +45,17 @@ def setup_logging(config: LoggingConfig) -> None:
     Args:
         config: Logging configuration object.
     """
+    level = getattr(logging, config.level.upper())
+
     # Create root logger
     logger = logging.getLogger()
-    logger.setLevel(getattr(logging, config.level.upper()))
+    logger.setLevel(level)
 
     # Clear any existing handlers
+    stop_logging()
     logger.handlers.clear()
+    handlers: list[logging.Handler] = []
+    structured_filter = StructuredDataFilter()
 
     # Console handler with Rich formatting
     if config.console:
@@ -29,12 +64,13 @@ def setup_logging(config: LoggingConfig) -> None:
             show_time=True,
             show_path=True,
         )
-        console_handler.setLevel(getattr(logging, config.level.upper()))
+        console_handler.setLevel(level)
+        console_handler.addFilter(structured_filter)
 
         # Format for console
         console_formatter = logging.Formatter("%(name)s: %(message)s")
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # File handler with rotation
     if config.file:
@@ -47,7 +83,8 @@ def setup_logging(config: LoggingConfig) -> None:
             backupCount=config.max_files,
             encoding="utf-8",
         )
-        file_handler.setLevel(getattr(logging, config.level.upper()))
+        file_handler.setLevel(level)
+        file_handler.addFilter(structured_filter)
 
         # Detailed format for file
         file_formatter = logging.Formatter(
@@ -55,7 +92,18 @@ def setup_logging(config: LoggingConfig) -> None:
             datefmt="%Y-%m-%d %H:%M:%S",
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Callers only enqueue records; console and file writes (including log
+    # rotation) happen on the listener thread
+    if handlers:
+        global _queue_listener
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
 
     # Set levels for noisy libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -64,35 +112,49 @@ def setup_logging(config: LoggingConfig) -> None:
     logging.getLogger("asyncio").setLevel(logging.INFO)
 
 
+def stop_logging() -> None:
+    """Flush queued log records and stop the background listener."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(stop_logging)
+
+
 class StructuredLogger:
     """Structured logger for the Meta MCP Server."""
 
     def __init__(self, name: str):
         self.logger = logging.getLogger(name)
 
+    def _log(self, level: int, message: str, kwargs: dict) -> None:
+        """Log a message with structured data if the level is enabled."""
+        # Skip creating the record entirely for disabled levels
+        if not self.logger.isEnabledFor(level):
+            return
+
+        # Structured data is rendered by StructuredDataFilter when emitted.
+        # stacklevel attributes the record to the caller, not this wrapper.
+        extra = {"structured": kwargs} if kwargs else None
+        self.logger.log(level, message, extra=extra, stacklevel=3)
+
     def info(self, message: str, **kwargs) -> None:
         """Log info message with structured data."""
-        extra_data = " | ".join(f"{k}={v}" for k, v in kwargs.items())
-        full_message = f"{message} | {extra_data}" if extra_data else message
-        self.logger.info(full_message)
+        self._log(logging.INFO, message, kwargs)
 
     def error(self, message: str, **kwargs) -> None:
         """Log error message with structured data."""
-        extra_data = " | ".join(f"{k}={v}" for k, v in kwargs.items())
-        full_message = f"{message} | {extra_data}" if extra_data else message
-        self.logger.error(full_message)
+        self._log(logging.ERROR, message, kwargs)
 
     def warning(self, message: str, **kwargs) -> None:
         """Log warning message with structured data."""
-        extra_data = " | ".join(f"{k}={v}" for k, v in kwargs.items())
-        full_message = f"{message} | {extra_data}" if extra_data else message
-        self.logger.warning(full_message)
+        self._log(logging.WARNING, message, kwargs)
 
     def debug(self, message: str, **kwargs) -> None:
         """Log debug message with structured data."""
-        extra_data = " | ".join(f"{k}={v}" for k, v in kwargs.items())
-        full_message = f"{message} | {extra_data}" if extra_data else message
-        self.logger.debug(full_message)
+        self._log(logging.DEBUG, message, kwargs)
 
 
 def get_logger(name: str) -> StructuredLogger:
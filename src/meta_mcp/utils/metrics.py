@@ -0,0 +1,47 @@
+"""Lightweight performance metric helpers."""
+
+import numpy as np
+
+
+class LatencyTracker:
+    """Tracks an exponential moving average and recent latency percentiles.
+
+    Latencies are kept in a fixed-size ring buffer, so recording is O(1)
+    and percentiles reflect only the most recent ``window`` samples.
+    """
+
+    def __init__(self, alpha: float = 0.1, window: int = 1024):
+        self.alpha = alpha
+        self.ema_ms = 0.0
+        self.count = 0
+        self._window = np.zeros(window, dtype=np.float32)
+
+    def record(self, latency_ms: float) -> None:
+        """Record a latency sample.
+
+        Args:
+            latency_ms: Latency in milliseconds.
+        """
+        if self.count == 0:
+            # Seed the average so early readings aren't biased towards zero
+            self.ema_ms = latency_ms
+        else:
+            self.ema_ms += self.alpha * (latency_ms - self.ema_ms)
+
+        self._window[self.count % len(self._window)] = latency_ms
+        self.count += 1
+
+    def percentile(self, q: float) -> float:
+        """Get a latency percentile over the recent window.
+
+        Args:
+            q: Percentile between 0 and 100.
+
+        Returns:
+            Latency in milliseconds, or 0.0 if nothing was recorded.
+        """
+        if not self.count:
+            return 0.0
+
+        samples = self._window[: min(self.count, len(self._window))]
+        return float(np.percentile(samples, q))
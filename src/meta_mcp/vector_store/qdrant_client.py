@@ -1,16 +1,92 @@
 """Qdrant vector store client for storing and searching tool embeddings."""
 
 import asyncio
-import uuid
+import hashlib
+import logging
+import random
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from itertools import islice
 from typing import Any
 
-from qdrant_client import QdrantClient
+import grpc
+import httpx
+import numpy as np
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.http import models
 from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
 
 from ..config.models import MetaMCPConfig, Tool
 from ..utils.logging import get_logger
 
+# Vectors are kept in RAM as int8; searches oversample and rescore the
+# candidates against the original float32 vectors to keep ranking accurate.
+# Binary quantization loses too much recall at 384 dimensions.
+VECTOR_QUANTIZATION = models.ScalarQuantization(
+    scalar=models.ScalarQuantizationConfig(
+        type=models.ScalarType.INT8,
+        quantile=0.99,
+        always_ram=True,
+    )
+)
+QUANTIZED_SEARCH_PARAMS = models.SearchParams(
+    quantization=models.QuantizationSearchParams(rescore=True, oversampling=2.0)
+)
+
+# The tools collection is created with indexing disabled so the initial bulk
+# load doesn't rebuild the HNSW graph per batch; this re-enables it afterwards
+TOOLS_INDEXING_THRESHOLD = 20000  # KB of vectors before an HNSW index is built
+TOOLS_BULK_LOAD_OPTIMIZERS = models.OptimizersConfigDiff(indexing_threshold=0)
+
+# Points sent per upsert request, and upsert requests in flight at once
+UPLOAD_BATCH_SIZE = 256
+UPLOAD_CONCURRENCY = 4
+
+# Attempts per write, with full-jitter backoff starting from the base delay
+WRITE_ATTEMPTS = 5
+WRITE_RETRY_BASE_DELAY = 0.5
+
+# Errors worth retrying: Qdrant is overloaded, restarting or timed out
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+RETRYABLE_GRPC_CODES = {
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+}
+
+# Payload fields document searches return; anything else stored with a
+# chunk stays on the server
+DOCUMENT_PAYLOAD = models.PayloadSelectorInclude(
+    include=["text", "source", "metadata", "chunk_index"]
+)
+
+# Minimum seconds between diagnostic searches for queries with no results
+DEBUG_SEARCH_INTERVAL = 60.0
+
+# Seconds collection info is reused for, so status polling doesn't hit Qdrant
+COLLECTION_INFO_TTL = 2.0
+
+# Tool searches whose results are kept, keyed on the exact query and filters
+SEARCH_CACHE_SIZE = 256
+
+
+def _is_transient(error: Exception) -> bool:
+    """Check whether a failed Qdrant request may succeed if retried."""
+    if isinstance(error, ResponseHandlingException | TimeoutError):
+        return True
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code in RETRYABLE_STATUS_CODES
+    if isinstance(error, grpc.aio.AioRpcError):
+        return error.code() in RETRYABLE_GRPC_CODES
+    return False
+
+
+def _stable_point_id(key: str) -> int:
+    """Hash a string to a positive 63-bit Qdrant point ID."""
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") & 0x7FFFFFFFFFFFFFFF
+
 
 class QdrantVectorStore:
     """Qdrant vector database client for tool embeddings."""
@@ -18,41 +94,91 @@ class QdrantVectorStore:
     def __init__(self, config: MetaMCPConfig):
         self.config = config.vector_store
         self.logger = get_logger(__name__)
-        self.client: QdrantClient | None = None
+        self.client: AsyncQdrantClient | None = None
         self.tools_collection = f"{self.config.collection_prefix}_tools"
         self.docs_collection = f"{self.config.collection_prefix}_docs"
+        self._last_debug_search = float("-inf")
+        self._debug_search_task: asyncio.Task[None] | None = None
+        self._info_cache: tuple[float, dict[str, Any]] | None = None
+        # LRU cache of tool search results, cleared whenever tools change;
+        # the generation counts the clears
+        self._search_cache: OrderedDict[bytes, list[dict[str, Any]]] = OrderedDict()
+        self._search_generation = 0
 
     @staticmethod
     def _get_tool_point_id(tool_id: str) -> int:
         """Generate a valid Qdrant point ID from tool ID.
 
+        The ID is derived from a BLAKE2b digest, so it is stable across
+        processes (unlike ``hash()``, which is randomized per interpreter).
+
         Args:
             tool_id: Tool identifier string.
 
         Returns:
-            Positive integer suitable for use as Qdrant point ID.
+            Positive 63-bit integer suitable for use as Qdrant point ID.
         """
-        return abs(hash(tool_id))
+        return _stable_point_id(tool_id)
+
+    @staticmethod
+    def _get_chunk_point_id(source: str, chunk_index: int, text: str) -> int:
+        """Generate a point ID from a document chunk's content.
+
+        Re-indexing the same document overwrites its chunks instead of
+        adding duplicates.
+
+        Args:
+            source: Source identifier of the document.
+            chunk_index: Position of the chunk within the document.
+            text: Chunk text.
+
+        Returns:
+            Positive 63-bit integer suitable for use as Qdrant point ID.
+        """
+        return _stable_point_id(f"{source}|{chunk_index}|{text}")
+
+    def _require_client(self) -> AsyncQdrantClient:
+        """Get the Qdrant client.
+
+        Returns:
+            The client created by ``initialize``.
+
+        Raises:
+            RuntimeError: If the store hasn't been initialized.
+        """
+        if self.client is None:
+            raise RuntimeError("Qdrant vector store is not initialized")
+        return self.client
 
     async def initialize(self) -> None:
         """Initialize Qdrant client and create collections."""
         self.logger.info("Initializing Qdrant vector store")
 
         try:
-            # Create client
+            # Native asyncio client: requests run on the event loop
+            # instead of hopping to a worker thread. The REST pool keeps
+            # connections alive for when gRPC is disabled or unavailable.
+            connection_args: dict[str, Any] = {
+                "grpc_port": self.config.grpc_port,
+                "prefer_grpc": self.config.prefer_grpc,
+                "timeout": self.config.timeout,
+                "limits": httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_connections,
+                ),
+            }
             if self.config.url:
-                self.client = QdrantClient(url=self.config.url)
+                self.client = AsyncQdrantClient(url=self.config.url, **connection_args)
             else:
-                self.client = QdrantClient(
-                    host=self.config.host,
-                    port=self.config.port,
+                self.client = AsyncQdrantClient(
+                    host=self.config.host, port=self.config.port, **connection_args
                 )
 
             # Test connection
-            await self._test_connection()
+            existing = await self._test_connection()
 
             # Create collections if they don't exist
-            await self._ensure_collections()
+            await self._ensure_collections(existing)
 
             self.logger.info(
                 "Qdrant vector store initialized",
@@ -66,93 +192,306 @@ class QdrantVectorStore:
             self.logger.error("Failed to initialize Qdrant", error=str(e))
             raise
 
-    async def _test_connection(self) -> None:
-        """Test Qdrant connection."""
+    async def _test_connection(self) -> set[str]:
+        """Test Qdrant connection.
 
-        def test():
-            return self.client.get_collections()
-
-        collections = await asyncio.get_event_loop().run_in_executor(None, test)
+        Returns:
+            Names of the existing collections.
+        """
+        collections = await self._require_client().get_collections()
         self.logger.debug(
             f"Qdrant connection successful, found {len(collections.collections)} collections"
         )
+        return {collection.name for collection in collections.collections}
 
-    async def _ensure_collections(self) -> None:
-        """Create collections if they don't exist."""
+    async def _ensure_collections(self, existing: set[str] | None = None) -> None:
+        """Create collections if they don't exist.
 
-        def create_collection_if_not_exists(collection_name: str, vector_size: int):
-            try:
-                self.client.get_collection(collection_name)
-                self.logger.debug(f"Collection {collection_name} already exists")
-            except (ResponseHandlingException, UnexpectedResponse) as e:
-                # Collection doesn't exist, create it
-                if "doesn't exist" in str(e) or "Not found" in str(e):
-                    self.client.create_collection(
+        Args:
+            existing: Names of the existing collections, if already known.
+                Fetched with a single request otherwise.
+        """
+        if existing is None:
+            collections = await self._require_client().get_collections()
+            existing = {collection.name for collection in collections.collections}
+
+        async def create_collection_if_not_exists(
+            collection_name: str,
+            vector_size: int,
+            distance: models.Distance,
+            indexed_field: str,
+            quantization_config: models.QuantizationConfig | None = None,
+            optimizers_config: models.OptimizersConfigDiff | None = None,
+            on_disk: bool = False,
+        ):
+            async def create() -> None:
+                # On-disk collections memory-map their vectors, HNSW graph
+                # and payloads; quantized vectors still stay in RAM
+                await self._require_client().create_collection(
+                    collection_name=collection_name,
+                    vectors_config=models.VectorParams(
+                        size=vector_size,
+                        distance=distance,
+                        on_disk=on_disk,
+                    ),
+                    hnsw_config=models.HnswConfigDiff(on_disk=on_disk),
+                    on_disk_payload=on_disk,
+                    quantization_config=quantization_config,
+                    optimizers_config=optimizers_config,
+                )
+
+            payload_schema: dict[str, Any] = {}
+
+            if collection_name not in existing:
+                await create()
+                self.logger.info(f"Created collection: {collection_name}")
+            else:
+                info = await self._require_client().get_collection(collection_name)
+                payload_schema = info.payload_schema
+                existing_distance = getattr(
+                    info.config.params.vectors, "distance", distance
+                )
+                if existing_distance != distance:
+                    # Migrate collections created with an older distance metric.
+                    # Tool points are re-upserted from child servers on startup.
+                    await self._require_client().delete_collection(collection_name)
+                    await create()
+                    payload_schema = {}
+                    self.logger.info(
+                        f"Recreated collection {collection_name} "
+                        f"with {distance} distance",
+                        previous_distance=existing_distance,
+                    )
+                elif quantization_config and info.config.quantization_config is None:
+                    # Enable quantization on collections created before it was used
+                    await self._require_client().update_collection(
                         collection_name=collection_name,
-                        vectors_config=models.VectorParams(
-                            size=vector_size,
-                            distance=models.Distance.COSINE,
-                        ),
+                        quantization_config=quantization_config,
                     )
-                    self.logger.info(f"Created collection: {collection_name}")
+                    self.logger.info(f"Enabled quantization on {collection_name}")
                 else:
-                    # Re-raise if it's a different error
-                    raise
+                    self.logger.debug(f"Collection {collection_name} already exists")
+
+            # Index the field searches filter on, so filtered queries don't
+            # scan the payload of every candidate point
+            if indexed_field not in payload_schema:
+                await self._require_client().create_payload_index(
+                    collection_name=collection_name,
+                    field_name=indexed_field,
+                    field_schema=models.PayloadSchemaType.KEYWORD,
+                )
+                self.logger.debug(
+                    f"Created payload index on {collection_name}.{indexed_field}"
+                )
 
-        # Create collections with default vector sizes
-        # Tools collection (for tool embeddings)
-        await asyncio.get_event_loop().run_in_executor(
-            None, create_collection_if_not_exists, self.tools_collection, 384
+        # Create collections with default vector sizes, both at once
+        await asyncio.gather(
+            # Tools collection (for tool embeddings). Tool and query vectors
+            # are normalized to unit length, so dot product equals cosine.
+            create_collection_if_not_exists(
+                self.tools_collection,
+                384,
+                models.Distance.DOT,
+                "server_name",
+                VECTOR_QUANTIZATION,
+                TOOLS_BULK_LOAD_OPTIMIZERS,
+            ),
+            # Documents collection (for RAG documentation). It can grow much
+            # larger than the tools collection but is queried less often, so
+            # it is kept on disk; the tools collection stays in RAM.
+            create_collection_if_not_exists(
+                self.docs_collection,
+                384,
+                models.Distance.COSINE,
+                "source",
+                VECTOR_QUANTIZATION,
+                on_disk=True,
+            ),
         )
 
-        # Documents collection (for RAG documentation)
-        await asyncio.get_event_loop().run_in_executor(
-            None, create_collection_if_not_exists, self.docs_collection, 384
-        )
+    async def _with_retry(
+        self, request: Callable[[], Awaitable[Any]], operation: str
+    ) -> Any:
+        """Send a write request, retrying transient failures with backoff.
+
+        Only idempotent writes should be retried; upserts and payload updates
+        are, since point IDs are stable.
+
+        Args:
+            request: Callable that sends the request.
+            operation: Description of the request for logging.
+
+        Returns:
+            The request's result.
+        """
+        for attempt in range(WRITE_ATTEMPTS):
+            try:
+                return await request()
+            except Exception as e:
+                if attempt == WRITE_ATTEMPTS - 1 or not _is_transient(e):
+                    raise
+                delay = random.uniform(0, WRITE_RETRY_BASE_DELAY * 2**attempt)
+                self.logger.warning(
+                    f"Retrying {operation}",
+                    attempt=attempt + 1,
+                    delay=round(delay, 2),
+                    error=str(e),
+                )
+                await asyncio.sleep(delay)
+
+    async def _upsert_batches(
+        self,
+        collection_name: str,
+        points: Iterable[tuple[int, list[float], dict[str, Any]]],
+        wait: bool,
+    ) -> int:
+        """Upsert points in bounded batches, a few requests at a time.
+
+        Batches are built lazily from ``points``, so only the batches in
+        flight are held in memory however large the input is.
+
+        Args:
+            collection_name: Collection to write to.
+            points: (id, vector, payload) tuples to write.
+            wait: Whether to wait until the points are applied.
+
+        Returns:
+            Number of points written.
+        """
+        in_flight = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+
+        async def upsert(batch: models.Batch) -> None:
+            try:
+                await self._with_retry(
+                    lambda: self._require_client().upsert(
+                        collection_name=collection_name, points=batch, wait=wait
+                    ),
+                    f"upsert to {collection_name}",
+                )
+            finally:
+                in_flight.release()
+
+        tasks = []
+        count = 0
+        iterator = iter(points)
+        while chunk := list(islice(iterator, UPLOAD_BATCH_SIZE)):
+            ids, vectors, payloads = zip(*chunk, strict=True)
+            # Inputs are already typed (tool embeddings are validated by the
+            # Tool model), so skip re-validating every float
+            batch = models.Batch.model_construct(
+                ids=list(ids), vectors=list(vectors), payloads=list(payloads)
+            )
+            await in_flight.acquire()
+            tasks.append(asyncio.create_task(upsert(batch)))
+            count += len(chunk)
+
+        await asyncio.gather(*tasks)
+        return count
 
     async def store_tool_embeddings(self, tools: list[Tool]) -> None:
         """Store tool embeddings in Qdrant.
 
+        The call waits until the points are applied, so searches made after
+        it returns, and the results cached from them, include the new tools.
+
         Args:
             tools: List of tools with embeddings to store.
         """
-        if not tools:
+        embedded = [(tool, tool.embedding) for tool in tools if tool.embedding]
+        if not embedded:
             return
 
-        points = []
-        for tool in tools:
-            if tool.embedding:
-                point = models.PointStruct(
-                    id=self._get_tool_point_id(
-                        tool.id
-                    ),  # Use helper method for consistent point ID generation
-                    vector=tool.embedding,
-                    payload={
-                        "tool_id": tool.id,
-                        "name": tool.name,
-                        "server_name": tool.server_name,
-                        "description": tool.description,
-                        "parameters": tool.parameters,
-                        "usage_count": tool.usage_count,
-                        "last_used": tool.last_used,
-                    },
-                )
-                points.append(point)
+        self._invalidate_search_cache()
+        try:
+            await self._upsert_batches(
+                self.tools_collection,
+                (
+                    (
+                        self._get_tool_point_id(tool.id),
+                        embedding,
+                        {
+                            "tool_id": tool.id,
+                            "name": tool.name,
+                            "server_name": tool.server_name,
+                            "description": tool.description,
+                            "parameters": tool.parameters,
+                            "usage_count": tool.usage_count,
+                            "last_used": tool.last_used,
+                        },
+                    )
+                    for tool, embedding in embedded
+                ),
+                wait=True,
+            )
+        finally:
+            self._invalidate_search_cache()
 
-        if points:
+        self.logger.info(
+            f"Stored {len(embedded)} tool embeddings",
+            collection=self.tools_collection,
+        )
 
-            def upsert_points():
-                self.client.upsert(
-                    collection_name=self.tools_collection,
-                    points=points,
-                )
+    async def finalize_bulk_load(self) -> None:
+        """Re-enable HNSW indexing on the tools collection after a bulk load."""
+        try:
+            await self._require_client().update_collection(
+                collection_name=self.tools_collection,
+                optimizers_config=models.OptimizersConfigDiff(
+                    indexing_threshold=TOOLS_INDEXING_THRESHOLD
+                ),
+            )
+            self.logger.debug(f"Enabled indexing on {self.tools_collection}")
+        except Exception as e:
+            self.logger.warning("Failed to enable indexing", error=str(e))
 
-            await asyncio.get_event_loop().run_in_executor(None, upsert_points)
+    @staticmethod
+    def _get_search_cache_key(
+        query_vector: list[float],
+        limit: int,
+        score_threshold: float,
+        server_filter: str | None,
+    ) -> bytes:
+        """Generate a search cache key from a query and its parameters.
 
-            self.logger.info(
-                f"Stored {len(points)} tool embeddings",
-                collection=self.tools_collection,
-            )
+        Args:
+            query_vector: Query embedding vector.
+            limit: Maximum number of results.
+            score_threshold: Minimum similarity score threshold.
+            server_filter: Optional server name filter.
+
+        Returns:
+            Cache key bytes.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.asarray(query_vector, dtype=np.float32).tobytes())
+        digest.update(repr((limit, score_threshold, server_filter)).encode())
+        return digest.digest()
+
+    def _invalidate_search_cache(self) -> None:
+        """Drop cached tool search results when the tools collection changes.
+
+        Writes call this before and after they are applied, so results of
+        searches that overlapped the write aren't served afterwards.
+        """
+        self._search_cache.clear()
+        self._search_generation += 1
+
+    @staticmethod
+    def _match_filter(key: str, value: str | None) -> models.Filter | None:
+        """Build a filter matching a payload field exactly.
+
+        Args:
+            key: Payload field name.
+            value: Value to match, or None for no filter.
+
+        Returns:
+            Qdrant filter, or None if no value was given.
+        """
+        if not value:
+            return None
+        return models.Filter(
+            must=[models.FieldCondition(key=key, match=models.MatchValue(value=value))]
+        )
 
     async def search_similar_tools(
         self,
@@ -160,6 +499,7 @@ class QdrantVectorStore:
         limit: int = 10,
         score_threshold: float = 0.7,
         server_filter: str | None = None,
+        payload_fields: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         """Search for similar tools using vector similarity.
 
@@ -168,48 +508,46 @@ class QdrantVectorStore:
             limit: Maximum number of results to return.
             score_threshold: Minimum similarity score threshold.
             server_filter: Optional server name to filter results.
+            payload_fields: Extra payload fields to return with each result.
 
         Returns:
-            List of similar tools with metadata and scores.
+            List of dicts with the tool ID, similarity score and any requested
+            payload fields.
         """
+        # Agents tend to repeat a query within a session; serve those from
+        # memory until tools are next stored or deleted. Only ID-only searches
+        # are cached, as usage updates don't invalidate the cache.
+        cache_key = None
+        if not payload_fields:
+            cache_key = self._get_search_cache_key(
+                query_vector, limit, score_threshold, server_filter
+            )
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                self._search_cache.move_to_end(cache_key)
+                return [dict(result) for result in cached]
+        generation = self._search_generation
+
+        # Tools are held in memory, so by default only the ID is needed back
+        payload_selector = models.PayloadSelectorInclude(
+            include=["tool_id", *(payload_fields or [])]
+        )
 
-        def search():
-            query_filter = None
-            if server_filter:
-                query_filter = models.Filter(
-                    must=[
-                        models.FieldCondition(
-                            key="server_name",
-                            match=models.MatchValue(value=server_filter),
-                        )
-                    ]
-                )
-
-            return self.client.search(
+        try:
+            results = await self._require_client().search(
                 collection_name=self.tools_collection,
                 query_vector=query_vector,
-                query_filter=query_filter,
+                query_filter=self._match_filter("server_name", server_filter),
+                search_params=QUANTIZED_SEARCH_PARAMS,
                 limit=limit,
                 score_threshold=score_threshold,
-                with_payload=True,
+                with_payload=payload_selector,
+                with_vectors=False,
             )
 
-        try:
-            results = await asyncio.get_event_loop().run_in_executor(None, search)
-
-            similar_tools = []
-            for result in results:
-                tool_data = {
-                    "tool_id": result.payload["tool_id"],
-                    "name": result.payload["name"],
-                    "server_name": result.payload["server_name"],
-                    "description": result.payload["description"],
-                    "parameters": result.payload["parameters"],
-                    "score": result.score,
-                    "usage_count": result.payload.get("usage_count", 0),
-                    "last_used": result.payload.get("last_used"),
-                }
-                similar_tools.append(tool_data)
+            similar_tools = [
+                {**(result.payload or {}), "score": result.score} for result in results
+            ]
 
             # Log search results for debugging
             if similar_tools:
@@ -222,34 +560,16 @@ class QdrantVectorStore:
                     top_scores=top_scores,
                 )
             else:
-                # Get a few results without threshold to see what scores we're getting
-                try:
-                    no_threshold_results = (
-                        await asyncio.get_event_loop().run_in_executor(
-                            None,
-                            lambda: self.client.search(
-                                collection_name=self.tools_collection,
-                                query_vector=query_vector,
-                                limit=min(5, limit),
-                                with_payload=True,
-                            ),
-                        )
+                # Diagnose misses in the background, at most once a minute
+                now = time.monotonic()
+                if (
+                    self.logger.logger.isEnabledFor(logging.DEBUG)
+                    and now - self._last_debug_search > DEBUG_SEARCH_INTERVAL
+                ):
+                    self._last_debug_search = now
+                    self._debug_search_task = asyncio.create_task(
+                        self._log_debug_scores(query_vector, limit, score_threshold)
                     )
-                    if no_threshold_results:
-                        actual_scores = [
-                            round(r.score, 3) for r in no_threshold_results
-                        ]
-                        self.logger.warning(
-                            f"Vector search returned 0 results with threshold {score_threshold}, "
-                            f"but found {len(no_threshold_results)} results without threshold. "
-                            f"Actual top scores: {actual_scores}"
-                        )
-                    else:
-                        self.logger.warning(
-                            "Vector search returned 0 results even without threshold - no tools in collection?"
-                        )
-                except Exception as e:
-                    self.logger.warning(f"Failed to get debug scores: {e}")
 
                 self.logger.debug(
                     "Vector search completed with no results",
@@ -257,56 +577,115 @@ class QdrantVectorStore:
                     threshold=score_threshold,
                 )
 
+            # Results of a search that overlapped a write may predate it
+            if cache_key is not None and generation == self._search_generation:
+                self._search_cache[cache_key] = [
+                    dict(result) for result in similar_tools
+                ]
+                while len(self._search_cache) > SEARCH_CACHE_SIZE:
+                    self._search_cache.popitem(last=False)
             return similar_tools
 
         except Exception as e:
             self.logger.error("Vector search failed", error=str(e))
             return []
 
+    async def _log_debug_scores(
+        self, query_vector: list[float], limit: int, score_threshold: float
+    ) -> None:
+        """Log the best scores for a query that matched nothing.
+
+        Args:
+            query_vector: Query embedding vector.
+            limit: Result limit of the original search.
+            score_threshold: Threshold the original search used.
+        """
+        try:
+            no_threshold_results = await self._require_client().search(
+                collection_name=self.tools_collection,
+                query_vector=query_vector,
+                limit=min(5, limit),
+                with_payload=False,
+                with_vectors=False,
+            )
+            if no_threshold_results:
+                actual_scores = [round(r.score, 3) for r in no_threshold_results]
+                self.logger.warning(
+                    f"Vector search returned 0 results with threshold {score_threshold}, "
+                    f"but found {len(no_threshold_results)} results without threshold. "
+                    f"Actual top scores: {actual_scores}"
+                )
+            else:
+                self.logger.warning(
+                    "Vector search returned 0 results even without threshold - no tools in collection?"
+                )
+        except Exception as e:
+            self.logger.warning(f"Failed to get debug scores: {e}")
+
     async def store_document_chunks(
         self,
         chunks: list[dict[str, Any]],
         source: str,
+        wait: bool = False,
     ) -> None:
         """Store document chunks for RAG.
 
         Args:
             chunks: List of document chunks with embeddings.
             source: Source identifier for the documents.
+            wait: Whether to wait until the points are applied. By default
+                the call returns once Qdrant has accepted the request.
         """
         if not chunks:
             return
 
-        points = []
-        for i, chunk in enumerate(chunks):
-            if "embedding" in chunk:
-                point = models.PointStruct(
-                    id=str(uuid.uuid4()),
-                    vector=chunk["embedding"],
-                    payload={
+        point_ids: list[models.ExtendedPointId] = []
+
+        def points() -> Iterator[tuple[int, list[float], dict[str, Any]]]:
+            # Chunk positions come from the full list, so they match the
+            # document even when some chunks have no embedding
+            for i, chunk in enumerate(chunks):
+                if "embedding" not in chunk:
+                    continue
+                point_id = self._get_chunk_point_id(source, i, chunk["text"])
+                point_ids.append(point_id)
+                yield (
+                    point_id,
+                    chunk["embedding"],
+                    {
                         "source": source,
                         "text": chunk["text"],
                         "metadata": chunk.get("metadata", {}),
                         "chunk_index": i,
                     },
                 )
-                points.append(point)
 
-        if points:
+        stored = await self._upsert_batches(self.docs_collection, points(), wait=wait)
+        if not stored:
+            return
 
-            def upsert_points():
-                self.client.upsert(
-                    collection_name=self.docs_collection,
-                    points=points,
+        # Unchanged chunks were overwritten in place; drop the source's chunks
+        # that are no longer in the document so re-indexing doesn't pile up
+        await self._require_client().delete(
+            collection_name=self.docs_collection,
+            points_selector=models.FilterSelector(
+                filter=models.Filter(
+                    must=[
+                        models.FieldCondition(
+                            key="source", match=models.MatchValue(value=source)
+                        )
+                    ],
+                    must_not=[models.HasIdCondition(has_id=point_ids)],
                 )
+            ),
+            wait=wait,
+        )
 
-            await asyncio.get_event_loop().run_in_executor(None, upsert_points)
-
-            self.logger.info(
-                f"Stored {len(points)} document chunks",
-                source=source,
-                collection=self.docs_collection,
-            )
+        self.logger.info(
+            f"Stored {stored} document chunks",
+            source=source,
+            collection=self.docs_collection,
+        )
 
     async def search_documents(
         self,
@@ -326,44 +705,75 @@ class QdrantVectorStore:
         Returns:
             List of relevant document chunks.
         """
-
-        def search():
-            query_filter = None
-            if source_filter:
-                query_filter = models.Filter(
-                    must=[
-                        models.FieldCondition(
-                            key="source",
-                            match=models.MatchValue(value=source_filter),
-                        )
-                    ]
-                )
-
-            return self.client.search(
+        try:
+            results = await self._require_client().search(
                 collection_name=self.docs_collection,
                 query_vector=query_vector,
-                query_filter=query_filter,
+                query_filter=self._match_filter("source", source_filter),
+                search_params=QUANTIZED_SEARCH_PARAMS,
+                limit=limit,
+                score_threshold=score_threshold,
+                with_payload=DOCUMENT_PAYLOAD,
+            )
+
+            documents = [self._to_document(result) for result in results]
+
+            self.logger.debug(
+                "Document search completed",
+                results_count=len(documents),
+                threshold=score_threshold,
+            )
+
+            return documents
+
+        except Exception as e:
+            self.logger.error("Document search failed", error=str(e))
+            return []
+
+    async def search_documents_by_source(
+        self,
+        query_vector: list[float],
+        sources: list[str],
+        limit: int = 5,
+        score_threshold: float = 0.7,
+    ) -> list[dict[str, Any]]:
+        """Search several document sources in one batched request.
+
+        Args:
+            query_vector: Query embedding vector.
+            sources: Source IDs to search; each is searched separately.
+            limit: Maximum number of results per source.
+            score_threshold: Minimum similarity score threshold.
+
+        Returns:
+            Relevant document chunks from all sources.
+        """
+        requests = [
+            models.SearchRequest(
+                vector=query_vector,
+                filter=self._match_filter("source", source),
+                params=QUANTIZED_SEARCH_PARAMS,
                 limit=limit,
                 score_threshold=score_threshold,
-                with_payload=True,
+                with_payload=DOCUMENT_PAYLOAD,
             )
+            for source in sources
+        ]
 
         try:
-            results = await asyncio.get_event_loop().run_in_executor(None, search)
-
-            documents = []
-            for result in results:
-                doc_data = {
-                    "text": result.payload["text"],
-                    "source": result.payload["source"],
-                    "metadata": result.payload.get("metadata", {}),
-                    "score": result.score,
-                    "chunk_index": result.payload.get("chunk_index", 0),
-                }
-                documents.append(doc_data)
+            batch_results = await self._require_client().search_batch(
+                collection_name=self.docs_collection, requests=requests
+            )
+
+            documents = [
+                self._to_document(result)
+                for results in batch_results
+                for result in results
+            ]
 
             self.logger.debug(
                 "Document search completed",
+                sources=len(sources),
                 results_count=len(documents),
                 threshold=score_threshold,
             )
@@ -374,33 +784,102 @@ class QdrantVectorStore:
             self.logger.error("Document search failed", error=str(e))
             return []
 
+    @staticmethod
+    def _to_document(result: models.ScoredPoint) -> dict[str, Any]:
+        """Convert a document search hit to a result dict.
+
+        Args:
+            result: Scored point from the documents collection.
+
+        Returns:
+            Document chunk with text, source, metadata and score.
+        """
+        payload = result.payload or {}
+        return {
+            "text": payload["text"],
+            "source": payload["source"],
+            "metadata": payload.get("metadata", {}),
+            "score": result.score,
+            "chunk_index": payload.get("chunk_index", 0),
+        }
+
     async def update_tool_usage(
         self, tool_id: str, usage_count: int, last_used: str
     ) -> None:
         """Update tool usage statistics.
 
+        Prefer buffering updates and calling ``update_tool_usage_batch``, as
+        the vector router does; this writes a batch of one.
+
         Args:
             tool_id: Tool identifier.
             usage_count: New usage count.
             last_used: Last used timestamp.
         """
+        await self.update_tool_usage_batch({tool_id: (usage_count, last_used)})
+
+    async def delete_tool_embeddings(self, tool_ids: list[str]) -> None:
+        """Delete the embeddings of tools that are no longer registered.
+
+        Args:
+            tool_ids: IDs of the tools to delete.
+        """
+        if not tool_ids:
+            return
 
-        def update():
-            self.client.set_payload(
+        self._invalidate_search_cache()
+        try:
+            await self._require_client().delete(
                 collection_name=self.tools_collection,
-                payload={
-                    "usage_count": usage_count,
-                    "last_used": last_used,
-                },
-                points=[self._get_tool_point_id(tool_id)],
+                points_selector=models.PointIdsList(
+                    points=[self._get_tool_point_id(tool_id) for tool_id in tool_ids]
+                ),
+                wait=True,
             )
+            self.logger.info(f"Deleted {len(tool_ids)} tool embeddings")
+        except Exception as e:
+            self.logger.warning(
+                "Failed to delete tool embeddings", tools=len(tool_ids), error=str(e)
+            )
+        finally:
+            self._invalidate_search_cache()
+
+    async def update_tool_usage_batch(
+        self, updates: dict[str, tuple[int, str | None]]
+    ) -> None:
+        """Update usage statistics for several tools in one request.
+
+        Args:
+            updates: Mapping of tool ID to (usage_count, last_used).
+        """
+        if not updates:
+            return
+
+        operations = [
+            models.SetPayloadOperation(
+                set_payload=models.SetPayload(
+                    payload={
+                        "usage_count": usage_count,
+                        "last_used": last_used,
+                    },
+                    points=[self._get_tool_point_id(tool_id)],
+                )
+            )
+            for tool_id, (usage_count, last_used) in updates.items()
+        ]
 
         try:
-            await asyncio.get_event_loop().run_in_executor(None, update)
-            self.logger.debug("Updated tool usage", tool_id=tool_id)
+            await self._with_retry(
+                lambda: self._require_client().batch_update_points(
+                    collection_name=self.tools_collection,
+                    update_operations=operations,
+                ),
+                "tool usage update",
+            )
+            self.logger.debug("Updated tool usage", tools=len(updates))
         except Exception as e:
             self.logger.warning(
-                "Failed to update tool usage", tool_id=tool_id, error=str(e)
+                "Failed to update tool usage", tools=len(updates), error=str(e)
             )
 
     async def delete_collection(self, collection_name: str) -> None:
@@ -409,17 +888,16 @@ class QdrantVectorStore:
         Args:
             collection_name: Name of collection to delete.
         """
-
-        def delete():
-            self.client.delete_collection(collection_name)
-
+        self._invalidate_search_cache()
         try:
-            await asyncio.get_event_loop().run_in_executor(None, delete)
+            await self._require_client().delete_collection(collection_name)
             self.logger.info(f"Deleted collection: {collection_name}")
         except Exception as e:
             self.logger.error(
                 "Failed to delete collection", collection=collection_name, error=str(e)
             )
+        finally:
+            self._invalidate_search_cache()
 
     async def get_collection_info(self) -> dict[str, Any]:
         """Get information about collections.
@@ -427,27 +905,40 @@ class QdrantVectorStore:
         Returns:
             Dictionary with collection information.
         """
-
-        def get_info():
-            tools_info = self.client.get_collection(self.tools_collection)
-            docs_info = self.client.get_collection(self.docs_collection)
-            return {
-                "tools": {
-                    "name": self.tools_collection,
-                    "points_count": tools_info.points_count,
-                    "vectors_count": tools_info.vectors_count,
-                    "status": tools_info.status,
-                },
-                "docs": {
-                    "name": self.docs_collection,
-                    "points_count": docs_info.points_count,
-                    "vectors_count": docs_info.vectors_count,
-                    "status": docs_info.status,
-                },
-            }
+        if (
+            self._info_cache
+            and time.monotonic() - self._info_cache[0] < COLLECTION_INFO_TTL
+        ):
+            return self._info_cache[1]
 
         try:
-            return await asyncio.get_event_loop().run_in_executor(None, get_info)
+            # Fetch both collections concurrently
+            tools_info, docs_info = await asyncio.gather(
+                self._require_client().get_collection(self.tools_collection),
+                self._require_client().get_collection(self.docs_collection),
+            )
         except Exception as e:
             self.logger.error("Failed to get collection info", error=str(e))
             return {}
+
+        info = {
+            "tools": {
+                "name": self.tools_collection,
+                "points_count": tools_info.points_count,
+                "vectors_count": tools_info.vectors_count,
+                "status": tools_info.status,
+            },
+            "docs": {
+                "name": self.docs_collection,
+                "points_count": docs_info.points_count,
+                "vectors_count": docs_info.vectors_count,
+                "status": docs_info.status,
+            },
+        }
+        self._info_cache = (time.monotonic(), info)
+        return info
+
+    async def cleanup(self) -> None:
+        """Close the Qdrant client."""
+        if self.client:
+            await self.client.close()
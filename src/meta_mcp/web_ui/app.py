@@ -1,257 +1,32 @@
 """FastAPI web interface for Meta MCP Server monitoring and configuration."""
 
 import asyncio
+import contextlib
+import gzip
+import hashlib
+import json
+import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import (
+    FastAPI,
+    HTTPException,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import JSONResponse
 
 from ..config.models import MetaMCPConfig, MetricsData
+from ..server.admission import OverloadError
 from ..utils.logging import get_logger
 
-
-class WebInterface:
-    """Web interface for Meta MCP Server."""
-
-    def __init__(self, config: MetaMCPConfig, server_instance):
-        self.config = config.web_ui
-        self.server_config = config
-        self.server_instance = server_instance
-        self.logger = get_logger(__name__)
-        self.app = FastAPI(
-            title="Meta MCP Server",
-            description="Web interface for Meta MCP Server monitoring and configuration",
-            version="0.1.0",
-        )
-        self.active_connections: list[WebSocket] = []
-
-        # Setup middleware
-        self.app.add_middleware(
-            CORSMiddleware,
-            allow_origins=["*"],  # Configure appropriately for production
-            allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
-        )
-
-        # Setup routes
-        self._setup_routes()
-
-    def _setup_routes(self) -> None:
-        """Setup API routes."""
-
-        @self.app.get("/")
-        async def root():
-            """Root endpoint with basic info."""
-            return {"message": "Meta MCP Server Web Interface", "status": "running"}
-
-        @self.app.get("/health")
-        async def health_check():
-            """Health check endpoint."""
-            return {
-                "status": "healthy",
-                "server_running": self.server_instance._running,
-            }
-
-        @self.app.get("/api/config")
-        async def get_config():
-            """Get current server configuration."""
-            try:
-                return {
-                    "server": self.server_config.server.model_dump(),
-                    "strategy": self.server_config.strategy.model_dump(),
-                    "embeddings": {
-                        **self.server_config.embeddings.model_dump(),
-                        "lm_studio_endpoint": self.server_config.embeddings.lm_studio_endpoint,
-                    },
-                    "vector_store": self.server_config.vector_store.model_dump(),
-                    "llm": {
-                        **self.server_config.llm.model_dump(),
-                        "api_key": "***" if self.server_config.llm.api_key else None,
-                    },
-                    "rag": self.server_config.rag.model_dump(),
-                    "web_ui": self.server_config.web_ui.model_dump(),
-                    "child_servers": [
-                        {
-                            **server.model_dump(),
-                            "env": dict.fromkeys(
-                                server.env.keys(), "***"
-                            ),  # Hide env vars
-                        }
-                        for server in self.server_config.child_servers
-                    ],
-                }
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=str(e)) from e
-
-        @self.app.get("/api/status")
-        async def get_status():
-            """Get detailed server status."""
-            try:
-                status = self.server_instance.get_status()
-
-                # Add child server status if available
-                if hasattr(self.server_instance, "child_manager"):
-                    child_status = (
-                        await self.server_instance.child_manager.get_server_status()
-                    )
-                    status["child_servers"] = child_status
-
-                # Add routing metrics if available
-                if hasattr(self.server_instance, "routing_engine"):
-                    routing_metrics = {}
-                    for (
-                        strategy_name,
-                        router,
-                    ) in self.server_instance.routing_engine.routers.items():
-                        routing_metrics[strategy_name] = router.get_metrics()
-                    status["routing_metrics"] = routing_metrics
-
-                return status
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=str(e)) from e
-
-        @self.app.get("/api/tools")
-        async def get_tools():
-            """Get all available tools."""
-            try:
-                tools = await self.server_instance.list_tools()
-                return {
-                    "tools": [tool.model_dump() for tool in tools],
-                    "count": len(tools),
-                }
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=str(e)) from e
-
-        @self.app.get("/api/metrics")
-        async def get_metrics():
-            """Get performance metrics."""
-            try:
-                metrics = MetricsData(
-                    active_connections=len(self.active_connections),
-                    total_requests=getattr(self.server_instance, "_total_requests", 0),
-                    avg_response_time=getattr(
-                        self.server_instance, "_avg_response_time", 0.0
-                    ),
-                    uptime_seconds=int(
-                        asyncio.get_event_loop().time()
-                        - getattr(self.server_instance, "_start_time", 0)
-                    ),
-                )
-
-                # Add component-specific metrics
-                component_metrics = {}
-
-                if hasattr(self.server_instance, "embedding_service"):
-                    component_metrics["embeddings"] = (
-                        self.server_instance.embedding_service.get_metrics()
-                    )
-
-                if hasattr(self.server_instance, "llm_client"):
-                    component_metrics["llm"] = (
-                        self.server_instance.llm_client.get_metrics()
-                    )
-
-                if hasattr(self.server_instance, "rag_pipeline"):
-                    component_metrics["rag"] = (
-                        self.server_instance.rag_pipeline.get_metrics()
-                    )
-
-                return {
-                    **metrics.model_dump(),
-                    "components": component_metrics,
-                }
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=str(e)) from e
-
-        @self.app.post("/api/tools/{tool_name}/call")
-        async def call_tool(tool_name: str, arguments: dict[str, Any]):
-            """Call a specific tool."""
-            try:
-                result = await self.server_instance.call_tool(tool_name, arguments)
-                return {"result": result, "tool": tool_name}
-            except Exception as e:
-                raise HTTPException(status_code=400, detail=str(e)) from e
-
-        @self.app.post("/api/servers/{server_name}/restart")
-        async def restart_server(server_name: str):
-            """Restart a child server."""
-            try:
-                if hasattr(self.server_instance, "child_manager"):
-                    success = await self.server_instance.child_manager.restart_server(
-                        server_name
-                    )
-                    return {"success": success, "server": server_name}
-                else:
-                    raise HTTPException(
-                        status_code=501, detail="Child server management not available"
-                    )
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=str(e)) from e
-
-        @self.app.get("/api/strategies")
-        async def get_strategies():
-            """Get available routing strategies."""
-            return {
-                "strategies": [
-                    {
-                        "name": "vector",
-                        "description": "Fast semantic similarity using embeddings",
-                        "features": [
-                            "embedding_search",
-                            "similarity_threshold",
-                            "caching",
-                        ],
-                    },
-                    {
-                        "name": "llm",
-                        "description": "AI-powered tool selection using local LLMs",
-                        "features": ["reasoning", "context_awareness", "explanation"],
-                    },
-                    {
-                        "name": "rag",
-                        "description": "Context-augmented selection using retrieved documentation",
-                        "features": [
-                            "documentation_search",
-                            "context_augmentation",
-                            "enhanced_reasoning",
-                        ],
-                    },
-                ],
-                "current": self.server_config.strategy.primary,
-                "fallback": self.server_config.strategy.fallback,
-            }
-
-        @self.app.websocket("/ws/logs")
-        async def websocket_logs(websocket: WebSocket):
-            """WebSocket endpoint for real-time log streaming."""
-            await websocket.accept()
-            self.active_connections.append(websocket)
-            try:
-                while True:
-                    # Keep connection alive and send any queued log messages
-                    await asyncio.sleep(1)
-                    # In a real implementation, you'd stream actual log messages here
-                    await websocket.send_json(
-                        {
-                            "timestamp": asyncio.get_event_loop().time(),
-                            "level": "INFO",
-                            "message": "Heartbeat",
-                            "logger": "web_interface",
-                        }
-                    )
-            except WebSocketDisconnect:
-                self.active_connections.remove(websocket)
-
-        @self.app.get("/dashboard")
-        async def dashboard():
-            """Serve the dashboard HTML page."""
-            return HTMLResponse(content=self._get_dashboard_html())
-
-    def _get_dashboard_html(self) -> str:
-        """Get simple dashboard HTML."""
-        return """
+# The dashboard is static, so it is encoded once and revalidated by ETag
+_DASHBOARD_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -380,10 +155,11 @@ class WebInterface:
             ws = new WebSocket(`${protocol}//${window.location.host}/ws/logs`);
 
             ws.onmessage = function(event) {
-                const data = JSON.parse(event.data);
                 const logs = document.getElementById('logs');
-                const timestamp = new Date(data.timestamp * 1000).toLocaleTimeString();
-                logs.innerHTML += `[${timestamp}] ${data.level}: ${data.message}\\n`;
+                for (const data of [].concat(JSON.parse(event.data))) {
+                    const timestamp = new Date(data.timestamp * 1000).toLocaleTimeString();
+                    logs.innerHTML += `[${timestamp}] ${data.level}: ${data.message}\\n`;
+                }
                 logs.scrollTop = logs.scrollHeight;
             };
 
@@ -456,7 +232,385 @@ class WebInterface:
     </script>
 </body>
 </html>
+        """.encode()
+_DASHBOARD_ETAG = f'"{hashlib.blake2b(_DASHBOARD_HTML, digest_size=16).hexdigest()}"'
+_DASHBOARD_HEADERS = {
+    "Cache-Control": "public, max-age=300",
+    "ETag": _DASHBOARD_ETAG,
+    "Vary": "Accept-Encoding",
+}
+# Compressed once too; each encoding needs its own ETag
+_DASHBOARD_GZIP = gzip.compress(_DASHBOARD_HTML, compresslevel=9, mtime=0)
+_DASHBOARD_GZIP_HEADERS = {
+    **_DASHBOARD_HEADERS,
+    "ETag": _DASHBOARD_ETAG[:-1] + '-gzip"',
+    "Content-Encoding": "gzip",
+}
+
+# Liveness probes get the same answer every time
+_LIVENESS_BODY = b'{"status":"alive"}'
+
+# Health probes get one of two answers, by whether the server is running;
+# readiness and admission details are on /api/status
+_HEALTH_BODIES = {
+    running: json.dumps({"status": "healthy", "server_running": running}).encode()
+    for running in (True, False)
+}
+
+# Most log entries sent to WebSocket clients in one message
+LOG_BATCH_SIZE = 64
+
+
+class WebInterface:
+    """Web interface for Meta MCP Server."""
+
+    def __init__(self, config: MetaMCPConfig, server_instance):
+        self.config = config.web_ui
+        self.server_config = config
+        self.server_instance = server_instance
+        self.logger = get_logger(__name__)
+        self.app = FastAPI(
+            title="Meta MCP Server",
+            description="Web interface for Meta MCP Server monitoring and configuration",
+            version="0.1.0",
+        )
+        self.active_connections: set[WebSocket] = set()
+
+        # Log entries waiting to be broadcast; a background task sends them
+        # in batches, encoded once for all clients
+        self._log_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._broadcast_task: asyncio.Task[None] | None = None
+
+        # Rendered JSON of recent responses of polled endpoints, with the
+        # time they were produced and their ETag; the locks make concurrent
+        # pollers share one recomputation
+        self._response_cache: dict[str, tuple[float, bytes, str]] = {}
+        self._cache_locks: dict[str, asyncio.Lock] = {}
+
+        # JSON dump of the config with secrets hidden, and the config
+        # sections it was built from
+        self._config_dump: tuple[tuple[Any, ...], dict[str, Any]] | None = None
+
+        # Setup middleware
+        self.app.add_middleware(
+            CORSMiddleware,
+            allow_origins=["*"],  # Configure appropriately for production
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+
+        # Setup routes
+        self._setup_routes()
+
+    def _setup_routes(self) -> None:
+        """Setup API routes."""
+
+        @self.app.get("/")
+        async def root():
+            """Root endpoint with basic info."""
+            return {"message": "Meta MCP Server Web Interface", "status": "running"}
+
+        @self.app.get("/livez")
+        async def liveness_check():
+            """Liveness endpoint, available before tools are ready."""
+            return Response(content=_LIVENESS_BODY, media_type="application/json")
+
+        @self.app.get("/health")
+        async def health_check():
+            """Health check endpoint."""
+            running = bool(getattr(self.server_instance, "_running", False))
+            return Response(
+                content=_HEALTH_BODIES[running], media_type="application/json"
+            )
+
+        @self.app.get("/api/config")
+        async def get_config(request: Request):
+            """Get current server configuration."""
+            return await self._cached(request, "config", build_config)
+
+        async def build_config() -> dict[str, Any]:
+            try:
+                return self._config_snapshot()
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e)) from e
+
+        @self.app.get("/api/status")
+        async def get_status(request: Request):
+            """Get detailed server status."""
+            return await self._cached(request, "status", build_status)
+
+        async def build_status() -> dict[str, Any]:
+            try:
+                status = self.server_instance.get_status()
+
+                # Add child server status if available
+                child_manager = self._component("child_manager")
+                if child_manager is not None:
+                    status["child_servers"] = await child_manager.get_server_status()
+
+                # Add routing metrics if available
+                routing_engine = self._component("routing_engine")
+                if routing_engine is not None:
+                    status["routing_metrics"] = {
+                        strategy_name: router.get_metrics()
+                        for strategy_name, router in routing_engine.routers.items()
+                    }
+
+                return status
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e)) from e
+
+        @self.app.get("/api/tools")
+        async def get_tools():
+            """Get all available tools."""
+            try:
+                tools = await self.server_instance.list_tools()
+                return {
+                    "tools": [tool.model_dump() for tool in tools],
+                    "count": len(tools),
+                }
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e)) from e
+
+        @self.app.get("/api/metrics")
+        async def get_metrics(request: Request):
+            """Get performance metrics."""
+            return await self._cached(request, "metrics", build_metrics)
+
+        async def build_metrics() -> dict[str, Any]:
+            try:
+                metrics = MetricsData(
+                    active_connections=len(self.active_connections),
+                    total_requests=getattr(self.server_instance, "_total_requests", 0),
+                    avg_response_time=getattr(
+                        self.server_instance, "_avg_response_time", 0.0
+                    ),
+                    p95_response_time=getattr(
+                        self.server_instance, "p95_response_time", 0.0
+                    ),
+                    error_count=getattr(self.server_instance, "_error_count", 0),
+                    # The server records its start as wall-clock time
+                    uptime_seconds=int(
+                        time.time() - getattr(self.server_instance, "_start_time", 0)
+                    ),
+                )
+
+                # Add component-specific metrics
+                component_metrics = {
+                    key: component.get_metrics()
+                    for key, name in (
+                        ("embeddings", "embedding_service"),
+                        ("llm", "llm_client"),
+                        ("rag", "rag_pipeline"),
+                    )
+                    if (component := self._component(name)) is not None
+                }
+
+                return {
+                    **metrics.model_dump(),
+                    "components": component_metrics,
+                }
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e)) from e
+
+        @self.app.post("/api/tools/{tool_name}/call")
+        async def call_tool(tool_name: str, arguments: dict[str, Any]):
+            """Call a specific tool."""
+            try:
+                result = await self.server_instance.call_tool(tool_name, arguments)
+                return {"result": result, "tool": tool_name}
+            except OverloadError as e:
+                raise HTTPException(status_code=503, detail=str(e)) from e
+            except Exception as e:
+                raise HTTPException(status_code=400, detail=str(e)) from e
+
+        @self.app.post("/api/servers/{server_name}/restart")
+        async def restart_server(server_name: str):
+            """Restart a child server."""
+            try:
+                child_manager = self._component("child_manager")
+                if child_manager is not None:
+                    success = await child_manager.restart_server(server_name)
+                    self._response_cache.clear()
+                    return {"success": success, "server": server_name}
+                else:
+                    raise HTTPException(
+                        status_code=501, detail="Child server management not available"
+                    )
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e)) from e
+
+        @self.app.get("/api/strategies")
+        async def get_strategies(request: Request):
+            """Get available routing strategies."""
+            return await self._cached(request, "strategies", build_strategies)
+
+        async def build_strategies() -> dict[str, Any]:
+            return {
+                "strategies": [
+                    {
+                        "name": "vector",
+                        "description": "Fast semantic similarity using embeddings",
+                        "features": [
+                            "embedding_search",
+                            "similarity_threshold",
+                            "caching",
+                        ],
+                    },
+                    {
+                        "name": "llm",
+                        "description": "AI-powered tool selection using local LLMs",
+                        "features": ["reasoning", "context_awareness", "explanation"],
+                    },
+                    {
+                        "name": "rag",
+                        "description": "Context-augmented selection using retrieved documentation",
+                        "features": [
+                            "documentation_search",
+                            "context_augmentation",
+                            "enhanced_reasoning",
+                        ],
+                    },
+                ],
+                "current": self.server_config.strategy.primary,
+                "fallback": self.server_config.strategy.fallback,
+            }
+
+        @self.app.websocket("/ws/logs")
+        async def websocket_logs(websocket: WebSocket):
+            """WebSocket endpoint for real-time log streaming."""
+            await websocket.accept()
+            if len(self.active_connections) >= self.config.max_ws_connections:
+                # 1013: try again later
+                await websocket.close(code=1013)
+                return
+            self.active_connections.add(websocket)
+            try:
+                # Log entries are pushed by broadcast_log; the server's
+                # ping/pong frames keep idle connections alive, so only wait
+                # for the client to disconnect
+                while True:
+                    await websocket.receive_text()
+            except WebSocketDisconnect:
+                pass
+            finally:
+                self.active_connections.discard(websocket)
+
+        @self.app.get("/dashboard")
+        async def dashboard(request: Request):
+            """Serve the dashboard HTML page."""
+            if "gzip" in request.headers.get("accept-encoding", ""):
+                content, headers = _DASHBOARD_GZIP, _DASHBOARD_GZIP_HEADERS
+            else:
+                content, headers = _DASHBOARD_HTML, _DASHBOARD_HEADERS
+
+            if request.headers.get("if-none-match") == headers["ETag"]:
+                return Response(status_code=304, headers=headers)
+            return Response(content=content, media_type="text/html", headers=headers)
+
+    def _config_snapshot(self) -> dict[str, Any]:
+        """Get the config as JSON-ready data with secrets hidden.
+
+        The dump is rebuilt only when a config section or the child server
+        list is replaced, which is how configs are reloaded.
+
+        Returns:
+            Config data for the config endpoint.
+        """
+        config = self.server_config
+        sections = (
+            config.server,
+            config.strategy,
+            config.embeddings,
+            config.vector_store,
+            config.llm,
+            config.rag,
+            config.web_ui,
+            config.child_servers,
+        )
+        if self._config_dump is not None and all(
+            current is cached
+            for current, cached in zip(sections, self._config_dump[0], strict=True)
+        ):
+            return self._config_dump[1]
+
+        dump = {
+            "server": config.server.model_dump(mode="json"),
+            "strategy": config.strategy.model_dump(mode="json"),
+            "embeddings": config.embeddings.model_dump(mode="json"),
+            "vector_store": config.vector_store.model_dump(mode="json"),
+            "llm": {
+                **config.llm.model_dump(mode="json"),
+                "api_key": "***" if config.llm.api_key else None,
+            },
+            "rag": config.rag.model_dump(mode="json"),
+            "web_ui": config.web_ui.model_dump(mode="json"),
+            "child_servers": [
+                {
+                    **server.model_dump(mode="json"),
+                    "env": dict.fromkeys(server.env, "***"),
+                }
+                for server in config.child_servers
+            ],
+        }
+        self._config_dump = (sections, dump)
+        return dump
+
+    def _component(self, name: str) -> Any | None:
+        """Get a server component, or None if it is missing or not set up.
+
+        Components are created when the server initializes, so they are
+        looked up per request rather than once here.
+
+        Args:
+            name: Attribute name of the component on the server.
+
+        Returns:
+            The component, or None.
+        """
+        return getattr(self.server_instance, name, None)
+
+    async def _cached(
+        self, request: Request, key: str, producer: Callable[[], Awaitable[Any]]
+    ) -> Response:
+        """Get an endpoint's response, reusing it for ``web_ui.cache_ttl``.
+
+        The response is cached as rendered JSON, so serving it from the cache
+        doesn't serialize it again. Its ETag lets pollers revalidate with
+        ``If-None-Match`` and get an empty 304 while it is unchanged.
+
+        Args:
+            request: Incoming request.
+            key: Endpoint name.
+            producer: Coroutine function building the response content.
+
+        Returns:
+            JSON response with the cached or newly built content, or a 304.
         """
+        ttl = self.config.cache_ttl
+        cached = self._response_cache.get(key)
+        if cached is None or time.monotonic() - cached[0] >= ttl:
+            lock = self._cache_locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                # Another request may have refreshed it while we waited
+                cached = self._response_cache.get(key)
+                if cached is None or time.monotonic() - cached[0] >= ttl:
+                    content = jsonable_encoder(await producer())
+                    body = bytes(JSONResponse(content).body)
+                    digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+                    cached = (time.monotonic(), body, f'"{digest}"')
+                    if ttl > 0:
+                        self._response_cache[key] = cached
+
+        _, body, etag = cached
+        # Browsers revalidate no-cache responses on every fetch
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+
+        # A new response per request, as middleware may add headers to it
+        return Response(content=body, media_type="application/json", headers=headers)
 
     async def start(self) -> None:
         """Start the web interface."""
@@ -468,35 +622,65 @@ class WebInterface:
             host=self.config.host,
             port=self.config.port,
         )
+        self._broadcast_task = asyncio.create_task(self._broadcast_loop())
 
     async def shutdown(self) -> None:
         """Shutdown the web interface."""
         self.logger.info("Shutting down web interface")
 
-        # Close all WebSocket connections
-        for connection in self.active_connections:
-            await connection.close()
+        if self._broadcast_task:
+            self._broadcast_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._broadcast_task
+            self._broadcast_task = None
+
+        # Close all WebSocket connections together, so a half-open client
+        # can't hold up shutdown for longer than the send timeout
+        await asyncio.gather(
+            *(
+                asyncio.wait_for(connection.close(), self.config.ws_send_timeout)
+                for connection in self.active_connections
+            ),
+            return_exceptions=True,
+        )
 
         self.active_connections.clear()
 
         self.logger.info("Web interface shutdown complete")
 
-    async def broadcast_log(self, log_entry: dict[str, Any]) -> None:
-        """Broadcast log entry to all connected WebSocket clients.
+    def broadcast_log(self, log_entry: dict[str, Any]) -> None:
+        """Queue a log entry for broadcast to all connected WebSocket clients.
 
         Args:
             log_entry: Log entry to broadcast.
         """
-        if not self.active_connections:
-            return
-
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(log_entry)
-            except Exception:
-                disconnected.append(connection)
-
-        # Remove disconnected clients
-        for connection in disconnected:
-            self.active_connections.remove(connection)
+        if self.active_connections:
+            self._log_queue.put_nowait(log_entry)
+
+    async def _broadcast_loop(self) -> None:
+        """Send queued log entries to all clients, batching any backlog."""
+        while True:
+            batch = [await self._log_queue.get()]
+            while len(batch) < LOG_BATCH_SIZE and not self._log_queue.empty():
+                batch.append(self._log_queue.get_nowait())
+
+            # Encode once for all clients, and send to them all at once so
+            # one slow client doesn't hold up the others
+            message = json.dumps(batch)
+            connections = list(self.active_connections)
+            results = await asyncio.gather(
+                *(
+                    asyncio.wait_for(
+                        connection.send_text(message), self.config.ws_send_timeout
+                    )
+                    for connection in connections
+                ),
+                return_exceptions=True,
+            )
+
+            # Remove disconnected and stalled clients
+            self.active_connections.difference_update(
+                connection
+                for connection, result in zip(connections, results, strict=True)
+                if isinstance(result, Exception)
+            )
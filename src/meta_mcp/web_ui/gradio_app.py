@@ -2,18 +2,148 @@
 
 import asyncio
 import json
+import os
 import time
+from collections.abc import Coroutine
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 import gradio as gr
 import yaml
 
 from ..config.loader import load_config, save_config
-from ..config.models import MetaMCPConfig
+from ..config.models import MetaMCPConfig, Tool
 from ..routing.base import SelectionContext
 from ..utils.logging import get_logger
 
+T = TypeVar("T")
+
+# Seconds between automatic refreshes of the monitor and logs tabs
+STATUS_POLL_INTERVAL = 30.0
+LOG_POLL_INTERVAL = 5.0
+
+# Seconds a polled status is shared between dashboards; well under the poll
+# interval so timer jitter cannot serve a dashboard its own previous status
+STATUS_CACHE_TTL = STATUS_POLL_INTERVAL / 2
+
+# Number of log lines shown, and bytes read at a time to find them
+LOG_TAIL_LINES = 100
+LOG_READ_BLOCK_SIZE = 64 * 1024
+
+
+def _shorten(text: str, width: int) -> str:
+    """Truncate text to a width, marking it with an ellipsis if cut."""
+    return text if len(text) <= width else text[:width] + "..."
+
+
+def _tool_rows(tools: list[Tool]) -> list[list[Any]]:
+    """Format tools as rows of the tools table.
+
+    Args:
+        tools: Tools to show.
+
+    Returns:
+        Name, server, short description and usage count of each tool.
+    """
+    return [
+        [tool.name, tool.server_name, _shorten(tool.description, 50), tool.usage_count]
+        for tool in tools
+    ]
+
+
+# Theme and styles of the dashboard, built once for every interface instance
+APP_THEME = gr.themes.Soft(
+    primary_hue="blue",
+    secondary_hue="gray",
+    neutral_hue="slate",
+    spacing_size="md",
+    radius_size="lg",
+).set(
+    body_background_fill="white",
+    panel_background_fill="*neutral_50",
+    button_primary_background_fill="*primary_500",
+    button_primary_background_fill_hover="*primary_600",
+)
+
+APP_CSS = """
+/* Modern styling for Gradio 5.x */
+.status-card {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 1.5rem;
+    border-radius: 1rem;
+    box-shadow: 0 8px 25px rgba(0,0,0,0.1);
+    margin: 1rem 0;
+}
+.metric-card {
+    background: white;
+    padding: 1.25rem;
+    border-radius: 0.75rem;
+    border: 1px solid #e2e8f0;
+    box-shadow: 0 4px 6px rgba(0,0,0,0.05);
+    transition: all 0.2s ease;
+}
+.metric-card:hover {
+    box-shadow: 0 8px 25px rgba(0,0,0,0.1);
+    transform: translateY(-2px);
+}
+.metric-value {
+    font-weight: 700;
+    color: #3b82f6;
+    font-size: 1.5rem;
+}
+.error-text { color: #ef4444; font-weight: 600; }
+.success-text { color: #10b981; font-weight: 600; }
+.warning-text { color: #f59e0b; font-weight: 600; }
+
+/* Enhanced button styling */
+.gradio-button {
+    border-radius: 0.5rem !important;
+    font-weight: 500 !important;
+    transition: all 0.2s ease !important;
+}
+
+/* Better tab styling */
+.tab-nav {
+    border-radius: 0.75rem 0.75rem 0 0 !important;
+}
+
+/* Code editor improvements */
+.code-editor {
+    border-radius: 0.5rem !important;
+    border: 1px solid #e2e8f0 !important;
+}
+
+/* JSON display improvements */
+.json-holder {
+    border-radius: 0.5rem !important;
+    background: #f8fafc !important;
+}
+"""
+
+# Example shown in the JSON import tab
+EXAMPLE_MCP_JSON = """{
+  "mcpServers": {
+    "filesystem": {
+      "command": "npx",
+      "args": ["-y", "@modelcontextprotocol/server-filesystem", "/path/to/allowed/files"],
+      "env": {}
+    },
+    "brave-search": {
+      "command": "npx",
+      "args": ["-y", "@modelcontextprotocol/server-brave-search"],
+      "env": {
+        "BRAVE_API_KEY": "your-api-key"
+      }
+    },
+    "git": {
+      "command": "uvx",
+      "args": ["mcp-server-git", "--repository", "/path/to/repo"],
+      "env": {}
+    }
+  }
+}"""
+
 
 class GradioWebInterface:
     """Gradio-based web interface for Meta MCP Server."""
@@ -28,84 +158,25 @@ class GradioWebInterface:
         self.config_backup: dict[str, Any] | None = None
         self.config_path: str | None = None
 
+        # The server's event loop; Gradio runs handlers on its own loop in
+        # another thread, so server calls are handed over to this one
+        self._server_loop: asyncio.AbstractEventLoop | None = None
+
+        # Last status produced for the auto-refresh timer, shared by all
+        # open dashboards, and when it was produced
+        self._polled_status: tuple[float, tuple[str, dict, list, dict]] | None = None
+        # Status refresh in progress, awaited by every dashboard polling meanwhile
+        self._pending_status: asyncio.Future[tuple[str, dict, list, dict]] | None = None
+
         # Create the Gradio interface
         self.app = self._create_interface()
 
     def _create_interface(self) -> gr.Blocks:
         """Create the main Gradio interface."""
-
-        # Create a modern theme with better styling
-        theme = gr.themes.Soft(
-            primary_hue="blue",
-            secondary_hue="gray",
-            neutral_hue="slate",
-            spacing_size="md",
-            radius_size="lg",
-        ).set(
-            body_background_fill="white",
-            panel_background_fill="*neutral_50",
-            button_primary_background_fill="*primary_500",
-            button_primary_background_fill_hover="*primary_600",
-        )
-
         with gr.Blocks(
             title="Meta MCP Server Dashboard",
-            theme=theme,
-            css="""
-            /* Modern styling for Gradio 5.x */
-            .status-card {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                padding: 1.5rem;
-                border-radius: 1rem;
-                box-shadow: 0 8px 25px rgba(0,0,0,0.1);
-                margin: 1rem 0;
-            }
-            .metric-card {
-                background: white;
-                padding: 1.25rem;
-                border-radius: 0.75rem;
-                border: 1px solid #e2e8f0;
-                box-shadow: 0 4px 6px rgba(0,0,0,0.05);
-                transition: all 0.2s ease;
-            }
-            .metric-card:hover {
-                box-shadow: 0 8px 25px rgba(0,0,0,0.1);
-                transform: translateY(-2px);
-            }
-            .metric-value {
-                font-weight: 700;
-                color: #3b82f6;
-                font-size: 1.5rem;
-            }
-            .error-text { color: #ef4444; font-weight: 600; }
-            .success-text { color: #10b981; font-weight: 600; }
-            .warning-text { color: #f59e0b; font-weight: 600; }
-
-            /* Enhanced button styling */
-            .gradio-button {
-                border-radius: 0.5rem !important;
-                font-weight: 500 !important;
-                transition: all 0.2s ease !important;
-            }
-
-            /* Better tab styling */
-            .tab-nav {
-                border-radius: 0.75rem 0.75rem 0 0 !important;
-            }
-
-            /* Code editor improvements */
-            .code-editor {
-                border-radius: 0.5rem !important;
-                border: 1px solid #e2e8f0 !important;
-            }
-
-            /* JSON display improvements */
-            .json-holder {
-                border-radius: 0.5rem !important;
-                background: #f8fafc !important;
-            }
-            """,
+            theme=APP_THEME,
+            css=APP_CSS,
         ) as app:
             # Add a modern header with status indicator
             with gr.Row():
@@ -541,9 +612,9 @@ class GradioWebInterface:
 
         run_health_check.click(fn=self._run_health_check, outputs=[health_status])
 
-        # Auto-refresh every 30 seconds
-        gr.Timer(30.0).tick(
-            fn=self._refresh_status,
+        # Auto-refresh, sharing one status refresh between open dashboards
+        gr.Timer(STATUS_POLL_INTERVAL).tick(
+            fn=self._poll_status,
             outputs=[server_status, metrics_json, child_servers_df, health_status],
         )
 
@@ -580,13 +651,14 @@ class GradioWebInterface:
 
         clear_logs.click(fn=lambda: "", outputs=[logs_display])
 
-        # Auto-refresh logs if enabled
-        def auto_refresh_logs():
-            if auto_refresh.value:
-                return self._get_recent_logs(log_level_filter.value)
-            return gr.update()
-
-        gr.Timer(5.0).tick(fn=auto_refresh_logs, outputs=[logs_display])
+        # Auto-refresh logs if enabled, only sending them when the file changed
+        # since this client last got them
+        log_version = gr.State(None)
+        gr.Timer(LOG_POLL_INTERVAL).tick(
+            fn=self._poll_logs,
+            inputs=[log_level_filter, auto_refresh, log_version],
+            outputs=[logs_display, log_version],
+        )
 
     def _create_json_import_tab(self) -> Any:
         """Create the JSON tool import interface."""
@@ -616,27 +688,7 @@ class GradioWebInterface:
                         label="MCP Server Configuration (JSON)",
                         language="json",
                         lines=15,
-                        value="""{
-  "mcpServers": {
-    "filesystem": {
-      "command": "npx",
-      "args": ["-y", "@modelcontextprotocol/server-filesystem", "/path/to/allowed/files"],
-      "env": {}
-    },
-    "brave-search": {
-      "command": "npx",
-      "args": ["-y", "@modelcontextprotocol/server-brave-search"],
-      "env": {
-        "BRAVE_API_KEY": "your-api-key"
-      }
-    },
-    "git": {
-      "command": "uvx",
-      "args": ["mcp-server-git", "--repository", "/path/to/repo"],
-      "env": {}
-    }
-  }
-}""",
+                        value=EXAMPLE_MCP_JSON,
                     )
 
                     # Import controls
@@ -727,8 +779,22 @@ class GradioWebInterface:
             outputs=[json_input, import_status],
         )
 
+    async def _on_server_loop(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Await a server coroutine on the loop that owns the server.
+
+        Args:
+            coro: Coroutine calling into the server instance.
+
+        Returns:
+            The coroutine's result.
+        """
+        loop = self._server_loop
+        if loop is None or loop is asyncio.get_running_loop():
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
     # Implementation methods for the interface with modern Gradio 5.x features
-    def _test_tool_selection_with_progress(
+    async def _test_tool_selection_with_progress(
         self,
         query: str,
         strategy: str,
@@ -737,8 +803,7 @@ class GradioWebInterface:
         server_filter: str,
     ) -> tuple[dict, str, list, list, float, float, int]:
         """Enhanced tool selection with progress indicator."""
-
-        async def _async_test_with_progress():
+        try:
             if not query.strip():
                 return (
                     {},
@@ -753,7 +818,9 @@ class GradioWebInterface:
             start_time = time.time()
 
             # Get available tools
-            available_tools = await self.server_instance.list_tools()
+            available_tools = await self._on_server_loop(
+                self.server_instance.list_tools()
+            )
 
             # Filter by server if specified
             if server_filter != "all":
@@ -767,14 +834,16 @@ class GradioWebInterface:
             # Select routing strategy
             if strategy == "auto":
                 # Use the server's routing engine
-                result = await self.server_instance.routing_engine.select_tools(
-                    context, available_tools
+                result = await self._on_server_loop(
+                    self.server_instance.routing_engine.select_tools(
+                        context, available_tools
+                    )
                 )
             else:
                 # Use specific strategy
                 router = self.server_instance.routing_engine.routers[strategy]
-                result = await router.select_tools_with_metrics(
-                    context, available_tools
+                result = await self._on_server_loop(
+                    router.select_tools_with_metrics(context, available_tools)
                 )
 
             execution_time = (time.time() - start_time) * 1000
@@ -790,9 +859,7 @@ class GradioWebInterface:
                     {
                         "name": tool.name,
                         "server": tool.server_name,
-                        "description": tool.description[:100] + "..."
-                        if len(tool.description) > 100
-                        else tool.description,
+                        "description": _shorten(tool.description, 100),
                         "usage_count": tool.usage_count,
                     }
                     for tool in result.tools[:max_tools]
@@ -813,15 +880,7 @@ class GradioWebInterface:
             ]
 
             # All tools dataframe
-            tools_data = [
-                [
-                    tool.name,
-                    tool.server_name,
-                    tool.description[:50] + "...",
-                    tool.usage_count,
-                ]
-                for tool in available_tools
-            ]
+            tools_data = _tool_rows(available_tools)
 
             return (
                 results_dict,
@@ -832,9 +891,6 @@ class GradioWebInterface:
                 execution_time,
                 len(result.tools),
             )
-
-        try:
-            return asyncio.run(_async_test_with_progress())
         except Exception as e:
             self.logger.error(f"Tool selection test failed: {e}")
             error_status = (
@@ -896,9 +952,7 @@ class GradioWebInterface:
                     {
                         "name": tool.name,
                         "server": tool.server_name,
-                        "description": tool.description[:100] + "..."
-                        if len(tool.description) > 100
-                        else tool.description,
+                        "description": _shorten(tool.description, 100),
                         "usage_count": tool.usage_count,
                     }
                     for tool in result.tools[:max_tools]
@@ -914,15 +968,7 @@ class GradioWebInterface:
             ]
 
             # All tools dataframe
-            tools_data = [
-                [
-                    tool.name,
-                    tool.server_name,
-                    tool.description[:50] + "...",
-                    tool.usage_count,
-                ]
-                for tool in available_tools
-            ]
+            tools_data = _tool_rows(available_tools)
 
             return results_dict, execution_info, tool_choices, tools_data
 
@@ -971,12 +1017,11 @@ class GradioWebInterface:
         except Exception as e:
             return {"error": str(e), "status": "failed"}
 
-    def _execute_tool_with_history(
+    async def _execute_tool_with_history(
         self, selected_tool: str, tool_args: str, execution_history: list
     ) -> tuple[dict, str, list, list]:
         """Enhanced tool execution with history tracking."""
-
-        async def _async_execute_with_history():
+        try:
             if not selected_tool:
                 return (
                     {"error": "No tool selected"},
@@ -1002,7 +1047,9 @@ class GradioWebInterface:
             start_time = time.time()
 
             # Execute tool
-            result = await self.server_instance.call_tool(tool_name, args)
+            result = await self._on_server_loop(
+                self.server_instance.call_tool(tool_name, args)
+            )
 
             execution_time = (time.time() - start_time) * 1000
 
@@ -1040,9 +1087,6 @@ class GradioWebInterface:
                 new_history,
                 new_history,
             )
-
-        try:
-            return asyncio.run(_async_execute_with_history())
         except Exception as e:
             error_status = f'<div class="metric-card error-text">❌ Execution failed: {str(e)}</div>'
             return (
@@ -1062,23 +1106,11 @@ class GradioWebInterface:
                 f'<div class="metric-card error-text">❌ Invalid JSON: {str(e)}</div>'
             )
 
-    def _load_available_tools(self) -> list:
+    async def _load_available_tools(self) -> list:
         """Load all available tools for display."""
-
-        async def _async_load():
-            tools = await self.server_instance.list_tools()
-            return [
-                [
-                    tool.name,
-                    tool.server_name,
-                    tool.description[:50] + "...",
-                    tool.usage_count,
-                ]
-                for tool in tools
-            ]
-
         try:
-            return asyncio.run(_async_load())
+            tools = await self._on_server_loop(self.server_instance.list_tools())
+            return _tool_rows(tools)
         except Exception as e:
             self.logger.error(f"Failed to load tools: {e}")
             return []
@@ -1221,23 +1253,22 @@ class GradioWebInterface:
         except Exception:
             return '<div class="status-card"><h4>🔴 Server Status Unknown</h4></div>'
 
-    def _refresh_status(self) -> tuple[str, dict, list, dict]:
+    async def _refresh_status(self) -> tuple[str, dict, list, dict]:
         """Refresh all status information."""
-
-        async def _async_refresh():
+        try:
             # Server status
             status_html = self._get_server_status_html()
 
             # Metrics
             metrics = {}
             if hasattr(self.server_instance, "get_metrics"):
-                metrics = await self.server_instance.get_metrics()
+                metrics = await self._on_server_loop(self.server_instance.get_metrics())
 
             # Child servers
             child_data = []
             if hasattr(self.server_instance, "child_manager"):
-                child_status = (
-                    await self.server_instance.child_manager.get_server_status()
+                child_status = await self._on_server_loop(
+                    self.server_instance.child_manager.get_server_status()
                 )
                 for name, info in child_status.items():
                     child_data.append(
@@ -1254,24 +1285,22 @@ class GradioWebInterface:
             health = {"status": "unknown", "message": "Health check not available"}
 
             return status_html, metrics, child_data, health
-
-        try:
-            return asyncio.run(_async_refresh())
         except Exception as e:
             return f"Error: {str(e)}", {}, [], {"error": str(e)}
 
-    def _restart_child_server(self, server_name: str) -> list:
+    async def _restart_child_server(self, server_name: str) -> list:
         """Restart a child server."""
-
-        async def _async_restart():
+        try:
             if hasattr(self.server_instance, "child_manager") and server_name:
-                await self.server_instance.child_manager.restart_server(server_name)
+                await self._on_server_loop(
+                    self.server_instance.child_manager.restart_server(server_name)
+                )
 
             # Return updated child server status
             child_data = []
             if hasattr(self.server_instance, "child_manager"):
-                child_status = (
-                    await self.server_instance.child_manager.get_server_status()
+                child_status = await self._on_server_loop(
+                    self.server_instance.child_manager.get_server_status()
                 )
                 for name, info in child_status.items():
                     child_data.append(
@@ -1285,17 +1314,13 @@ class GradioWebInterface:
                     )
 
             return child_data
-
-        try:
-            return asyncio.run(_async_restart())
         except Exception as e:
             self.logger.error(f"Failed to restart server {server_name}: {e}")
             return []
 
-    def _run_health_check(self) -> dict:
+    async def _run_health_check(self) -> dict:
         """Run health check."""
-
-        async def _async_health_check():
+        try:
             # Import health checker
             from rich.console import Console
 
@@ -1308,33 +1333,97 @@ class GradioWebInterface:
             result = await checker.run_health_check(output_format="json", verbose=False)
 
             return result
-
-        try:
-            return asyncio.run(_async_health_check())
         except Exception as e:
             return {"error": str(e), "status": "failed"}
 
+    async def _poll_status(self) -> tuple[str, dict, list, dict]:
+        """Refresh status for the auto-refresh timer.
+
+        Every open dashboard has its own timer, so a status refreshed by
+        another dashboard shortly before, or still being refreshed, is reused.
+
+        Returns:
+            Status outputs of the monitor tab.
+        """
+        if (
+            self._polled_status is not None
+            and time.monotonic() - self._polled_status[0] < STATUS_CACHE_TTL
+        ):
+            return self._polled_status[1]
+
+        if self._pending_status is None:
+            self._pending_status = asyncio.ensure_future(self._refresh_status())
+            self._pending_status.add_done_callback(self._store_polled_status)
+
+        # Shield so one closed dashboard does not cancel the shared refresh
+        return await asyncio.shield(self._pending_status)
+
+    def _store_polled_status(
+        self, future: asyncio.Future[tuple[str, dict, list, dict]]
+    ) -> None:
+        """Share a finished status refresh with the dashboards polling next."""
+        self._pending_status = None
+        if not future.cancelled() and future.exception() is None:
+            self._polled_status = (time.monotonic(), future.result())
+
+    def _poll_logs(
+        self, log_level: str, auto_refresh: bool, seen_version: Any
+    ) -> tuple[Any, Any]:
+        """Refresh logs for the auto-refresh timer if they changed.
+
+        Args:
+            log_level: Log level to filter by.
+            auto_refresh: Whether the client has auto-refresh enabled.
+            seen_version: Log version the client last received.
+
+        Returns:
+            The logs, or an update leaving them as they are, and the log
+            version the client now has.
+        """
+        if not auto_refresh:
+            return gr.update(), seen_version
+
+        try:
+            stat = self._log_file().stat()
+            version = (stat.st_mtime_ns, stat.st_size, log_level)
+        except OSError:
+            version = None
+
+        if version is not None and version == seen_version:
+            return gr.update(), seen_version
+        return self._get_recent_logs(log_level), version
+
+    def _log_file(self) -> Path:
+        """Get the path of the server's log file."""
+        return Path(self.server_config.logging.file or "./logs/meta-server.log")
+
     def _get_recent_logs(self, log_level: str = "INFO") -> str:
         """Get recent log entries."""
         try:
-            log_file = Path(self.server_config.logging.file or "./logs/meta-server.log")
+            log_file = self._log_file()
 
             if not log_file.exists():
                 return "Log file not found"
 
-            # Read last 100 lines
-            with open(log_file) as f:
-                lines = f.readlines()
-                recent_lines = lines[-100:] if len(lines) > 100 else lines
+            # Read last 100 lines, from the end of the file backwards
+            with open(log_file, "rb") as f:
+                end = f.seek(0, os.SEEK_END)
+                data = b""
+                while end > 0 and data.count(b"\n") <= LOG_TAIL_LINES:
+                    start = max(0, end - LOG_READ_BLOCK_SIZE)
+                    f.seek(start)
+                    data = f.read(end - start) + data
+                    end = start
+
+            lines = data.decode("utf-8", errors="replace").splitlines(keepends=True)
+            recent_lines = lines[-LOG_TAIL_LINES:]
 
-                # Filter by log level if specified
-                if log_level != "ALL":
-                    filtered_lines = [
-                        line for line in recent_lines if log_level in line
-                    ]
-                    return "".join(filtered_lines)
+            # Filter by log level if specified
+            if log_level != "ALL":
+                filtered_lines = [line for line in recent_lines if log_level in line]
+                return "".join(filtered_lines)
 
-                return "".join(recent_lines)
+            return "".join(recent_lines)
 
         except Exception as e:
             return f"Error reading logs: {str(e)}"
@@ -1594,8 +1683,6 @@ class GradioWebInterface:
     def _merge_imported_tools(self, imported_tools: list) -> None:
         """Merge imported tools with existing server tools."""
         try:
-            from ..config.models import Tool
-
             # Convert imported tool data to Tool objects
             new_tools = []
             for tool_data in imported_tools:
@@ -1637,9 +1724,11 @@ class GradioWebInterface:
             host=self.config.web_ui.host,
             port=self.config.web_ui.port,
         )
+        self._server_loop = asyncio.get_running_loop()
 
-        # Launch Gradio app
-        self.app.launch(
+        # Launch Gradio app in a worker thread so startup doesn't block the loop
+        await asyncio.to_thread(
+            self.app.launch,
             server_name=self.config.web_ui.host,
             server_port=self.config.web_ui.port,
             share=False,
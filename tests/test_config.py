@@ -1,5 +1,11 @@
 """Tests for configuration system."""
 
+import os
+from unittest.mock import patch
+
+import pytest
+import yaml
+
 from meta_mcp.config.loader import expand_env_vars, load_config, save_config
 from meta_mcp.config.models import MetaMCPConfig
 
@@ -59,6 +65,21 @@ class TestConfigLoader:
         assert loaded_config.server.name == "test-server"
         assert loaded_config.strategy.primary == "llm"
 
+    def test_unchanged_config_file_not_parsed_again(self, tmp_path):
+        """Test a config file is only re-parsed after it changes."""
+        config_file = tmp_path / "cached_config.yaml"
+        config_file.write_text("server:\n  name: first\n")
+
+        with patch("meta_mcp.config.loader.yaml.load", wraps=yaml.load) as parse:
+            assert load_config(str(config_file)).server.name == "first"
+            assert load_config(str(config_file)).server.name == "first"
+            assert parse.call_count == 1
+
+            config_file.write_text("server:\n  name: second\n")
+            os.utime(config_file, ns=(0, 0))
+            assert load_config(str(config_file)).server.name == "second"
+            assert parse.call_count == 2
+
 
 class TestConfigModels:
     """Test configuration model validation."""
@@ -85,6 +106,18 @@ class TestConfigModels:
         assert config.fallback == "vector"
         assert config.max_tools == 5
 
+    def test_strategy_config_rejects_unknown_matrix_dtype(self):
+        """Test that only supported matrix dtypes pass validation."""
+        from pydantic import ValidationError
+
+        from meta_mcp.config.models import StrategyConfig
+
+        assert StrategyConfig(local_matrix_dtype="float16").local_matrix_dtype == (
+            "float16"
+        )
+        with pytest.raises(ValidationError):
+            StrategyConfig(local_matrix_dtype="int8")
+
     def test_tool_model(self):
         """Test tool model."""
         from meta_mcp.config.models import Tool
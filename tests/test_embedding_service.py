@@ -1,9 +1,15 @@
 """Tests for embedding service with fallback behavior."""
 
+import asyncio
+import threading
+from unittest.mock import AsyncMock
+
+import numpy as np
 import pytest
 
-from meta_mcp.config.models import EmbeddingConfig, MetaMCPConfig
-from meta_mcp.embeddings.service import EmbeddingService
+from meta_mcp.config.models import EmbeddingConfig, MetaMCPConfig, Tool
+from meta_mcp.embeddings.matrix import EmbeddingMatrix
+from meta_mcp.embeddings.service import EmbeddingBatcher, EmbeddingService
 
 
 class TestEmbeddingService:
@@ -97,3 +103,131 @@ class TestEmbeddingService:
 
         # Cache should be cleared
         assert len(getattr(service, "_cache", {})) == 0
+
+    @pytest.mark.asyncio
+    async def test_fallback_encoding_runs_on_private_thread(self, config_fallback_only):
+        """Test model encoding doesn't use the loop's default executor."""
+        service = EmbeddingService(config_fallback_only)
+        threads = []
+
+        class Model:
+            def encode(self, texts, batch_size=None):
+                threads.append(threading.current_thread().name)
+                return np.ones((len(texts), 2), dtype=np.float32)
+
+        service.sentence_transformer_model = Model()
+
+        assert await service._embed_batch_sentence_transformers(["a", "b"]) == [
+            [1.0, 1.0],
+            [1.0, 1.0],
+        ]
+        assert threads[0].startswith("embedding")
+        service._executor.shutdown()
+
+
+class TestEmbeddingBatcher:
+    """Test coalescing of concurrent embedding requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_batch(self):
+        """Test concurrent submissions are embedded in one batch call."""
+        service = AsyncMock()
+        service.embed_batch.side_effect = lambda texts: [[float(len(t))] for t in texts]
+        batcher = EmbeddingBatcher(service, max_batch=8, max_wait_ms=20)
+
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("bb"), batcher.submit("ccc")
+        )
+        await batcher.close()
+
+        assert results == [[1.0], [2.0], [3.0]]
+        service.embed_batch.assert_called_once_with(["a", "bb", "ccc"])
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_propagates(self):
+        """Test a failed batch call raises for every waiting request."""
+        service = AsyncMock()
+        service.embed_batch.side_effect = RuntimeError("backend down")
+        batcher = EmbeddingBatcher(service, max_batch=8, max_wait_ms=1)
+
+        with pytest.raises(RuntimeError, match="backend down"):
+            await batcher.submit("query")
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_short_batch_result_fails_every_request(self):
+        """Test a batch call returning too few embeddings does not strand waiters."""
+        service = AsyncMock()
+        service.embed_batch.return_value = [[1.0]]
+        batcher = EmbeddingBatcher(service, max_batch=8, max_wait_ms=20)
+
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+        await batcher.close()
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_dispatched_requests(self):
+        """Test closing cancels requests whose batch is still being embedded."""
+        started = asyncio.Event()
+
+        async def embed_batch(texts):
+            started.set()
+            await asyncio.Event().wait()
+
+        service = AsyncMock()
+        service.embed_batch.side_effect = embed_batch
+        batcher = EmbeddingBatcher(service, max_batch=8, max_wait_ms=1)
+
+        request = asyncio.create_task(batcher.submit("query"))
+        await started.wait()
+        await batcher.close()
+
+        with pytest.raises(asyncio.CancelledError):
+            await request
+
+
+class TestEmbeddingMatrix:
+    """Test contiguous tool embedding storage."""
+
+    @pytest.fixture
+    def tools(self):
+        """Create tools with unit-length embeddings."""
+        return [
+            Tool(
+                id=f"server.tool{i}",
+                name=f"tool{i}",
+                server_name="server",
+                description=f"Tool {i}",
+                embedding=embedding,
+            )
+            for i, embedding in enumerate([[1.0, 0.0], [0.0, 1.0], [0.6, 0.8], None])
+        ]
+
+    def test_from_tools_skips_missing_embeddings(self, tools):
+        """Test only embedded tools become matrix rows."""
+        matrix = EmbeddingMatrix.from_tools(tools)
+
+        assert len(matrix) == 3
+        assert matrix.matrix.shape == (3, 2)
+        assert matrix.ids[2] == "server.tool2"
+
+    def test_top_k(self, tools):
+        """Test top-k returns the best rows in score order."""
+        matrix = EmbeddingMatrix.from_tools(tools)
+
+        top = matrix.top_k([0.0, 1.0], 2)
+
+        assert [tool_id for tool_id, _ in top] == ["server.tool1", "server.tool2"]
+        assert len(matrix.top_k([0.0, 1.0], 10)) == 3
+
+    def test_float16_storage(self, tools):
+        """Test half-precision storage scores like float32."""
+        matrix = EmbeddingMatrix.from_tools(tools, dtype="float16")
+
+        assert matrix.matrix.dtype == np.float16
+        scores = matrix.scores([0.0, 1.0])
+        assert scores.dtype == np.float32
+        assert scores == pytest.approx([0.0, 1.0, 0.8], abs=1e-3)
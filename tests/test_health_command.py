@@ -2,11 +2,13 @@
 
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 from rich.console import Console
 
 from meta_mcp.config.models import MetaMCPConfig
 from meta_mcp.health.checker import HealthChecker, HealthStatus
+from meta_mcp.health.dependency_checker import DependencyChecker
 
 
 class TestHealthChecker:
@@ -180,3 +182,29 @@ class TestHealthChecker:
             assert "status" in result
             assert "summary" in result
             assert "results" in result
+
+
+class TestDependencyChecker:
+    """Test dependency checker functionality."""
+
+    @pytest.mark.asyncio
+    async def test_checks_share_one_http_client(self):
+        """Test connectivity checks reuse a client until it is closed."""
+        checker = DependencyChecker()
+        requests = []
+
+        def handler(request):
+            requests.append(request.url.path)
+            return httpx.Response(200, json={"data": [{"id": "model"}]})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        checker._client = client
+
+        endpoint = "http://localhost:1234/v1"
+        assert await checker.check_lm_studio_connectivity(endpoint)
+        assert await checker.get_available_models(endpoint) == ["model"]
+        assert requests == ["/v1/models", "/v1/models"]
+
+        await checker.close()
+        assert client.is_closed
+        assert checker._client is None
@@ -7,6 +7,7 @@ import pytest
 
 from meta_mcp.config.models import ChildServerConfig, MetaMCPConfig
 from meta_mcp.routing.base import SelectionContext
+from meta_mcp.server.admission import OverloadError
 from meta_mcp.server.meta_server import MetaMCPServer, RoutingEngine
 
 
@@ -157,6 +158,12 @@ class TestMetaMCPServerIntegration:
             "file-server.read", {"path": "/test/file.txt"}
         )
 
+        # Latency is tracked for the completed call
+        performance = server.get_status()["performance"]
+        assert performance["total_requests"] == 1
+        assert performance["p95_response_time_ms"] >= 0.0
+        assert server._latency.count == 1
+
     @pytest.mark.asyncio
     async def test_fallback_strategy_execution(self, config):
         """Test fallback strategy when primary fails."""
@@ -189,6 +196,43 @@ class TestMetaMCPServerIntegration:
         assert result.metadata.get("used_fallback") is True
         mock_fallback.select_tools_with_metrics.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_slow_primary_strategy_is_hedged(self, config):
+        """Test fallback wins the race when the primary strategy is slow."""
+        config.strategy.hedge_ms = 10
+        routing_engine = RoutingEngine(config)
+        primary_cancelled = asyncio.Event()
+
+        async def slow_primary(context, tools):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                primary_cancelled.set()
+                raise
+
+        mock_primary = AsyncMock()
+        mock_primary.select_tools_with_metrics.side_effect = slow_primary
+
+        mock_fallback = AsyncMock()
+        mock_fallback_result = MagicMock()
+        mock_fallback_result.tools = []
+        mock_fallback_result.confidence_score = 0.6
+        mock_fallback_result.metadata = {}
+        mock_fallback.select_tools_with_metrics.return_value = mock_fallback_result
+
+        routing_engine.routers = {"vector": mock_primary, "llm": mock_fallback}
+        routing_engine.primary_strategy = "vector"
+        routing_engine.fallback_strategy = "llm"
+
+        context = SelectionContext(
+            query="test", recent_messages=[], active_tools=[], user_preferences={}
+        )
+        result = await asyncio.wait_for(routing_engine.select_tools(context, []), 1)
+
+        assert result is mock_fallback_result
+        assert result.metadata["used_fallback"] is True
+        await asyncio.wait_for(primary_cancelled.wait(), 1)
+
     @pytest.mark.asyncio
     async def test_server_status_reporting(self, server):
         """Test comprehensive status reporting."""
@@ -201,6 +245,7 @@ class TestMetaMCPServerIntegration:
         status = server.get_status()
 
         assert status["running"] is True
+        assert status["ready"] is False  # Tools not loaded yet
         assert status["config"]["strategy"] == "vector"
         assert status["tools"]["total_available"] == 2
         assert status["performance"]["total_requests"] == 100
@@ -251,6 +296,27 @@ class TestMetaMCPServerIntegration:
             # Note: health_check may be called twice due to loop execution
             assert mock_child_manager.health_check.call_count >= 1
 
+    @pytest.mark.asyncio
+    async def test_admission_control_sheds_load(self, server):
+        """Test requests are rejected while P95 latency is over the limit."""
+        server.admission.max_p95_ms = 100.0
+        server.admission.latency.record(500.0)
+        server.child_manager = AsyncMock()
+        server.child_manager.call_tool.return_value = {"result": "ok"}
+
+        # Simulate a slow request still in flight
+        server.admission.queued_requests = 1
+        with pytest.raises(OverloadError):
+            await server.call_tool("test.tool", {})
+        server.child_manager.call_tool.assert_not_called()
+        assert server.get_status()["admission"]["state"] == "overloaded"
+        assert server.admission.rejected_requests == 1
+
+        # Once drained, a request is admitted so latency can recover
+        server.admission.queued_requests = 0
+        assert await server.call_tool("test.tool", {}) == {"result": "ok"}
+        assert server.admission.queued_requests == 0
+
     @pytest.mark.asyncio
     async def test_error_handling_integration(self, server):
         """Test error handling across components."""
@@ -269,6 +335,7 @@ class TestMetaMCPServerIntegration:
 
         with pytest.raises(Exception, match="Tool failed"):
             await server.call_tool("test.tool", {})
+        assert server.get_status()["performance"]["error_count"] == 1
 
     @pytest.mark.asyncio
     async def test_metrics_collection_integration(self, server):
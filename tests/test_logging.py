@@ -0,0 +1,52 @@
+"""Tests for logging utilities."""
+
+import logging
+
+from meta_mcp.config.models import LoggingConfig
+from meta_mcp.utils.logging import (
+    StructuredDataFilter,
+    get_logger,
+    setup_logging,
+    stop_logging,
+)
+
+
+class TestStructuredLogger:
+    """Test structured logging."""
+
+    def test_structured_data_rendered_by_filter(self):
+        """Test key=value data is appended when the record is emitted."""
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        handler.addFilter(StructuredDataFilter())
+
+        logger = get_logger("meta_mcp.tests.structured")
+        logger.logger.addHandler(handler)
+        logger.logger.setLevel(logging.DEBUG)
+        try:
+            logger.info("Search completed", results=3, query="read file")
+            logger.info("No data")
+        finally:
+            logger.logger.removeHandler(handler)
+
+        assert records[0].getMessage() == (
+            "Search completed | results=3 | query=read file"
+        )
+        assert records[0].funcName == "test_structured_data_rendered_by_filter"
+        assert records[1].getMessage() == "No data"
+
+    def test_file_output_includes_structured_data(self, tmp_path):
+        """Test structured data reaches the file handler via the queue."""
+        log_file = tmp_path / "meta.log"
+        root = logging.getLogger()
+        previous_level = root.level
+        setup_logging(LoggingConfig(level="INFO", console=False, file=str(log_file)))
+        try:
+            get_logger("meta_mcp.tests.file").info("Tool called", tool_id="fs.read")
+        finally:
+            stop_logging()
+            root.handlers.clear()
+            root.setLevel(previous_level)
+
+        assert "Tool called | tool_id=fs.read" in log_file.read_text()
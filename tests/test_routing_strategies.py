@@ -1,14 +1,19 @@
 """Tests for routing strategies (vector, LLM, RAG)."""
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
 from meta_mcp.config.models import MetaMCPConfig, Tool
+from meta_mcp.embeddings.service import normalize_embedding
 from meta_mcp.routing.base import SelectionContext
 from meta_mcp.routing.llm_router import LLMRouter
 from meta_mcp.routing.rag_router import RAGRouter
-from meta_mcp.routing.vector_router import VectorSearchRouter
+from meta_mcp.routing.vector_router import (
+    USAGE_FLUSH_MAX_PENDING,
+    VectorSearchRouter,
+)
 
 
 class TestVectorRouter:
@@ -24,6 +29,7 @@ class TestVectorRouter:
         """Mock embedding service."""
         service = AsyncMock()
         service.embed.return_value = [0.1, 0.2, 0.3]
+        service.embed_batch.side_effect = lambda texts: [[0.1, 0.2, 0.3] for _ in texts]
         return service
 
     @pytest.fixture
@@ -77,6 +83,64 @@ class TestVectorRouter:
         assert hasattr(router, "embedding_service")
         assert hasattr(router, "vector_store")
 
+    @pytest.mark.asyncio
+    async def test_vector_selection_scores(
+        self, config, mock_embedding_service, mock_vector_store, sample_tools
+    ):
+        """Test confidence and top scores are derived from search scores."""
+        mock_vector_store.search_similar_tools.return_value = [
+            {"tool_id": "tool1", "score": 0.91234},
+            {"tool_id": "tool2", "score": 0.55555},
+        ]
+        router = VectorSearchRouter(config, mock_embedding_service, mock_vector_store)
+
+        result = await router.select_tools(
+            SelectionContext(query="read a file"), sample_tools
+        )
+
+        assert [tool.id for tool in result.tools] == ["tool1", "tool2"]
+        assert result.metadata["top_scores"] == [0.912, 0.556]
+        # Two results out of max_tools=10: 0.91234 * (0.8 + 0.2 * 2 / 10)
+        assert result.confidence_score == 0.766
+
+    @pytest.mark.asyncio
+    async def test_adaptive_search_scores_locally(
+        self, config, mock_embedding_service, mock_vector_store, sample_tools
+    ):
+        """Test the no-threshold retry uses local embeddings, not Qdrant."""
+        config.strategy.local_knn_max_tools = 0
+        mock_vector_store.search_similar_tools.return_value = []
+        sample_tools[0].embedding = [0.0, 0.0, 1.0]
+        sample_tools[1].embedding = [1.0, 0.0, 0.0]
+        router = VectorSearchRouter(config, mock_embedding_service, mock_vector_store)
+        await router.update_tool_embeddings(sample_tools)
+
+        result = await router.select_tools(
+            SelectionContext(query="read a file"), sample_tools
+        )
+
+        assert [tool.id for tool in result.tools] == ["tool1", "tool2"]
+        mock_vector_store.search_similar_tools.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_small_catalog_searched_locally(
+        self, config, mock_embedding_service, mock_vector_store, sample_tools
+    ):
+        """Test small catalogs are searched in memory without Qdrant."""
+        sample_tools[0].embedding = [0.0, 0.0, 1.0]
+        sample_tools[1].embedding = [1.0, 0.0, 0.0]
+        router = VectorSearchRouter(config, mock_embedding_service, mock_vector_store)
+        await router.update_tool_embeddings(sample_tools)
+
+        result = await router.select_tools(
+            SelectionContext(query="read a file"), sample_tools
+        )
+
+        # Only tool1 clears the 0.4 threshold
+        assert [tool.id for tool in result.tools] == ["tool1"]
+        assert result.metadata["top_scores"] == [0.802]
+        mock_vector_store.search_similar_tools.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_embedding_update(
         self, config, mock_embedding_service, mock_vector_store, sample_tools
@@ -89,6 +153,117 @@ class TestVectorRouter:
         assert hasattr(router, "embedding_service")
         assert hasattr(router, "vector_store")
 
+    @pytest.mark.asyncio
+    async def test_unchanged_tools_reuse_embeddings(
+        self, config, mock_embedding_service, mock_vector_store, sample_tools
+    ):
+        """Test re-registered tools only embed when their metadata changes."""
+        router = VectorSearchRouter(config, mock_embedding_service, mock_vector_store)
+
+        await router.update_tool_embeddings(sample_tools)
+        refreshed = [
+            tool.model_copy(update={"embedding": None}) for tool in sample_tools
+        ]
+        refreshed[1].description = "Search the web for pages"
+        await router.update_tool_embeddings(refreshed)
+
+        assert mock_embedding_service.embed_batch.call_count == 2
+        second_batch = mock_embedding_service.embed_batch.call_args_list[1][0][0]
+        assert second_batch == ["Search the web for pages"]
+        assert refreshed[0].embedding == sample_tools[0].embedding
+
+        # Only the changed tool is written back to the vector store
+        stored = mock_vector_store.store_tool_embeddings.call_args_list[1][0][0]
+        assert [tool.id for tool in stored] == ["tool2"]
+        # Indexing is re-enabled after the initial load only
+        mock_vector_store.finalize_bulk_load.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_removed_tools_are_deleted(
+        self, config, mock_embedding_service, mock_vector_store, sample_tools
+    ):
+        """Test tools dropped from the registry are removed from the store."""
+        router = VectorSearchRouter(config, mock_embedding_service, mock_vector_store)
+
+        await router.update_tool_embeddings(sample_tools)
+        await router.update_tool_embeddings(sample_tools[:1])
+
+        mock_vector_store.delete_tool_embeddings.assert_called_once_with(["tool2"])
+        assert mock_vector_store.store_tool_embeddings.call_args_list[1][0][0] == []
+        assert len(router._embedding_matrix) == 1
+
+    @pytest.mark.asyncio
+    async def test_tool_usage_updates_are_batched(
+        self, config, mock_embedding_service, mock_vector_store
+    ):
+        """Test usage updates are buffered and written in one batch."""
+        router = VectorSearchRouter(config, mock_embedding_service, mock_vector_store)
+
+        await router.update_tool_usage("tool1", 1, "2024-01-01T00:00:00Z")
+        await router.update_tool_usage("tool2", 4, "2024-01-01T00:00:01Z")
+        await router.update_tool_usage("tool1", 2, "2024-01-01T00:00:02Z")
+        mock_vector_store.update_tool_usage_batch.assert_not_called()
+
+        await router.cleanup()
+
+        mock_vector_store.update_tool_usage_batch.assert_called_once_with(
+            {
+                "tool1": (2, "2024-01-01T00:00:02Z"),
+                "tool2": (4, "2024-01-01T00:00:01Z"),
+            }
+        )
+
+    @pytest.mark.asyncio
+    async def test_tool_usage_burst_is_flushed_early(
+        self, config, mock_embedding_service, mock_vector_store
+    ):
+        """Test a burst of usage updates is written without waiting."""
+        router = VectorSearchRouter(config, mock_embedding_service, mock_vector_store)
+
+        for i in range(USAGE_FLUSH_MAX_PENDING):
+            await router.update_tool_usage(f"tool{i}", 1, "2024-01-01T00:00:00Z")
+
+        updates = mock_vector_store.update_tool_usage_batch.call_args[0][0]
+        assert len(updates) == USAGE_FLUSH_MAX_PENDING
+        assert router._usage_flush_buffer == {}
+
+        await router.cleanup()
+
+    def test_tool_index_used_for_registered_tools(
+        self, config, mock_embedding_service, mock_vector_store, sample_tools
+    ):
+        """Test the persistent index only serves the registered tool list."""
+        router = VectorSearchRouter(config, mock_embedding_service, mock_vector_store)
+        router.set_tool_index(sample_tools)
+
+        assert router._get_tool_lookup(sample_tools) is router._tool_index
+
+        subset = sample_tools[:1]
+        assert list(router._get_tool_lookup(subset)) == ["tool1"]
+
+        sample_tools.append(sample_tools[0].model_copy(update={"id": "tool3"}))
+        assert "tool3" in router._get_tool_lookup(sample_tools)
+
+    @pytest.mark.asyncio
+    async def test_query_embedding_cache(
+        self, config, mock_embedding_service, mock_vector_store
+    ):
+        """Test repeated and concurrent queries share one embedding call."""
+        router = VectorSearchRouter(config, mock_embedding_service, mock_vector_store)
+
+        results = await asyncio.gather(
+            router._embed_query("read a file"),
+            router._embed_query("read a file"),
+        )
+        cached = await router._embed_query("  Read a file ")
+
+        # Query embeddings are normalized to unit length for dot-product search
+        expected = pytest.approx([0.267261, 0.534522, 0.801784], rel=1e-5)
+        assert results == [expected, expected]
+        assert cached == expected
+        mock_embedding_service.embed_batch.assert_called_once_with(["read a file"])
+        assert router.get_metrics()["query_cache_hits"] == 1
+
 
 class TestLLMRouter:
     """Test LLM-based routing strategy."""
@@ -181,6 +356,7 @@ class TestRAGRouter:
     def mock_rag_pipeline(self):
         """Mock RAG pipeline."""
         pipeline = AsyncMock()
+        pipeline.embed_query.return_value = [0.1, 0.2, 0.3]
         pipeline.augment_query_with_context.return_value = (
             "Enhanced query with context",
             [
@@ -270,14 +446,48 @@ class TestRAGRouter:
 
         await router.select_tools(context, sample_tools)
 
-        # Verify context augmentation was called
+        # Verify context augmentation was called with the shared embedding
+        mock_rag_pipeline.embed_query.assert_called_once_with("test query")
         mock_rag_pipeline.augment_query_with_context.assert_called_once()
+        augment_kwargs = mock_rag_pipeline.augment_query_with_context.call_args[1]
+        assert augment_kwargs["query_embedding"] == pytest.approx(
+            normalize_embedding([0.1, 0.2, 0.3])
+        )
+        assert context.cached_embedding == augment_kwargs["query_embedding"]
 
         # Verify enhanced query was used for LLM selection
         mock_llm_client.generate_tool_selection.assert_called_once()
         call_args = mock_llm_client.generate_tool_selection.call_args
         assert call_args[1]["query"] == "Enhanced query with context"
 
+    @pytest.mark.asyncio
+    async def test_rag_reuses_cached_embedding(
+        self, config, mock_rag_pipeline, mock_llm_client, sample_tools
+    ):
+        """Test an embedding left on the context by another router is reused."""
+        router = RAGRouter(config, mock_rag_pipeline, mock_llm_client)
+        context = SelectionContext(query="test query")
+        context.cached_embedding = [0.5, 0.5]
+
+        await router.select_tools(context, sample_tools)
+
+        mock_rag_pipeline.embed_query.assert_not_called()
+        augment_kwargs = mock_rag_pipeline.augment_query_with_context.call_args[1]
+        assert augment_kwargs["query_embedding"] == [0.5, 0.5]
+
+    @pytest.mark.asyncio
+    async def test_rag_does_not_cache_failed_embedding(
+        self, config, mock_rag_pipeline, mock_llm_client, sample_tools
+    ):
+        """Test a failed query embedding isn't left for other routers."""
+        router = RAGRouter(config, mock_rag_pipeline, mock_llm_client)
+        mock_rag_pipeline.embed_query.return_value = None
+        context = SelectionContext(query="test query")
+
+        await router.select_tools(context, sample_tools)
+
+        assert context.cached_embedding is None
+
     @pytest.mark.asyncio
     async def test_rag_documentation_integration(
         self, config, mock_rag_pipeline, mock_llm_client
@@ -0,0 +1,168 @@
+"""Tests for the dependency-managing server wrapper."""
+
+import os
+import socket
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from meta_mcp.server_wrapper import RUNTIME_SCRIPTS, MetaMCPWrapper
+
+
+class TestQdrantProbes:
+    """Test Qdrant health probing."""
+
+    def test_tcp_probe(self):
+        """Test the TCP probe distinguishes open and closed ports."""
+        wrapper = MetaMCPWrapper()
+        with socket.socket() as listener:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen()
+            wrapper.qdrant_port = listener.getsockname()[1]
+            assert wrapper._tcp_probe("127.0.0.1")
+
+        assert not wrapper._tcp_probe("127.0.0.1")
+
+    def test_http_probe_skipped_when_port_closed(self):
+        """Test no HTTP request is made when nothing is listening."""
+        wrapper = MetaMCPWrapper()
+        with (
+            patch.object(wrapper, "_tcp_probe", return_value=False),
+            patch.object(wrapper, "_http_probe") as http_probe,
+        ):
+            assert not wrapper.check_qdrant_health("localhost")
+        http_probe.assert_not_called()
+
+    def test_wait_for_qdrant_retries_until_healthy(self):
+        """Test waiting returns as soon as Qdrant becomes healthy."""
+        wrapper = MetaMCPWrapper()
+        with (
+            patch.object(
+                wrapper, "check_qdrant_health", side_effect=[False, False, True]
+            ) as check,
+            patch("meta_mcp.server_wrapper.time.sleep") as sleep,
+        ):
+            assert wrapper.wait_for_qdrant("localhost")
+
+        assert check.call_count == 3
+        delays = [call.args[0] for call in sleep.call_args_list]
+        assert delays[0] == 0.05
+        assert delays[1] > delays[0]
+
+    def test_apple_container_ip_is_retried_while_waiting(self):
+        """Test the container IP lookup is retried until one is assigned."""
+        wrapper = MetaMCPWrapper()
+        with (
+            patch.object(
+                wrapper, "_run_script", side_effect=[None, "192.168.64.2"]
+            ) as run_script,
+            patch.object(
+                wrapper, "check_qdrant_health", side_effect=[False, True]
+            ) as check,
+            patch("meta_mcp.server_wrapper.time.sleep"),
+        ):
+            assert wrapper.wait_for_apple_qdrant() == "192.168.64.2"
+
+        assert run_script.call_count == 2
+        check.assert_called_with("192.168.64.2")
+
+
+class TestRun:
+    """Test handing over to the server process."""
+
+    def test_execs_server_after_qdrant_is_healthy(self):
+        """Test the wrapper process is replaced by the server CLI."""
+        wrapper = MetaMCPWrapper()
+        with (
+            patch.object(wrapper, "ensure_qdrant", return_value=True),
+            patch.object(wrapper, "warm_server_imports") as warm,
+            patch("meta_mcp.server_wrapper.atexit.register"),
+            patch("meta_mcp.server_wrapper.signal.signal"),
+            patch.object(sys, "argv", ["meta-mcp", "start", "--web-ui"]),
+            patch("meta_mcp.server_wrapper.os.execv") as execv,
+        ):
+            wrapper.run()
+
+        warm.assert_called_once()
+        execv.assert_called_once_with(
+            sys.executable,
+            [sys.executable, "-m", "meta_mcp.main", "start", "--web-ui"],
+        )
+
+    def test_does_not_exec_without_qdrant(self):
+        """Test the server is not started when Qdrant is unavailable."""
+        wrapper = MetaMCPWrapper()
+        with (
+            patch.object(wrapper, "ensure_qdrant", return_value=False),
+            patch.object(wrapper, "warm_server_imports"),
+            patch("meta_mcp.server_wrapper.atexit.register"),
+            patch("meta_mcp.server_wrapper.signal.signal"),
+            patch("meta_mcp.server_wrapper.os.execv") as execv,
+            pytest.raises(SystemExit),
+        ):
+            wrapper.run()
+
+        execv.assert_not_called()
+
+
+class TestRuntimeCache:
+    """Test container runtime detection caching."""
+
+    @pytest.fixture
+    def wrapper(self, tmp_path):
+        """Create a wrapper with its own scripts and cache file."""
+        wrapper = MetaMCPWrapper()
+        wrapper.scripts_dir = tmp_path / "scripts"
+        wrapper.scripts_dir.mkdir()
+        for name in RUNTIME_SCRIPTS:
+            (wrapper.scripts_dir / name).write_text("#!/bin/sh\n")
+        wrapper.runtime_cache_file = tmp_path / "cache" / "runtime.json"
+        return wrapper
+
+    def test_detected_runtime_is_cached(self, wrapper):
+        """Test the detection script only runs on a cache miss."""
+        result = subprocess.CompletedProcess([], 0, stdout="docker\n")
+        with patch(
+            "meta_mcp.server_wrapper.subprocess.run", return_value=result
+        ) as run:
+            assert wrapper.detect_runtime() == "docker"
+            assert wrapper.detect_runtime() == "docker"
+
+        run.assert_called_once()
+
+    def test_cache_invalidated_when_scripts_change(self, wrapper):
+        """Test editing a helper script invalidates the cache."""
+        wrapper._save_runtime_cache("apple", "192.168.64.2")
+        assert wrapper._load_runtime_cache() == ("apple", "192.168.64.2")
+
+        script = wrapper.scripts_dir / "get-qdrant-ip.sh"
+        os.utime(script, (0, 0))
+
+        assert wrapper._load_runtime_cache() == (None, None)
+
+    def test_stale_cached_runtime_is_redetected(self, wrapper):
+        """Test a failing cached runtime is dropped and detected again."""
+        wrapper._save_runtime_cache("docker")
+        detected = subprocess.CompletedProcess([], 0, stdout="apple\n")
+
+        def run(args, **kwargs):
+            if args[0] == "docker-compose":
+                raise FileNotFoundError(args[0])
+            return detected
+
+        with (
+            patch("meta_mcp.server_wrapper.subprocess.run", side_effect=run),
+            patch.object(wrapper, "check_qdrant_health", return_value=False),
+            patch.object(
+                wrapper, "start_qdrant_apple", return_value=(True, "192.168.64.2")
+            ) as start_apple,
+            patch.dict(os.environ),
+        ):
+            assert wrapper.ensure_qdrant()
+
+        start_apple.assert_called_once()
+        assert wrapper.runtime == "apple"
+        assert wrapper.qdrant_host == "192.168.64.2"
+        assert wrapper._load_runtime_cache() == ("apple", None)
@@ -0,0 +1,463 @@
+"""Tests for the Qdrant vector store using an in-memory client."""
+
+import asyncio
+import logging
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+from qdrant_client.http.exceptions import ResponseHandlingException
+
+from meta_mcp.config.models import MetaMCPConfig, Tool
+from meta_mcp.embeddings.service import normalize_embedding
+from meta_mcp.vector_store.qdrant_client import (
+    UPLOAD_BATCH_SIZE,
+    UPLOAD_CONCURRENCY,
+    QdrantVectorStore,
+)
+
+
+class TestQdrantVectorStore:
+    """Test Qdrant vector store functionality."""
+
+    @pytest.fixture
+    def store(self):
+        """Create vector store backed by an in-memory Qdrant client."""
+        store = QdrantVectorStore(MetaMCPConfig())
+        store.client = AsyncQdrantClient(":memory:")
+        return store
+
+    @pytest.fixture
+    def sample_tools(self):
+        """Create sample tools with 384-dimensional embeddings."""
+        return [
+            Tool(
+                id="files.read_file",
+                name="read_file",
+                server_name="files",
+                description="Read a file from disk",
+                embedding=normalize_embedding([1.0] + [0.0] * 383),
+            ),
+            Tool(
+                id="web.fetch_url",
+                name="fetch_url",
+                server_name="web",
+                description="Fetch a URL",
+                embedding=normalize_embedding([0.0, 1.0] + [0.0] * 382),
+            ),
+        ]
+
+    async def _distance(self, store, collection_name):
+        """Get the configured distance for a collection."""
+        info = await store.client.get_collection(collection_name)
+        return info.config.params.vectors.distance
+
+    def test_tool_point_id_is_stable(self):
+        """Test point IDs don't depend on the per-process hash seed."""
+        point_id = QdrantVectorStore._get_tool_point_id("files.read_file")
+
+        assert point_id == 1662514062928571294
+        assert 0 <= point_id < 2**63
+
+    @pytest.mark.asyncio
+    async def test_ensure_collections_uses_dot_for_tools(self, store):
+        """Test tools collection uses dot product on normalized vectors."""
+        await store._ensure_collections()
+
+        assert (
+            await self._distance(store, store.tools_collection) == models.Distance.DOT
+        )
+        assert (
+            await self._distance(store, store.docs_collection) == models.Distance.COSINE
+        )
+
+    @pytest.mark.asyncio
+    async def test_ensure_collections_quantizes_vectors(self, store):
+        """Test both collections are created with int8 scalar quantization."""
+        # The local client accepts but does not keep quantization settings
+        store.client = MagicMock(wraps=store.client)
+
+        await store._ensure_collections()
+
+        create_calls = {
+            call.kwargs["collection_name"]: call.kwargs
+            for call in store.client.create_collection.call_args_list
+        }
+        for collection_name in (store.tools_collection, store.docs_collection):
+            quantization = create_calls[collection_name]["quantization_config"]
+            assert quantization.scalar.type == models.ScalarType.INT8
+            assert quantization.scalar.always_ram is True
+
+        # Only the documents collection is kept on disk
+        docs = create_calls[store.docs_collection]
+        assert docs["vectors_config"].on_disk is True
+        assert docs["hnsw_config"].on_disk is True
+        assert docs["on_disk_payload"] is True
+        assert create_calls[store.tools_collection]["on_disk_payload"] is False
+
+        # Indexing is deferred until the initial tool upload is finished
+        optimizers = create_calls[store.tools_collection]["optimizers_config"]
+        assert optimizers.indexing_threshold == 0
+
+        # Existence of both collections is checked with a single request
+        store.client.get_collections.assert_called_once()
+        store.client.collection_exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ensure_collections_indexes_filter_fields(self, store):
+        """Test the payload fields used in search filters are indexed."""
+        # The local client accepts but does not keep payload indexes
+        store.client = MagicMock(wraps=store.client)
+
+        await store._ensure_collections()
+
+        indexed = {
+            call.kwargs["collection_name"]: call.kwargs["field_name"]
+            for call in store.client.create_payload_index.call_args_list
+        }
+        assert indexed == {
+            store.tools_collection: "server_name",
+            store.docs_collection: "source",
+        }
+
+    @pytest.mark.asyncio
+    async def test_ensure_collections_migrates_cosine_tools(self, store):
+        """Test an existing cosine tools collection is recreated with dot."""
+        await store.client.create_collection(
+            collection_name=store.tools_collection,
+            vectors_config=models.VectorParams(
+                size=384, distance=models.Distance.COSINE
+            ),
+        )
+
+        await store._ensure_collections()
+
+        assert (
+            await self._distance(store, store.tools_collection) == models.Distance.DOT
+        )
+
+    @pytest.mark.asyncio
+    async def test_store_and_search_tools(self, store, sample_tools):
+        """Test stored tool embeddings are found by similarity search."""
+        await store._ensure_collections()
+        await store.store_tool_embeddings(sample_tools)
+
+        results = await store.search_similar_tools(
+            query_vector=normalize_embedding([0.9, 0.1] + [0.0] * 382),
+            limit=1,
+            score_threshold=0.5,
+        )
+
+        assert [result["tool_id"] for result in results] == ["files.read_file"]
+        assert results[0]["score"] == pytest.approx(0.9939, abs=1e-3)
+        # Only IDs and scores are fetched; tool details live in memory
+        assert set(results[0]) == {"tool_id", "score"}
+
+        results = await store.search_similar_tools(
+            query_vector=normalize_embedding([0.9, 0.1] + [0.0] * 382),
+            limit=1,
+            score_threshold=0.5,
+            payload_fields=["server_name"],
+        )
+        assert results[0]["server_name"] == "files"
+        assert "parameters" not in results[0]
+
+    @pytest.mark.asyncio
+    async def test_repeated_search_is_cached(self, store, sample_tools):
+        """Test repeated searches are served from memory until tools change."""
+        await store._ensure_collections()
+        await store.store_tool_embeddings(sample_tools)
+        store.client.search = MagicMock(wraps=store.client.search)
+        query = normalize_embedding([0.9, 0.1] + [0.0] * 382)
+
+        first = await store.search_similar_tools(query, score_threshold=0.5)
+        assert await store.search_similar_tools(query, score_threshold=0.5) == first
+        assert store.client.search.call_count == 1
+
+        # Different parameters miss the cache
+        await store.search_similar_tools(query, limit=1, score_threshold=0.5)
+        assert store.client.search.call_count == 2
+
+        await store.delete_tool_embeddings(["files.read_file"])
+        results = await store.search_similar_tools(query, score_threshold=0.5)
+        assert store.client.search.call_count == 3
+        assert "files.read_file" not in [result["tool_id"] for result in results]
+
+    @pytest.mark.asyncio
+    async def test_cached_results_are_not_shared(self, store, sample_tools):
+        """Test callers can't change cached results through returned ones."""
+        await store._ensure_collections()
+        await store.store_tool_embeddings(sample_tools)
+        query = normalize_embedding([0.9, 0.1] + [0.0] * 382)
+
+        first = await store.search_similar_tools(query, score_threshold=0.5)
+        first[0]["score"] = -1.0
+
+        second = await store.search_similar_tools(query, score_threshold=0.5)
+        assert second[0]["score"] > 0.5
+
+    @pytest.mark.asyncio
+    async def test_search_overlapping_write_is_not_cached(self, store, sample_tools):
+        """Test results of a search that raced a write aren't cached."""
+        await store._ensure_collections()
+        await store.store_tool_embeddings(sample_tools)
+        query = normalize_embedding([0.9, 0.1] + [0.0] * 382)
+        search = store.client.search
+
+        async def search_during_write(**kwargs):
+            results = await search(**kwargs)
+            await store.delete_tool_embeddings(["files.read_file"])
+            return results
+
+        store.client.search = AsyncMock(side_effect=search_during_write)
+        await store.search_similar_tools(query, score_threshold=0.5)
+        store.client.search = MagicMock(wraps=search)
+
+        results = await store.search_similar_tools(query, score_threshold=0.5)
+
+        store.client.search.assert_called_once()
+        assert "files.read_file" not in [result["tool_id"] for result in results]
+
+    @pytest.mark.asyncio
+    async def test_restoring_tools_does_not_duplicate(self, store, sample_tools):
+        """Test re-registering tools, e.g. after a restart, overwrites them."""
+        await store._ensure_collections()
+
+        await store.store_tool_embeddings(sample_tools)
+        await store.store_tool_embeddings([tool.model_copy() for tool in sample_tools])
+
+        count = await store.client.count(store.tools_collection)
+        assert count.count == len(sample_tools)
+
+    @pytest.mark.asyncio
+    async def test_update_tool_usage_batch(self, store, sample_tools):
+        """Test usage statistics for several tools are written together."""
+        await store._ensure_collections()
+        await store.store_tool_embeddings(sample_tools)
+
+        await store.update_tool_usage_batch(
+            {
+                "files.read_file": (3, "2024-01-01T00:00:00Z"),
+                "web.fetch_url": (1, "2024-01-02T00:00:00Z"),
+            }
+        )
+
+        points = await store.client.retrieve(
+            store.tools_collection,
+            ids=[store._get_tool_point_id(tool.id) for tool in sample_tools],
+        )
+        usage = {
+            point.payload["tool_id"]: point.payload["usage_count"] for point in points
+        }
+        assert usage == {"files.read_file": 3, "web.fetch_url": 1}
+
+    @pytest.mark.asyncio
+    async def test_delete_tool_embeddings(self, store, sample_tools):
+        """Test embeddings of unregistered tools are deleted."""
+        await store._ensure_collections()
+        await store.store_tool_embeddings(sample_tools)
+
+        await store.delete_tool_embeddings(["web.fetch_url"])
+
+        points = (await store.client.scroll(store.tools_collection))[0]
+        assert [point.payload["tool_id"] for point in points] == ["files.read_file"]
+
+    @pytest.mark.asyncio
+    async def test_get_collection_info(self, store, sample_tools):
+        """Test collection info is reported for both collections."""
+        await store._ensure_collections()
+        await store.store_tool_embeddings(sample_tools)
+
+        info = await store.get_collection_info()
+
+        assert info["tools"]["name"] == store.tools_collection
+        assert info["tools"]["points_count"] == 2
+        assert info["docs"]["points_count"] == 0
+
+        # Repeated calls within the TTL are served from the cache
+        store.client = MagicMock(wraps=store.client)
+        assert await store.get_collection_info() == info
+        store.client.get_collection.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_large_tool_catalog_uploaded_in_batches(self, store):
+        """Test tool embeddings are sent in bounded upsert requests."""
+        await store._ensure_collections()
+        tools = [
+            Tool(
+                id=f"files.tool_{i}",
+                name=f"tool_{i}",
+                server_name="files",
+                description="Test tool",
+                embedding=normalize_embedding([1.0, i] + [0.0] * 382),
+            )
+            for i in range(UPLOAD_BATCH_SIZE + 1)
+        ]
+        store.client.upsert = MagicMock(wraps=store.client.upsert)
+
+        await store.store_tool_embeddings(tools)
+
+        assert store.client.upsert.call_count == 2
+        count = await store.client.count(store.tools_collection)
+        assert count.count == UPLOAD_BATCH_SIZE + 1
+
+    @pytest.mark.asyncio
+    async def test_empty_search_diagnostics_are_rate_limited(
+        self, store, sample_tools, caplog
+    ):
+        """Test misses only trigger a diagnostic search at debug level."""
+        await store._ensure_collections()
+        await store.store_tool_embeddings(sample_tools)
+        store.client.search = MagicMock(wraps=store.client.search)
+        query = normalize_embedding([0.0, 0.0, 1.0] + [0.0] * 381)
+
+        # Not at debug level: a single search per miss
+        caplog.set_level(logging.INFO, logger=store.logger.logger.name)
+        assert await store.search_similar_tools(query, score_threshold=0.5) == []
+        assert store.client.search.call_count == 1
+
+        # At debug level: one background diagnostic search per interval
+        caplog.set_level(logging.DEBUG, logger=store.logger.logger.name)
+        await store.search_similar_tools(query, score_threshold=0.6)
+        await store.search_similar_tools(query, score_threshold=0.7)
+        await store._debug_search_task
+        assert store.client.search.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_search_documents_by_source(self, store):
+        """Test per-source document searches are sent as one batch."""
+        await store._ensure_collections()
+        embedding = normalize_embedding([1.0] + [0.0] * 383)
+        for source in ["files", "web", "git"]:
+            await store.store_document_chunks(
+                [{"text": f"{source} docs", "embedding": embedding}], source
+            )
+        store.client.search_batch = MagicMock(wraps=store.client.search_batch)
+
+        documents = await store.search_documents_by_source(
+            embedding, ["files", "web"], limit=2, score_threshold=0.5
+        )
+
+        assert sorted(doc["source"] for doc in documents) == ["files", "web"]
+        store.client.search_batch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_large_document_uploaded_in_batches(self, store):
+        """Test document chunks are sent in bounded upsert requests."""
+        await store._ensure_collections()
+        chunks = [
+            {
+                "text": f"chunk {i}",
+                "embedding": normalize_embedding([1.0, i] + [0.0] * 382),
+            }
+            for i in range(UPLOAD_BATCH_SIZE + 1)
+        ]
+        chunks.insert(1, {"text": "not embedded"})
+        store.client.upsert = MagicMock(wraps=store.client.upsert)
+
+        await store.store_document_chunks(chunks, "files")
+
+        assert store.client.upsert.call_count == 2
+        count = await store.client.count(store.docs_collection)
+        assert count.count == UPLOAD_BATCH_SIZE + 1
+
+    @pytest.mark.asyncio
+    async def test_upserts_in_flight_are_bounded(self, store):
+        """Test large uploads keep a bounded number of requests in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def upsert(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        store.client = AsyncMock()
+        store.client.upsert = upsert
+        chunks = [
+            {"text": f"chunk {i}", "embedding": [1.0, 0.0]}
+            for i in range(UPLOAD_BATCH_SIZE * (UPLOAD_CONCURRENCY + 2))
+        ]
+
+        await store.store_document_chunks(chunks, "files")
+
+        assert peak == UPLOAD_CONCURRENCY
+
+    @pytest.mark.asyncio
+    async def test_transient_upsert_failures_are_retried(self, store, sample_tools):
+        """Test a timed out upsert is retried instead of aborting the load."""
+        await store._ensure_collections()
+        upsert = store.client.upsert
+        failures = [ResponseHandlingException(TimeoutError())]
+
+        async def flaky_upsert(**kwargs):
+            if failures:
+                raise failures.pop()
+            return await upsert(**kwargs)
+
+        store.client.upsert = AsyncMock(side_effect=flaky_upsert)
+        with patch("meta_mcp.vector_store.qdrant_client.random.uniform") as delay:
+            delay.return_value = 0.0
+            await store.store_tool_embeddings(sample_tools)
+
+        assert store.client.upsert.call_count == 2
+        count = await store.client.count(store.tools_collection)
+        assert count.count == len(sample_tools)
+
+    @pytest.mark.asyncio
+    async def test_permanent_upsert_failures_are_not_retried(self, store, sample_tools):
+        """Test errors that won't resolve themselves are raised immediately."""
+        await store._ensure_collections()
+        store.client.upsert = AsyncMock(side_effect=ValueError("bad vector"))
+
+        with pytest.raises(ValueError):
+            await store.store_tool_embeddings(sample_tools)
+        store.client.upsert.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_reindexing_documents_does_not_duplicate(self, store):
+        """Test storing the same chunks twice overwrites them."""
+        await store._ensure_collections()
+        chunks = [
+            {
+                "text": f"chunk {i}",
+                "embedding": normalize_embedding([1.0, i] + [0.0] * 382),
+            }
+            for i in range(3)
+        ]
+
+        await store.store_document_chunks(chunks, "files")
+        await store.store_document_chunks(chunks, "files")
+
+        assert (await store.client.count(store.docs_collection)).count == 3
+
+    @pytest.mark.asyncio
+    async def test_reindexing_removes_stale_chunks(self, store):
+        """Test chunks no longer in a re-indexed document are deleted."""
+        await store._ensure_collections()
+        embedding = normalize_embedding([1.0] + [0.0] * 383)
+        await store.store_document_chunks(
+            [{"text": f"chunk {i}", "embedding": embedding} for i in range(3)],
+            "files",
+        )
+        await store.store_document_chunks(
+            [{"text": "other docs", "embedding": embedding}], "web"
+        )
+
+        await store.store_document_chunks(
+            [
+                {"text": "chunk 0", "embedding": embedding},
+                {"text": "chunk 1 (edited)", "embedding": embedding},
+            ],
+            "files",
+        )
+
+        points = (await store.client.scroll(store.docs_collection))[0]
+        assert sorted(point.payload["text"] for point in points) == [
+            "chunk 0",
+            "chunk 1 (edited)",
+            "other docs",
+        ]
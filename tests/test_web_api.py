@@ -1,7 +1,9 @@
 """Tests for Gradio web interface."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
+import gradio as gr
 import pytest
 
 from meta_mcp.config.models import MetaMCPConfig, Tool
@@ -143,9 +145,10 @@ class TestGradioWebInterface:
         assert "status" in result
         assert result["status"] == "success"
 
-    def test_load_available_tools(self, web_interface):
+    @pytest.mark.asyncio
+    async def test_load_available_tools(self, web_interface):
         """Test loading available tools."""
-        tools_data = web_interface._load_available_tools()
+        tools_data = await web_interface._load_available_tools()
 
         assert isinstance(tools_data, list)
         assert len(tools_data) > 0
@@ -203,18 +206,20 @@ strategy:
         assert "<div" in status_html
         assert "Server" in status_html
 
-    def test_status_refresh(self, web_interface):
+    @pytest.mark.asyncio
+    async def test_status_refresh(self, web_interface):
         """Test status refresh functionality."""
-        status_html, metrics, child_data, health = web_interface._refresh_status()
+        status_html, metrics, child_data, health = await web_interface._refresh_status()
 
         assert isinstance(status_html, str)
         assert isinstance(metrics, dict)
         assert isinstance(child_data, list)
         assert isinstance(health, dict)
 
-    def test_child_server_restart(self, web_interface):
+    @pytest.mark.asyncio
+    async def test_child_server_restart(self, web_interface):
         """Test child server restart functionality."""
-        child_data = web_interface._restart_child_server("test_server")
+        child_data = await web_interface._restart_child_server("test_server")
 
         assert isinstance(child_data, list)
         # Should call restart_server on the mock
@@ -222,7 +227,8 @@ strategy:
             "test_server"
         )
 
-    def test_health_check_execution(self, web_interface):
+    @pytest.mark.asyncio
+    async def test_health_check_execution(self, web_interface):
         """Test health check execution."""
         # Mock the health checker import to avoid dependency issues
         with pytest.MonkeyPatch().context():
@@ -231,7 +237,7 @@ strategy:
                 return_value={"status": "success"}
             )
 
-            result = web_interface._run_health_check()
+            result = await web_interface._run_health_check()
             assert isinstance(result, dict)
 
     def test_log_reading(self, web_interface, tmp_path):
@@ -249,6 +255,61 @@ strategy:
         assert isinstance(logs, str)
         assert "Test log entry" in logs
 
+    def test_log_reading_returns_tail_of_large_file(self, web_interface, tmp_path):
+        """Test only the last lines of a log larger than one read are shown."""
+        log_file = tmp_path / "large.log"
+        log_file.write_text("".join(f"INFO: entry {i}\n" for i in range(20000)))
+        web_interface.server_config.logging.file = str(log_file)
+
+        lines = web_interface._get_recent_logs("ALL").splitlines()
+
+        assert len(lines) == 100
+        assert lines[0] == "INFO: entry 19900"
+        assert lines[-1] == "INFO: entry 19999"
+
+    def test_log_polling_skips_unchanged_logs(self, web_interface, tmp_path):
+        """Test auto-refresh only resends logs after the log file changes."""
+        log_file = tmp_path / "poll.log"
+        log_file.write_text("INFO: first\n")
+        web_interface.server_config.logging.file = str(log_file)
+
+        logs, version = web_interface._poll_logs("INFO", True, None)
+        assert "first" in logs
+
+        update, same_version = web_interface._poll_logs("INFO", True, version)
+        assert update == gr.update()
+        assert same_version == version
+
+        log_file.write_text("INFO: first\nINFO: second\n")
+        logs, _ = web_interface._poll_logs("INFO", True, version)
+        assert "second" in logs
+
+        update, _ = web_interface._poll_logs("INFO", False, None)
+        assert update == gr.update()
+
+    @pytest.mark.asyncio
+    async def test_status_polling_shared_between_dashboards(
+        self, web_interface, mock_server_instance
+    ):
+        """Test timer refreshes within one interval reuse the same status."""
+        first = await web_interface._poll_status()
+        second = await web_interface._poll_status()
+
+        assert second is first
+        mock_server_instance.get_metrics.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_status_polls_share_one_refresh(
+        self, web_interface, mock_server_instance
+    ):
+        """Test dashboards polling at the same time wait on one refresh."""
+        first, second = await asyncio.gather(
+            web_interface._poll_status(), web_interface._poll_status()
+        )
+
+        assert second is first
+        mock_server_instance.get_metrics.assert_awaited_once()
+
     def test_config_backup_restore(self, web_interface):
         """Test configuration backup and restore functionality."""
         # Create backup
@@ -281,6 +342,27 @@ strategy:
         # Test shutdown
         await web_interface.shutdown()
 
+    @pytest.mark.asyncio
+    async def test_handlers_call_server_on_its_loop(
+        self, web_interface, mock_server_instance
+    ):
+        """Test handlers run on Gradio's loop hand server calls to the server's."""
+        web_interface.app.launch = MagicMock()
+        await web_interface.start()
+        server_loop = asyncio.get_running_loop()
+        loops = []
+
+        async def list_tools():
+            loops.append(asyncio.get_running_loop())
+            return []
+
+        mock_server_instance.list_tools.side_effect = list_tools
+
+        # Gradio runs handlers on a loop in its own thread
+        await asyncio.to_thread(asyncio.run, web_interface._load_available_tools())
+
+        assert loops == [server_loop]
+
     def test_set_config_path(self, web_interface):
         """Test setting configuration file path."""
         test_path = "/path/to/config.yaml"
@@ -0,0 +1,200 @@
+"""Tests for the FastAPI web interface."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import WebSocketDisconnect
+from fastapi.testclient import TestClient
+
+from meta_mcp.config.models import ChildServerConfig, MetaMCPConfig
+from meta_mcp.web_ui.app import WebInterface
+
+
+class TestWebInterface:
+    """Test FastAPI web interface endpoints."""
+
+    @pytest.fixture
+    def server(self):
+        """Mock server instance."""
+        server = MagicMock()
+        server.get_status.return_value = {"running": True}
+        server.child_manager.get_server_status = AsyncMock(return_value={})
+        server.child_manager.restart_server = AsyncMock(return_value=True)
+        server.routing_engine.routers = {}
+        return server
+
+    @pytest.fixture
+    def interface(self, server):
+        """Create the web interface."""
+        return WebInterface(MetaMCPConfig(), server)
+
+    @pytest.fixture
+    def client(self, interface):
+        """Create a test client for the web interface."""
+        return TestClient(interface.app)
+
+    def test_probes(self, client, server):
+        """Test the liveness and health probes."""
+        server._running = True
+
+        assert client.get("/livez").json() == {"status": "alive"}
+        assert client.get("/health").json() == {
+            "status": "healthy",
+            "server_running": True,
+        }
+
+        server._running = False
+        assert client.get("/health").json()["server_running"] is False
+
+    def test_polled_status_is_cached(self, client, server):
+        """Test repeated status polls reuse one response until a restart."""
+        assert client.get("/api/status").json()["running"] is True
+        client.get("/api/status")
+        server.get_status.assert_called_once()
+
+        client.post("/api/servers/files/restart")
+        client.get("/api/status")
+        assert server.get_status.call_count == 2
+
+    def test_status_before_components_initialized(self, client, server):
+        """Test components the server hasn't created yet are skipped."""
+        server.child_manager = None
+        server.routing_engine = None
+
+        response = client.get("/api/status")
+
+        assert response.status_code == 200
+        assert response.json() == {"running": True}
+
+    def test_config_hides_secrets(self, interface, client):
+        """Test child server env values and the LLM API key are redacted."""
+        interface.server_config.llm.api_key = "secret"
+        interface.server_config.child_servers = [
+            ChildServerConfig(name="files", command=["files"], env={"TOKEN": "x"})
+        ]
+
+        config = client.get("/api/config").json()
+
+        assert config["llm"]["api_key"] == "***"
+        assert config["child_servers"][0]["name"] == "files"
+        assert config["child_servers"][0]["env"] == {"TOKEN": "***"}
+
+    def test_config_dump_reused_until_reloaded(self, interface):
+        """Test the config is dumped again only when a section is replaced."""
+        dump = interface._config_snapshot()
+        assert interface._config_snapshot() is dump
+
+        interface.server_config.child_servers = []
+        assert interface._config_snapshot() is not dump
+
+    def test_strategies_served_as_json(self, client):
+        """Test cached responses are still served as JSON."""
+        response = client.get("/api/strategies")
+
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["current"] == "vector"
+        assert client.get("/api/strategies").content == response.content
+
+    def test_unchanged_response_revalidated_by_etag(self, client):
+        """Test pollers get an empty 304 while a response is unchanged."""
+        etag = client.get("/api/strategies").headers["etag"]
+
+        response = client.get("/api/strategies", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_batches_and_drops_disconnected_clients(self, interface):
+        """Test queued log entries are sent together and dead clients dropped."""
+        live = AsyncMock()
+        gone = AsyncMock()
+        gone.send_text.side_effect = RuntimeError("disconnected")
+        stalled = AsyncMock()
+
+        async def stall(message):
+            await asyncio.sleep(10)
+
+        stalled.send_text.side_effect = stall
+        interface.config.ws_send_timeout = 0.01
+        interface.active_connections.update({live, gone, stalled})
+
+        interface.broadcast_log({"message": "first"})
+        interface.broadcast_log({"message": "second"})
+        await interface.start()
+
+        async def dropped():
+            while interface.active_connections != {live}:
+                await asyncio.sleep(0)
+
+        await asyncio.wait_for(dropped(), timeout=1)
+        await interface.shutdown()
+
+        live.send_text.assert_awaited_once_with(
+            json.dumps([{"message": "first"}, {"message": "second"}])
+        )
+
+    @pytest.mark.asyncio
+    async def test_shutdown_not_held_up_by_stalled_clients(self, interface):
+        """Test connections are closed together with a bounded wait."""
+        live = AsyncMock()
+        stalled = AsyncMock()
+
+        async def stall():
+            await asyncio.sleep(10)
+
+        stalled.close.side_effect = stall
+        interface.config.ws_send_timeout = 0.01
+        interface.active_connections.update({live, stalled})
+
+        await asyncio.wait_for(interface.shutdown(), timeout=1)
+
+        live.close.assert_awaited_once()
+        assert not interface.active_connections
+
+    def test_log_socket_unregistered_on_disconnect(self, interface, client):
+        """Test log clients are dropped once they disconnect."""
+        with client.websocket_connect("/ws/logs") as websocket:
+            websocket.send_text("ping")
+
+        assert not interface.active_connections
+
+    def test_log_socket_connections_are_capped(self, interface, client):
+        """Test clients over the connection limit are told to retry later."""
+        interface.config.max_ws_connections = 0
+
+        with (
+            pytest.raises(WebSocketDisconnect) as disconnect,
+            client.websocket_connect("/ws/logs") as websocket,
+        ):
+            websocket.receive_text()
+
+        assert disconnect.value.code == 1013
+        assert not interface.active_connections
+
+    def test_dashboard_revalidated_by_etag(self, client):
+        """Test a cached dashboard is revalidated without resending it."""
+        response = client.get("/dashboard")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert "Meta MCP Server Dashboard" in response.text
+        etag = response.headers["etag"]
+
+        response = client.get("/dashboard", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_dashboard_served_compressed(self, client):
+        """Test the dashboard is gzipped for clients that accept it."""
+        compressed = client.get("/dashboard", headers={"Accept-Encoding": "gzip"})
+        plain = client.get("/dashboard", headers={"Accept-Encoding": "identity"})
+
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert "content-encoding" not in plain.headers
+        assert compressed.text == plain.text
+        assert compressed.headers["etag"] != plain.headers["etag"]